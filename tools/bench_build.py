@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# tools/bench_build.py
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fnmatch
+import gzip
+import io
+import json
+import math
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from build import DEFAULT_STATE, ROOT, Stage, all_stages, load_state, run_graph
+from dossier_config import DEFAULT_CONFIG, Dossier, load_dossiers
+
+
+DEFAULT_BUDGETS = Path("dossier/bench_budgets.json")
+DEFAULT_HISTORY = Path("dossier/.cache/bench_history.jsonl")
+
+# What a reader (or a model with a context window) actually fetches. Section pages are
+# added per dossier from toc.json as "page:<url>", plus their sum as "pages".
+ARTIFACTS = [
+    "index.html",
+    "toc.json",
+    "claims.json",
+    "claims.min.json",
+    "timeline/index.json",
+    "source.html",
+    "chunks.jsonl",
+]
+
+# Same rough rule as build_chunks: ~4 characters per token.
+CHARS_PER_TOKEN = 4
+
+DEFAULT_TOLERANCE = {
+    "size": 0.10,  # allowed growth over the baseline, as a fraction
+    "time": 0.50,
+    "time_floor": 0.25,  # seconds; slower by less than this is timer noise, not a regression
+}
+
+
+def measure_file(path: Path) -> dict[str, int]:
+    data = path.read_bytes()
+    chars = len(data.decode("utf-8", errors="replace"))
+    return {
+        "bytes": len(data),
+        "gzip": len(gzip.compress(data, compresslevel=9, mtime=0)),
+        "tokens": math.ceil(chars / CHARS_PER_TOKEN),
+    }
+
+
+def measure_site(d: Dossier) -> dict[str, dict[str, int]]:
+    site = ROOT / d.site
+    out: dict[str, dict[str, int]] = {}
+    for name in ARTIFACTS:
+        if (site / name).is_file():
+            out[f"{d.name}:{name}"] = measure_file(site / name)
+
+    toc = site / "toc.json"
+    urls = [e.get("url", "") for e in json.loads(toc.read_text(encoding="utf-8"))] if toc.is_file() else []
+    pages: list[dict[str, int]] = []
+    for url in urls:
+        if url and (site / url).is_file():
+            m = out[f"{d.name}:page:{url}"] = measure_file(site / url)
+            pages.append(m)
+    if pages:
+        out[f"{d.name}:pages"] = {k: sum(m[k] for m in pages) for k in ("bytes", "gzip", "tokens")}
+    return out
+
+
+def _touched(dossiers: list[Dossier], stages: list[Stage]) -> list[Path]:
+    """
+    Every file a build may write: the stages' outputs and anything under the site dirs
+    (fingerprinted copies are not listed as outputs).
+    """
+    files = {p for st in stages for o in st.outputs for p in ROOT.glob(o) if p.is_file()}
+    for d in dossiers:
+        files.update(p for p in (ROOT / d.site).rglob("*") if p.is_file())
+    return sorted(files)
+
+
+def time_builds(dossiers: list[Dossier], runs: int, state_path: Path) -> dict[str, float]:
+    """
+    Forced full builds; best seconds per stage over `runs`, plus "build" for the whole graph.
+
+    The tree is put back as the last real build left it afterwards. Some outputs depend on
+    the previous build (chunks.delta.json diffs against the chunks.jsonl on disk), so a
+    forced rerun would otherwise overwrite them with "nothing changed".
+    """
+    stages = all_stages(dossiers)
+    before = {p: p.read_bytes() for p in _touched(dossiers, stages) if p.is_file()}
+    state_bytes = state_path.read_bytes() if state_path.is_file() else None
+    best: dict[str, float] = {}
+    try:
+        for _ in range(max(runs, 1)):
+            state = load_state(state_path)
+            log = io.StringIO()
+            started = time.monotonic()
+            with contextlib.redirect_stdout(log):
+                results = run_graph(ROOT, stages, state, force=True)
+            wall = time.monotonic() - started
+            if any(r["status"] == "failed" for r in results.values()):
+                sys.stdout.write(log.getvalue())
+                raise SystemExit("Build failed; nothing benchmarked.")
+            for name, r in results.items():
+                best[name] = min(best.get(name, math.inf), r["seconds"])
+            best["build"] = min(best.get("build", math.inf), wall)
+    finally:
+        for p in _touched(dossiers, stages):
+            if p not in before:
+                p.unlink()
+        for p, data in before.items():
+            if not p.is_file() or p.read_bytes() != data:
+                p.parent.mkdir(parents=True, exist_ok=True)
+                p.write_bytes(data)
+        if state_bytes is not None:
+            state_path.write_bytes(state_bytes)
+    return {k: round(v, 4) for k, v in best.items()}
+
+
+def load_budgets(path: Path) -> dict:
+    if not path.exists():
+        return {"tolerance": dict(DEFAULT_TOLERANCE), "artifacts": {}, "stages": {}}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        "tolerance": {**DEFAULT_TOLERANCE, **data.get("tolerance", {})},
+        "artifacts": data.get("artifacts", {}),
+        "stages": data.get("stages", {}),
+    }
+
+
+def _budget_for(name: str, table: dict) -> dict | float | None:
+    """
+    Budgets are keyed by glob over either the qualified name ("main:claims.json") or the
+    bare one ("claims.json", "page:*"), like build.py stage selection. First match wins.
+    """
+    bare = name.split(":", 1)[1] if ":" in name else name
+    for pattern, budget in table.items():
+        if fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(bare, pattern):
+            return budget
+    return None
+
+
+def read_history(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    entries: list[dict] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue  # a torn last line from an interrupted run
+    return entries
+
+
+def baseline_of(history: list[dict]) -> dict | None:
+    """
+    The previous run. Growth is reported against it, not gated, so one intended content
+    change shows up once instead of pinning every later run to a stale baseline.
+    """
+    return history[-1] if history else None
+
+
+def compare(
+    entry: dict, baseline: dict | None, budgets: dict
+) -> tuple[list[list[str]], list[str], list[str], list[str]]:
+    """
+    (report rows, artifact budget overruns, stage time budget overruns, growth against the
+    baseline beyond the tolerance).
+    """
+    tol = budgets["tolerance"]
+    rows: list[list[str]] = []
+    over: list[str] = []
+    slow: list[str] = []
+    regressed: list[str] = []
+    base_art = (baseline or {}).get("artifacts", {})
+    base_st = (baseline or {}).get("stages", {})
+
+    for name, m in entry["artifacts"].items():
+        budget = _budget_for(name, budgets["artifacts"]) or {}
+        prev = base_art.get(name)
+        flags: list[str] = []
+        for metric in ("bytes", "gzip", "tokens"):
+            limit = budget.get(metric)
+            if limit is not None and m[metric] > limit:
+                flags.append(f"{metric} over budget")
+                over.append(f"{name}: {metric} {m[metric]:,} > budget {limit:,}")
+            if prev and prev.get(metric) and m[metric] > prev[metric] * (1 + tol["size"]):
+                growth = m[metric] / prev[metric] - 1
+                flags.append(f"{metric} +{growth:.0%}")
+                regressed.append(
+                    f"{name}: {metric} {prev[metric]:,} -> {m[metric]:,} (+{growth:.1%}, allowed +{tol['size']:.0%})"
+                )
+        delta = f"{m['bytes'] - prev['bytes']:+,}" if prev else "new"
+        rows.append([name, f"{m['bytes']:,}", f"{m['gzip']:,}", f"{m['tokens']:,}", delta, ", ".join(flags) or "ok"])
+
+    for name, secs in entry.get("stages", {}).items():
+        limit = _budget_for(name, budgets["stages"])
+        prev = base_st.get(name)
+        flags = []
+        if limit is not None and secs > limit:
+            flags.append("over budget")
+            slow.append(f"{name}: {secs:.2f}s > budget {limit:.2f}s")
+        if prev is not None and secs > prev * (1 + tol["time"]) and secs - prev > tol["time_floor"]:
+            flags.append(f"+{secs - prev:.2f}s")
+            regressed.append(f"{name}: {prev:.2f}s -> {secs:.2f}s (allowed +{tol['time']:.0%} over {tol['time_floor']}s)")
+        delta = f"{secs - prev:+.2f}s" if prev is not None else "new"
+        rows.append([name, f"{secs:.3f}s", "", "", delta, ", ".join(flags) or "ok"])
+
+    return rows, over, slow, regressed
+
+
+def _git_head() -> str:
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        return proc.stdout.strip()
+    except OSError:
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark build time and artifact size against budgets and the previous run.")
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG, help=f"Dossier list (default: {DEFAULT_CONFIG})")
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS, help=f"Budgets file (default: {DEFAULT_BUDGETS})")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help=f"Append-only history (default: {DEFAULT_HISTORY})")
+    parser.add_argument("--state", type=Path, default=DEFAULT_STATE, help=f"Build state file (default: {DEFAULT_STATE})")
+    parser.add_argument("--runs", type=int, default=3, help="Forced builds to time; best per stage is kept (default: 3)")
+    parser.add_argument("--no-build", action="store_true", help="Only measure the artifacts already on disk.")
+    parser.add_argument("--no-record", action="store_true", help="Compare without appending to the history.")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero when an artifact is over its budget in the budgets file.")
+    parser.add_argument("--strict", action="store_true", help="With --check, also fail on stage time budgets and growth over the previous run (local use; timings are noisy on shared runners).")
+    args = parser.parse_args()
+
+    dossiers = load_dossiers(ROOT, args.config)
+    history_path = args.history if args.history.is_absolute() else ROOT / args.history
+    state_path = args.state if args.state.is_absolute() else ROOT / args.state
+    budgets = load_budgets(args.budgets if args.budgets.is_absolute() else ROOT / args.budgets)
+
+    stages = {} if args.no_build else time_builds(dossiers, args.runs, state_path)
+    artifacts: dict[str, dict[str, int]] = {}
+    for d in dossiers:
+        artifacts.update(measure_site(d))
+
+    entry = {
+        "at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "commit": _git_head(),
+        "runs": 0 if args.no_build else args.runs,
+        "stages": stages,
+        "artifacts": artifacts,
+    }
+    baseline = baseline_of(read_history(history_path))
+    rows, over, slow, regressed = compare(entry, baseline, budgets)
+    failures = over + (slow + regressed if args.strict else [])
+    entry["ok"] = not failures
+    entry["failures"] = over + slow + regressed
+
+    header = ["name", "size/time", "gzip", "tokens", "vs base", "status"]
+    widths = [max(len(r[i]) for r in rows + [header]) for i in range(len(header))]
+    for r in [header] + rows:
+        print("  ".join(c.ljust(w) if i in (0, 5) else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths))).rstrip())
+
+    base = f"{baseline['commit'][:10]} ({baseline['at']})" if baseline else "none"
+    print(f"Baseline: {base}", file=sys.stderr)
+    for label, found in (("over budget", over), ("over time budget", slow), ("grown vs baseline", regressed)):
+        if found:
+            gated = found is over or args.strict
+            print(f"{len(found)} {label}{'' if gated else ' (report only)'}:", file=sys.stderr)
+            for f in found:
+                print(f"  {f}", file=sys.stderr)
+
+    if not args.no_record:
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with history_path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n")
+
+    if args.check and failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# tools/bench_model.py
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+from dossier_model import Claim, dumps_claims, dumps_claims_min
+
+
+SECTIONS = 40
+TAG_POOL = [f"tag-{i}" for i in range(300)]
+
+
+def synthetic_claims(n: int, seed: int = 0) -> list[dict]:
+    """
+    claims.json-shaped dicts. Section and tag strings are built per record (as a JSON
+    parse or the extractor would), so equal strings are distinct objects until interned.
+    """
+    rnd = random.Random(seed)
+    out: list[dict] = []
+    for i in range(n):
+        s = i % SECTIONS
+        dated = i % 4 == 0
+        links = [f"https://example.org/{s}/{rnd.randrange(10_000)}" for _ in range(rnd.randint(1, 3))]
+        out.append(
+            {
+                "id": f"C-{s:02d}-section-{s}-{i:06d}",
+                "text": " ".join(rnd.choice(["agency", "court", "ruling", "filed", "report", "index"]) for _ in range(24)),
+                "evidence": "\n".join(f"- {u}" for u in links),
+                "evidence_count": len(links),
+                "links": links,
+                "section_id": "".join(["section-", str(s)]),
+                "section_label": "".join([str(s), ". Section title ", str(s)]),
+                "url": "".join(["section-", str(s), ".html"]),
+                "line": i,
+                "date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}" if dated else "",
+                "date_raw": "",
+                "title": f"Event {i}" if dated else "",
+                "tags": ["".join(["tag-", str(rnd.randrange(len(TAG_POOL)))]) for _ in range(3)],
+                "note": "",
+                "source_ids": [],
+            }
+        )
+    return out
+
+
+def min_dict(c: dict) -> dict:
+    # the dict-based claims.min.json row, as build_claims built it before the model
+    return {
+        "id": c["id"],
+        "u": c["url"],
+        "t": " ".join(c["text"].split()),
+        "ec": c["evidence_count"],
+        "d": c["date"],
+        "ti": c["title"],
+        "tg": c["tags"],
+    }
+
+
+def measure_memory(build: Callable[[], object]) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, obj
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare dict records with the __slots__ dossier model.")
+    parser.add_argument("--claims", type=int, default=100_000, help="Synthetic ledger size (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats; best is reported (default: 3)")
+    args = parser.parse_args()
+
+    raw = json.dumps(synthetic_claims(args.claims))
+
+    dict_bytes, dicts = measure_memory(lambda: json.loads(raw))
+    model_bytes, models = measure_memory(lambda: [Claim.from_json(c) for c in json.loads(raw)])
+
+    # same bytes either way
+    assert dumps_claims_min(models) == json.dumps(
+        [min_dict(c) for c in dicts], ensure_ascii=False, separators=(",", ":")
+    )
+    assert dumps_claims(models) == json.dumps([c.to_json() for c in models], ensure_ascii=False, indent=2)
+
+    t_dict_min = best_of(
+        lambda: json.dumps([min_dict(c) for c in dicts], ensure_ascii=False, separators=(",", ":")), args.repeat
+    )
+    t_model_min = best_of(lambda: dumps_claims_min(models), args.repeat)
+    t_dict_full = best_of(lambda: json.dumps(dicts, ensure_ascii=False, indent=2), args.repeat)
+    t_model_full = best_of(lambda: dumps_claims(models), args.repeat)
+
+    def row(label: str, before: float, after: float, unit: str) -> str:
+        return f"{label:<28} {before:>12.2f} {after:>12.2f} {unit:<4} {before / after:>6.2f}x"
+
+    mb = 1024 * 1024
+    print(f"{args.claims} claims")
+    print(f"{'':<28} {'dicts':>12} {'model':>12}")
+    print(row("resident ledger", dict_bytes / mb, model_bytes / mb, "MiB"))
+    print(row("claims.min.json dump", t_dict_min * 1000, t_model_min * 1000, "ms"))
+    print(row("claims.json dump", t_dict_full * 1000, t_model_full * 1000, "ms"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# tools/bench_parsers.py
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import build_claims
+import build_source
+import build_source_html
+import split_dossier
+
+
+# -----------------------------
+# Adversarial corpus
+# -----------------------------
+# Each generator returns a document of roughly n characters. They target the shapes that
+# make backtracking regexes or line-lookback loops go quadratic: long whitespace runs
+# inside otherwise-matching lines, huge single lines, and long runs of lines that keep a
+# parser in one state.
+
+
+def long_line(n: int) -> str:
+    return "word " * (n // 5) + "\n"
+
+
+def ws_run_plain(n: int) -> str:
+    return "a" + " " * n + "b\n"
+
+
+def ws_run_claim_line(n: int) -> str:
+    return "CLAIM: a" + " " * n + "b\n"
+
+
+def ws_run_c_suffix(n: int) -> str:
+    return "claim" + " " * n + "x [C]y\n"
+
+
+def ws_run_heading(n: int) -> str:
+    return "1. Title" + " " * n + "end\n# Title" + " " * n + "end\n"
+
+
+def ws_run_c_marker(n: int) -> str:
+    return "text" + " \t" * (n // 2) + "[c\n"
+
+
+def ws_run_evidence(n: int) -> str:
+    return "Evidence" + " " * (n // 2) + ":" + " " * (n // 2) + "x\n"
+
+
+def ws_run_front_matter(n: int) -> str:
+    return f"---\ntitle: a{' ' * (n // 2)}b\nkeywords:\n  - a{' ' * (n // 2)}b\n---\nbody\n"
+
+
+def c_lines_no_blank(n: int) -> str:
+    return "A claim sentence. [C]\nDATE: 2025-11-26\n- https://example.org/x\n" * (n // 60)
+
+
+def nested_lists(n: int) -> str:
+    return "".join("  " * (i % 64) + f"- item {i}\n" for i in range(n // 70))
+
+
+def divider_runs(n: int) -> str:
+    return "⸻\n---\n1. Heading\n" * (n // 20)
+
+
+def blank_runs_before_headings(n: int) -> str:
+    return "1. First\n" + ("\n" * 500 + "<!-- note -->\n2. Not promoted\n") * (n // 530)
+
+
+def numbered_list(n: int) -> str:
+    return "".join(f"{i}. list item that looks like a heading\n" for i in range(n // 40))
+
+
+CORPUS: dict[str, Callable[[int], str]] = {
+    "long_line": long_line,
+    "ws_run_plain": ws_run_plain,
+    "ws_run_claim_line": ws_run_claim_line,
+    "ws_run_c_suffix": ws_run_c_suffix,
+    "ws_run_heading": ws_run_heading,
+    "ws_run_c_marker": ws_run_c_marker,
+    "ws_run_evidence": ws_run_evidence,
+    "ws_run_front_matter": ws_run_front_matter,
+    "c_lines_no_blank": c_lines_no_blank,
+    "nested_lists": nested_lists,
+    "divider_runs": divider_runs,
+    "blank_runs_before_headings": blank_runs_before_headings,
+    "numbered_list": numbered_list,
+}
+
+
+# Differential cases: (document, strip_claims output of the original backtracking regexes).
+# The linear rewrites must give the same output, including on lines that carry a claim
+# marker and nothing but whitespace.
+EDGE_CASES: list[tuple[str, str]] = [
+    ("Intro\nCLAIM: \nMore\n", "Intro\nMore\n"),
+    ("Intro\nCLAIM:\nMore\n", "Intro\nCLAIM:\nMore\n"),
+    ("Intro\n- claim :\t\nMore\n", "Intro\nMore\n"),
+    ("Intro\n[claim] \nMore\n", "Intro\n"),
+    ("Intro\n[claim]\ntext\n[/claim]\nMore\n", "Intro\nMore\n"),
+    ("Intro\nCLAIM: text\nEvidence:\n- https://a.b/c\n\nMore\n", "Intro\n\nMore\n"),
+    ("Text [C] more\n", "Text more\n"),
+]
+
+
+# -----------------------------
+# Parsers under test
+# -----------------------------
+def _build_claims_main(text: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "source.md"
+        src.write_text(text, encoding="utf-8")
+        (Path(tmp) / "parts").mkdir()
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_claims.main(str(src), str(Path(tmp) / "site"))
+
+
+TARGETS: dict[str, Callable[[str], object]] = {
+    "split_dossier.strip_claims": split_dossier.strip_claims,
+    "build_source_html.strip_claims": build_source_html.strip_claims,
+    "split_dossier.detect_headings": lambda text: split_dossier.detect_headings(text.splitlines()),
+    "split_dossier.parse_front_matter": split_dossier.parse_front_matter,
+    "build_claims.parse_front_matter": build_claims.parse_front_matter,
+    "build_source.parse_front_matter": build_source.parse_front_matter,
+    "build_claims.main": _build_claims_main,
+}
+
+
+def differential() -> list[str]:
+    """
+    EDGE_CASES the strip_claims targets get wrong, as printable lines.
+    """
+    bad: list[str] = []
+    for target in ("split_dossier.strip_claims", "build_source_html.strip_claims"):
+        for text, want in EDGE_CASES:
+            got = TARGETS[target](text)
+            if got != want:
+                bad.append(f"{target}({text!r}) = {got!r}, want {want!r}")
+    return bad
+
+
+def best_time(fn: Callable[[str], object], text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def scaling(
+    size: int,
+    factor: int,
+    repeat: int,
+    slack: float,
+    floor: float,
+    budget: float,
+    only: list[str],
+) -> list[dict]:
+    """
+    Time every target on every corpus document at size and size * factor.
+    A pair is flagged when time grows by more than factor * slack; pairs whose larger
+    run stays under floor seconds are too fast to judge and always pass. If the small
+    run alone exceeds budget seconds the pair is flagged without running the large one,
+    so a quadratic regression fails fast instead of stalling the run.
+    """
+    rows: list[dict] = []
+    for case, gen in CORPUS.items():
+        if only and case not in only:
+            continue
+        small, large = gen(size), gen(size * factor)
+        for target, fn in TARGETS.items():
+            t_small = best_time(fn, small, 1)
+            if t_small > budget:
+                rows.append(
+                    {
+                        "case": case,
+                        "target": target,
+                        "small_ms": t_small * 1000,
+                        "large_ms": float("nan"),
+                        "growth": float("nan"),
+                        "ok": False,
+                    }
+                )
+                continue
+            t_small = min(t_small, best_time(fn, small, repeat - 1)) if repeat > 1 else t_small
+            t_large = best_time(fn, large, repeat)
+            growth = t_large / max(t_small, 1e-6)
+            rows.append(
+                {
+                    "case": case,
+                    "target": target,
+                    "small_ms": t_small * 1000,
+                    "large_ms": t_large * 1000,
+                    "growth": growth,
+                    "ok": t_large < floor or growth <= factor * slack,
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worst-case scaling benchmarks for the dossier parsers.")
+    parser.add_argument("--size", type=int, default=100_000, help="Base document size in characters (default: 100000)")
+    parser.add_argument("--factor", type=int, default=4, help="Size multiplier for the large run (default: 4)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats; best is used (default: 3)")
+    parser.add_argument("--slack", type=float, default=2.0, help="Allowed growth over linear (default: 2.0)")
+    parser.add_argument("--floor", type=float, default=0.05, help="Ignore pairs faster than this many seconds (default: 0.05)")
+    parser.add_argument("--budget", type=float, default=2.0, help="Max seconds for one small run (default: 2)")
+    parser.add_argument("--case", action="append", default=[], help="Only run this corpus case (repeatable)")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if any parser scales worse than linear or fails a differential case.")
+    parser.add_argument("--write-corpus", type=Path, help="Write the corpus documents at --size to this dir and exit.")
+    args = parser.parse_args()
+
+    if args.write_corpus:
+        args.write_corpus.mkdir(parents=True, exist_ok=True)
+        for case, gen in CORPUS.items():
+            (args.write_corpus / f"{case}.md").write_text(gen(args.size), encoding="utf-8")
+        print(f"Wrote {len(CORPUS)} document(s) to {args.write_corpus}")
+        return
+
+    mismatched = differential()
+    for line in mismatched:
+        print(f"MISMATCH {line}", file=sys.stderr)
+
+    rows = scaling(args.size, args.factor, args.repeat, args.slack, args.floor, args.budget, args.case)
+
+    print(f"{'case':<28} {'target':<34} {'small ms':>10} {'large ms':>10} {'growth':>8}")
+    for r in rows:
+        flag = "" if r["ok"] else "  OVER BUDGET" if r["large_ms"] != r["large_ms"] else "  SUPERLINEAR"
+        print(
+            f"{r['case']:<28} {r['target']:<34} {r['small_ms']:>10.1f} {r['large_ms']:>10.1f} "
+            f"{r['growth']:>7.1f}x{flag}"
+        )
+
+    bad = [r for r in rows if not r["ok"]]
+    print(
+        f"{len(rows)} pair(s) at {args.size} -> {args.size * args.factor} chars; {len(bad)} superlinear.",
+        file=sys.stderr,
+    )
+    if args.check and (bad or mismatched):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+# tools/build.py
+from __future__ import annotations
+
+import argparse
+import ast
+import contextlib
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import runpy
+import shlex
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dossier_config import DEFAULT_CONFIG, Dossier, load_dossiers
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_STATE = Path("dossier/.cache/build_state.json")
+
+
+@dataclass
+class Stage:
+    """
+    One build step. inputs/outputs are glob patterns relative to the repo root.
+    A stage depends on every stage whose outputs match one of its inputs.
+    stamp is an optional command whose output is folded into the input fingerprint, for
+    inputs that are not files (the git HEAD).
+    """
+
+    name: str
+    cmd: list[str]
+    inputs: list[str]
+    outputs: list[str]
+    stamp: list[str] = field(default_factory=list)
+
+
+_IMPORTS: dict[str, set[str]] = {}
+
+
+def _local_imports(script: str) -> set[str]:
+    """
+    Modules next to the script that it imports (anywhere in the file, lazy imports included).
+    """
+    if script not in _IMPORTS:
+        path = ROOT / script
+        names: set[str] = set()
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"), filename=script)
+        except (OSError, SyntaxError):
+            tree = None
+        for node in ast.walk(tree) if tree else ():
+            if isinstance(node, ast.Import):
+                names.update(a.name.split(".")[0] for a in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names.add(node.module.split(".")[0])
+        folder = path.parent.relative_to(ROOT).as_posix()
+        _IMPORTS[script] = {f"{folder}/{n}.py" for n in names if (path.parent / f"{n}.py").is_file()}
+    return _IMPORTS[script]
+
+
+def tool_imports(script: str) -> list[str]:
+    """
+    Local modules the script imports, directly or through each other, as repo-relative
+    paths. Stages take these as inputs, so editing a shared module (dossier_model.py,
+    parse_cache.py) reruns every stage that uses it without anyone keeping lists by hand.
+    """
+    seen: set[str] = set()
+    todo = [script]
+    while todo:
+        for dep in _local_imports(todo.pop()):
+            if dep not in seen:
+                seen.add(dep)
+                todo.append(dep)
+    seen.discard(script)
+    return sorted(seen)
+
+
+def dossier_stages(d: Dossier) -> list[Stage]:
+    """
+    The stage graph for one dossier. Stage names are "<dossier>:<stage>", so every
+    dossier's stages share one graph, one worker pool and one build state file.
+    Each stage's script and the local modules it imports are added to its inputs.
+    """
+    parts = f"{d.parts}/*.md"
+    site = d.site
+    stages = [
+        Stage(
+            "source",
+            ["tools/build_source.py", d.parts, d.source, d.title],
+            inputs=[parts],
+            outputs=[d.source],
+        ),
+        Stage(
+            "split",
+            ["tools/split_dossier.py", d.parts, site, d.title],
+            inputs=[parts, f"{site}/related.json"],
+            outputs=[f"{site}/index.html", f"{site}/toc.json"],
+        ),
+        Stage(
+            "history",
+            ["tools/claim_history.py", d.parts, "--cache", d.history],
+            inputs=[parts],
+            outputs=[d.history],
+            stamp=["git", "rev-parse", "HEAD"],
+        ),
+        Stage(
+            "claims",
+            ["tools/build_claims.py", d.source, site, d.parts],
+            inputs=[d.source, d.history, parts],
+            outputs=[
+                f"{site}/claims.json",
+                f"{site}/claims.min.json",
+                f"{site}/claims.min.cols.json",
+                f"{site}/claims.ndjson",
+                f"{site}/claims.ndjson.idx.json",
+                f"{site}/claims.html",
+                f"{site}/claims/*.html",
+                f"{site}/claims/pages.json",
+                f"{site}/sources.json",
+            ],
+        ),
+        Stage(
+            "duplicates",
+            ["tools/find_duplicates.py", site, "--cache", d.signatures, "--report", f"{site}/duplicates.json"],
+            inputs=[f"{site}/claims.json"],
+            outputs=[f"{site}/duplicates.json"],
+        ),
+        Stage(
+            "chunks",
+            ["tools/build_chunks.py", d.parts, site],
+            inputs=[parts, f"{site}/claims.json"],
+            outputs=[f"{site}/chunks.jsonl", f"{site}/chunks.delta.json"],
+        ),
+        Stage(
+            "related",
+            ["tools/build_related.py", d.parts, site, "--cache", f"{d.cache}/related.json"],
+            inputs=[parts, f"{site}/claims.json"],
+            outputs=[f"{site}/related.json"],
+        ),
+        Stage(
+            "timeline",
+            ["tools/build_timeline.py", site],
+            inputs=[f"{site}/claims.json", f"{site}/sources.json"],
+            outputs=[f"{site}/timeline/*.json", f"{site}/timeline.html"],
+        ),
+        Stage(
+            "source_html",
+            ["tools/build_source_html.py", d.source, f"{site}/source.html"],
+            inputs=[d.source],
+            outputs=[f"{site}/source.html"],
+        ),
+    ]
+    if d.fingerprint:
+        stages.append(
+            Stage(
+                "fingerprint",
+                [
+                    "tools/fingerprint_assets.py",
+                    site,
+                    "--keep",
+                    str(d.fingerprint),
+                    *(a for path in d.rewrite for a in ("--rewrite", path)),
+                ],
+                inputs=[f"{site}/*", f"{site}/*/*"],
+                outputs=[
+                    f"{site}/assets.json",
+                    f"{site}/index.html",
+                    f"{site}/claims.html",
+                    f"{site}/timeline.html",
+                    *d.rewrite,
+                ],
+            )
+        )
+    stages += [
+        Stage(
+            "bundle",
+            ["tools/build_bundle.py", site, d.bundle],
+            inputs=[f"{site}/*", f"{site}/*/*"],
+            outputs=[d.bundle, f"{d.bundle}.json"],
+        ),
+    ]
+    for st in stages:
+        st.name = f"{d.name}:{st.name}"
+        st.inputs += [m for m in [st.cmd[0], *tool_imports(st.cmd[0])] if m not in st.inputs]
+    return stages
+
+
+def all_stages(dossiers: list[Dossier]) -> list[Stage]:
+    return [st for d in dossiers for st in dossier_stages(d)]
+
+
+def _matches(pattern: str, other: str) -> bool:
+    return pattern == other or fnmatch.fnmatch(pattern, other) or fnmatch.fnmatch(other, pattern)
+
+
+def dependencies(stages: list[Stage]) -> dict[str, set[str]]:
+    deps: dict[str, set[str]] = {s.name: set() for s in stages}
+    for b in stages:
+        for a in stages:
+            if a is b:
+                continue
+            if any(_matches(i, o) for i in b.inputs for o in a.outputs):
+                deps[b.name].add(a.name)
+    return deps
+
+
+def waves(stages: list[Stage], deps: dict[str, set[str]]) -> list[list[Stage]]:
+    """
+    Topological layers: every stage in a wave depends only on earlier waves.
+    """
+    done: set[str] = set()
+    left = list(stages)
+    out: list[list[Stage]] = []
+    while left:
+        wave = [s for s in left if deps[s.name] <= done]
+        if not wave:
+            raise SystemExit(f"Dependency cycle among stages: {', '.join(s.name for s in left)}")
+        out.append(wave)
+        done.update(s.name for s in wave)
+        left = [s for s in left if s.name not in done]
+    return out
+
+
+def _expand(root: Path, patterns: list[str]) -> list[Path]:
+    files: set[Path] = set()
+    for pat in patterns:
+        if any(ch in pat for ch in "*?["):
+            files.update(p for p in root.glob(pat) if p.is_file())
+        else:
+            files.add(root / pat)
+    return sorted(files)
+
+
+# Every dossier's stages name the same tool files, so digests are kept per (path, mtime,
+# size) for the whole run instead of re-reading each file for every stage that lists it.
+_DIGESTS: dict[tuple[str, int, int], bytes] = {}
+_STAMPS: dict[tuple[str, ...], str] = {}
+
+
+def _digest(p: Path) -> bytes:
+    st = p.stat()
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    d = _DIGESTS.get(key)
+    if d is None:
+        d = _DIGESTS[key] = hashlib.sha256(p.read_bytes()).digest()
+    return d
+
+
+def fingerprint(root: Path, patterns: list[str], extra: str = "") -> str | None:
+    """
+    Hash of (path, content) for every file the patterns name. None if a literal path is missing.
+    """
+    h = hashlib.sha256(extra.encode("utf-8"))
+    for p in _expand(root, patterns):
+        if not p.is_file():
+            return None
+        h.update(p.relative_to(root).as_posix().encode("utf-8") + b"\0")
+        h.update(_digest(p))
+    return h.hexdigest()
+
+
+def _stamp(root: Path, cmd: list[str]) -> str:
+    key = tuple(cmd)
+    if key not in _STAMPS:
+        try:
+            proc = subprocess.run(cmd, cwd=root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            _STAMPS[key] = proc.stdout
+        except OSError:
+            _STAMPS[key] = ""
+    return _STAMPS[key]
+
+
+def input_fingerprint(root: Path, stage: Stage) -> str | None:
+    extra = " ".join(stage.cmd)
+    if stage.stamp:
+        extra += "\0" + _stamp(root, stage.stamp)
+    return fingerprint(root, stage.inputs, extra)
+
+
+def is_up_to_date(root: Path, stage: Stage, state: dict[str, dict]) -> bool:
+    prev = state.get(stage.name)
+    if not prev:
+        return False
+    return (
+        prev.get("inputs") == input_fingerprint(root, stage)
+        and prev.get("outputs") == fingerprint(root, stage.outputs)
+    )
+
+
+def load_state(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path: Path, state: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def print_plan(root: Path, stages: list[Stage], state: dict[str, dict], force: bool) -> None:
+    deps = dependencies(stages)
+    will_run: set[str] = set()
+    for n, wave in enumerate(waves(stages, deps), start=1):
+        print(f"wave {n}:")
+        for s in wave:
+            if force:
+                why = "run (forced)"
+            elif deps[s.name] & will_run:
+                why = f"run (after {', '.join(sorted(deps[s.name] & will_run))})"
+            elif not is_up_to_date(root, s, state):
+                why = "run (inputs changed)"
+            else:
+                why = "skip (up to date)"
+            if why.startswith("run"):
+                will_run.add(s.name)
+            after = f"  needs: {', '.join(sorted(deps[s.name]))}" if deps[s.name] else ""
+            print(f"  {s.name:<20} {why}{after}")
+            print(f"    $ python {shlex.join(s.cmd)}")
+
+
+def _init_worker(root: Path) -> None:
+    os.chdir(root)
+    sys.path.insert(0, str(root / "tools"))
+
+
+def _run_stage(cmd: list[str]) -> tuple[int, str, float]:
+    """
+    Run one tool script inside a pool worker, as `python <cmd>` would. Workers live for the
+    whole build, so imports and compiled regexes are paid once per worker rather than once
+    per stage, and parse caches (split_dossier.parse_part) carry over between stages.
+    """
+    started = time.monotonic()
+    out = io.StringIO()
+    argv = sys.argv
+    sys.argv = list(cmd)
+    code = 0
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            runpy.run_path(cmd[0], run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            out.write(f"{e.code}\n")
+            code = 1
+    except Exception:
+        out.write(traceback.format_exc())
+        code = 1
+    finally:
+        sys.argv = argv
+    return code, out.getvalue(), time.monotonic() - started
+
+
+def run_graph(
+    root: Path,
+    stages: list[Stage],
+    state: dict[str, dict],
+    *,
+    jobs: int | None = None,
+    force: bool = False,
+) -> dict[str, dict]:
+    """
+    Run stages as soon as their dependencies finish, skipping up-to-date ones.
+    Updates state in place. Returns per-stage results {status, seconds}.
+    """
+    deps = dependencies(stages)
+    pending = {s.name: s for s in stages}
+    finished: set[str] = set()
+    results: dict[str, dict] = {}
+    failed = False
+
+    workers = min(jobs or os.cpu_count() or 1, len(stages)) or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(root,)) as ex:
+        running: dict[Future, Stage] = {}
+
+        while True:
+            # skipping a stage can unblock others, so keep scheduling until nothing changes
+            progressed = not failed
+            while progressed:
+                progressed = False
+                for name in [n for n in pending if deps[n] <= finished]:
+                    stage = pending.pop(name)
+                    if not force and is_up_to_date(root, stage, state):
+                        print(f"[{name}] up to date, skipped")
+                        results[name] = {"status": "skipped", "seconds": 0.0}
+                        finished.add(name)
+                        progressed = True
+                        continue
+                    running[ex.submit(_run_stage, stage.cmd)] = stage
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                stage = running.pop(fut)
+                code, output, seconds = fut.result()
+                for line in output.splitlines():
+                    print(f"[{stage.name}] {line}")
+
+                if code != 0:
+                    print(f"[{stage.name}] FAILED (exit {code}) after {seconds:.2f}s")
+                    results[stage.name] = {"status": "failed", "seconds": seconds}
+                    failed = True
+                    continue
+
+                print(f"[{stage.name}] done in {seconds:.2f}s")
+                results[stage.name] = {"status": "ran", "seconds": seconds}
+                state[stage.name] = {
+                    "inputs": input_fingerprint(root, stage),
+                    "outputs": fingerprint(root, stage.outputs),
+                }
+                finished.add(stage.name)
+
+    if pending and not failed:
+        raise SystemExit(f"Stages cannot run: {', '.join(pending)}")
+
+    # A later stage may post-process an earlier one's outputs (fingerprint repoints links
+    # in index.html), so record every finished stage's outputs as the build left them.
+    by_name = {s.name: s for s in stages}
+    for name in finished:
+        if name in state:
+            state[name]["outputs"] = fingerprint(root, by_name[name].outputs)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the dossier site as a dependency graph of stages.")
+    parser.add_argument("stages", nargs="*", help="Only run these stages (and nothing else), e.g. claims or main:claims.")
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG, help=f"Dossier list (default: {DEFAULT_CONFIG})")
+    parser.add_argument("--dossier", action="append", default=[], help="Only build this dossier (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan without running anything.")
+    parser.add_argument("--force", action="store_true", help="Run every stage even if its inputs are unchanged.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes shared by all dossiers (default: CPU count)")
+    parser.add_argument("--state", type=Path, default=DEFAULT_STATE, help=f"Build state file (default: {DEFAULT_STATE})")
+    args = parser.parse_args()
+
+    dossiers = load_dossiers(ROOT, args.config)
+    if args.dossier:
+        names = {d.name for d in dossiers}
+        unknown = [n for n in args.dossier if n not in names]
+        if unknown:
+            raise SystemExit(f"Unknown dossier(s): {', '.join(unknown)} (known: {', '.join(sorted(names))})")
+        dossiers = [d for d in dossiers if d.name in args.dossier]
+
+    stages = all_stages(dossiers)
+    if args.stages:
+        # "claims" selects that stage in every dossier, "main:claims" just the one
+        known = {s.name for s in stages} | {s.name.split(":", 1)[1] for s in stages}
+        unknown = [n for n in args.stages if n not in known]
+        if unknown:
+            raise SystemExit(f"Unknown stage(s): {', '.join(unknown)} (known: {', '.join(sorted(known))})")
+        stages = [s for s in stages if s.name in args.stages or s.name.split(":", 1)[1] in args.stages]
+
+    state_path = args.state if args.state.is_absolute() else ROOT / args.state
+    state = load_state(state_path)
+
+    if args.dry_run:
+        print_plan(ROOT, stages, state, args.force)
+        return
+
+    started = time.monotonic()
+    results = run_graph(ROOT, stages, state, jobs=args.jobs, force=args.force)
+    save_state(state_path, state)
+
+    ran = sum(1 for r in results.values() if r["status"] == "ran")
+    skipped = sum(1 for r in results.values() if r["status"] == "skipped")
+    print(f"Build finished in {time.monotonic() - started:.2f}s: {ran} ran, {skipped} skipped.")
+    if any(r["status"] == "failed" for r in results.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
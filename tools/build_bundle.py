@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# tools/build_bundle.py
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import tarfile
+from pathlib import Path
+
+from bundle_read import BUNDLE_FORMAT, index_path_for, read_index
+
+
+BLOCK = tarfile.BLOCKSIZE
+TRAILER = b"\0" * (2 * BLOCK)
+
+# Changed members are appended and the index repointed; the replaced bytes stay behind as
+# dead space. Rewrite the whole bundle once dead space outgrows the live members.
+MAX_DEAD_RATIO = 1.0
+
+
+def _pad(n: int) -> int:
+    return -n % BLOCK
+
+
+def member_header(name: str, size: int) -> bytes:
+    """
+    Deterministic tar header: no mtime/owner, so the same site gives the same bundle bytes.
+    """
+    ti = tarfile.TarInfo(name)
+    ti.size = size
+    ti.mode = 0o644
+    ti.mtime = 0
+    ti.uid = ti.gid = 0
+    ti.uname = ti.gname = ""
+    return ti.tobuf(format=tarfile.PAX_FORMAT, encoding="utf-8", errors="strict")
+
+
+def site_files(site: Path) -> dict[str, Path]:
+    return {p.relative_to(site).as_posix(): p for p in sorted(site.rglob("*")) if p.is_file()}
+
+
+def bundle_version(members: dict[str, dict]) -> str:
+    h = hashlib.sha256()
+    for name in sorted(members):
+        h.update(f"{name}\0{members[name]['sha256']}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _block_size(m: dict) -> int:
+    return m["offset"] - m["header"] + m["size"] + _pad(m["size"])
+
+
+def _write_member(f, name: str, data: bytes, sha: str) -> dict:
+    header = f.tell()
+    f.write(member_header(name, len(data)))
+    offset = f.tell()
+    f.write(data)
+    f.write(b"\0" * _pad(len(data)))
+    return {"header": header, "offset": offset, "size": len(data), "sha256": sha}
+
+
+def build_bundle(site: Path, bundle: Path) -> tuple[str, int, int, int]:
+    """
+    Bring bundle + index in line with the site dir. Returns (mode, written, unchanged, removed)
+    where mode is "unchanged", "append" or "rewrite".
+    """
+    index_path = index_path_for(bundle)
+    files = site_files(site)
+    contents = {name: p.read_bytes() for name, p in files.items()}
+    hashes = {name: hashlib.sha256(data).hexdigest() for name, data in contents.items()}
+
+    old = read_index(index_path)
+    if old is not None and (not bundle.exists() or bundle.stat().st_size != old["end"] + len(TRAILER)):
+        old = None  # bundle missing or not the one this index describes
+
+    members: dict[str, dict] = dict(old["members"]) if old else {}
+    changed = [n for n in files if n not in members or members[n]["sha256"] != hashes[n]]
+    removed = [n for n in members if n not in files]
+
+    if old is not None and not changed and not removed:
+        return "unchanged", 0, len(files), 0
+
+    live = sum(len(d) for d in contents.values())
+    dead = (old or {}).get("dead", 0) + sum(_block_size(members[n]) for n in changed if n in members)
+
+    # Appending keeps `tar x` correct for changed members (the last copy wins), but a
+    # removed member would still be extracted, so removals force a rewrite.
+    if old is not None and not removed and dead <= live * MAX_DEAD_RATIO:
+        mode = "append"
+        with bundle.open("r+b") as f:
+            f.seek(old["end"])
+            f.truncate()
+            for name in changed:
+                members[name] = _write_member(f, name, contents[name], hashes[name])
+            end = f.tell()
+            f.write(TRAILER)
+    else:
+        mode, dead, changed = "rewrite", 0, list(files)
+        members = {}
+        tmp = bundle.with_name(bundle.name + ".tmp")
+        bundle.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            for name in files:
+                members[name] = _write_member(f, name, contents[name], hashes[name])
+            end = f.tell()
+            f.write(TRAILER)
+        tmp.replace(bundle)
+
+    index = {
+        "format": BUNDLE_FORMAT,
+        "version": bundle_version(members),
+        "site": site.as_posix(),
+        "end": end,
+        "dead": dead,
+        "members": {n: members[n] for n in sorted(members)},
+    }
+    tmp_index = index_path.with_name(index_path.name + ".tmp")
+    tmp_index.write_text(json.dumps(index, ensure_ascii=False, indent=1), encoding="utf-8")
+    tmp_index.replace(index_path)
+    return mode, len(changed), len(files) - len(changed), len(removed)
+
+
+def main(site_dir: str, bundle_file: str | None = None) -> None:
+    site = Path(site_dir)
+    if not site.is_dir():
+        raise SystemExit(f"No site dir at {site}")
+    bundle = Path(bundle_file) if bundle_file else site.with_name(site.name + ".bundle")
+
+    mode, written, unchanged, removed = build_bundle(site, bundle)
+    print(
+        f"Wrote {bundle} + {index_path_for(bundle).name} ({mode}: {written} member(s) written, "
+        f"{unchanged} unchanged, {removed} removed)"
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python tools/build_bundle.py <site_dir> [<bundle_file>]")
+        sys.exit(1)
+    main(*sys.argv[1:])
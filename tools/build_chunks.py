@@ -0,0 +1,273 @@
+# tools/build_chunks.py
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from split_dossier import MD_HEADING_RE, parse_part, slugify
+
+
+# Subsection headings inside a part body:
+#   2.1 TV news parents and who holds them
+#   8.5.1 Scale of the money
+SUBHEADING_RE = re.compile(r"^\s*(\d+(?:\.\d+)+)\s+(\S(?:.*\S)?)\s*$")
+
+# Size bounds are in characters of stripped text (roughly 4 chars per token).
+CHUNK_MAX_CHARS = 1200
+CHUNK_OVERLAP_CHARS = 200
+
+CHUNKS_FILE = "chunks.jsonl"
+DELTA_FILE = "chunks.delta.json"
+
+
+def load_sections(parts_dir: Path) -> list[dict]:
+    """
+    Read parts in the same order split_dossier.py uses and return
+    [{id, label, url, body}] where body is already stripped for humans.
+    """
+    part_files = sorted([p for p in parts_dir.glob("*.md") if p.is_file()])
+    if not part_files:
+        raise SystemExit(f"No parts found in {parts_dir}")
+
+    items: list[dict] = []
+    for p in part_files:
+        meta, _body, clean = parse_part(p.read_text(encoding="utf-8"))
+
+        sec_id = str(meta.get("id") or slugify(p.stem))
+        order = str(meta.get("order") or "999999")
+        title = str(meta.get("title") or p.stem)
+        number = str(meta.get("number") or "")
+        label = f"{number}. {title}" if number else title
+
+        items.append(
+            {
+                "order": order,
+                "id": sec_id,
+                "label": label,
+                "url": f"{sec_id}.html",
+                "body": clean,
+            }
+        )
+
+    items.sort(key=lambda x: (x["order"], x["id"]))
+    return items
+
+
+def _heading_depth(line: str) -> tuple[int, str] | None:
+    m = SUBHEADING_RE.match(line)
+    if m:
+        return m.group(1).count(".") + 1, f"{m.group(1)} {m.group(2)}"
+    m = MD_HEADING_RE.match(line)
+    if m:
+        return len(m.group(1)), m.group(2)
+    return None
+
+
+def split_blocks(section_label: str, body: str) -> list[tuple[list[str], list[str]]]:
+    """
+    Split a stripped section body into heading blocks.
+    Returns [(heading_path, paragraphs)], where heading_path starts with the section label.
+    """
+    blocks: list[tuple[list[str], list[str]]] = []
+    stack: list[tuple[int, str]] = []
+    paras: list[str] = []
+    cur: list[str] = []
+
+    def flush_para() -> None:
+        if cur:
+            paras.append("\n".join(cur).strip())
+            cur.clear()
+
+    def flush_block() -> None:
+        flush_para()
+        if paras:
+            blocks.append(([section_label] + [t for _d, t in stack], list(paras)))
+            paras.clear()
+
+    for line in body.splitlines():
+        h = _heading_depth(line)
+        if h:
+            flush_block()
+            depth, title = h
+            while stack and stack[-1][0] >= depth:
+                stack.pop()
+            stack.append((depth, title))
+            continue
+
+        if not line.strip():
+            flush_para()
+            continue
+        cur.append(line.rstrip())
+
+    flush_block()
+    return blocks
+
+
+def _split_oversized(para: str, limit: int) -> list[str]:
+    if len(para) <= limit:
+        return [para]
+
+    pieces: list[str] = []
+    cur = ""
+    for word in re.split(r"(?<=\s)", para):
+        if cur and len(cur) + len(word) > limit:
+            pieces.append(cur.strip())
+            cur = ""
+        # a single "word" longer than the limit is hard-cut
+        while len(word) > limit:
+            pieces.append(word[:limit])
+            word = word[limit:]
+        cur += word
+    if cur.strip():
+        pieces.append(cur.strip())
+    return pieces
+
+
+def pack_chunks(paras: list[str], max_chars: int, overlap_chars: int) -> list[str]:
+    """
+    Greedily pack paragraphs into chunks of at most max_chars.
+    Each new chunk repeats trailing paragraphs of the previous one, up to overlap_chars.
+    """
+    units: list[str] = []
+    for p in paras:
+        units.extend(_split_oversized(p, max_chars))
+
+    chunks: list[str] = []
+    cur: list[str] = []
+    cur_len = 0
+    fresh = 0  # units in cur that are not overlap carried from the previous chunk
+
+    for u in units:
+        add = len(u) + (2 if cur else 0)
+        if cur and fresh and cur_len + add > max_chars:
+            chunks.append("\n\n".join(cur))
+
+            carry: list[str] = []
+            carry_len = 0
+            for prev in reversed(cur):
+                if carry_len + len(prev) > overlap_chars:
+                    break
+                carry.insert(0, prev)
+                carry_len += len(prev) + 2
+            # drop the carry if it would leave no room for the new unit
+            if carry_len + len(u) > max_chars:
+                carry, carry_len = [], 0
+
+            cur = carry
+            cur_len = max(carry_len - 2, 0)
+            fresh = 0
+            add = len(u) + (2 if cur else 0)
+
+        cur.append(u)
+        cur_len += add
+        fresh += 1
+
+    if cur and fresh:
+        chunks.append("\n\n".join(cur))
+    return chunks
+
+
+def chunk_id(section_id: str, heading_path: list[str], text: str) -> str:
+    h = hashlib.sha256()
+    h.update(section_id.encode("utf-8"))
+    for part in heading_path:
+        h.update(b"\x1f" + part.encode("utf-8"))
+    h.update(b"\x1e" + text.encode("utf-8"))
+    return "K-" + h.hexdigest()[:16]
+
+
+def _norm(s: str) -> str:
+    return " ".join((s or "").split())
+
+
+def build_chunks(sections: list[dict], claims: list[dict]) -> list[dict]:
+    claims_by_section: dict[str, list[tuple[str, str]]] = {}
+    for c in claims:
+        claims_by_section.setdefault(c.get("section_id", ""), []).append((c["id"], _norm(c.get("text", ""))))
+
+    out: list[dict] = []
+    seen: dict[str, int] = {}
+
+    for sec in sections:
+        sec_claims = claims_by_section.get(sec["id"], [])
+        ord_in_section = 0
+
+        for heading_path, paras in split_blocks(sec["label"], sec["body"]):
+            for text in pack_chunks(paras, CHUNK_MAX_CHARS, CHUNK_OVERLAP_CHARS):
+                cid = chunk_id(sec["id"], heading_path, text)
+                # identical text under the same heading: keep ids unique but still content-derived
+                seen[cid] = seen.get(cid, 0) + 1
+                if seen[cid] > 1:
+                    cid = f"{cid}-{seen[cid]}"
+
+                flat = _norm(text)
+                out.append(
+                    {
+                        "id": cid,
+                        "section_id": sec["id"],
+                        "url": sec["url"],
+                        "ord": ord_in_section,
+                        "heading_path": heading_path,
+                        "claim_ids": [cl_id for cl_id, cl_text in sec_claims if cl_text and cl_text in flat],
+                        "text": text,
+                    }
+                )
+                ord_in_section += 1
+
+    return out
+
+
+def load_chunk_ids(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    ids: list[str] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            ids.append(json.loads(line)["id"])
+    return ids
+
+
+def compute_delta(old_ids: list[str], new_ids: list[str]) -> dict:
+    old_set = set(old_ids)
+    new_set = set(new_ids)
+    return {
+        "added": [i for i in new_ids if i not in old_set],
+        "removed": [i for i in old_ids if i not in new_set],
+        "unchanged": len(new_set & old_set),
+        "total": len(new_ids),
+    }
+
+
+def main(parts_dir: str, site_dir: str) -> None:
+    site = Path(site_dir)
+    site.mkdir(parents=True, exist_ok=True)
+
+    sections = load_sections(Path(parts_dir))
+
+    claims_json = site / "claims.json"
+    claims = json.loads(claims_json.read_text(encoding="utf-8")) if claims_json.exists() else []
+
+    chunks = build_chunks(sections, claims)
+
+    # Delta is computed against the chunks.jsonl left by the previous build.
+    chunks_path = site / CHUNKS_FILE
+    delta = compute_delta(load_chunk_ids(chunks_path), [c["id"] for c in chunks])
+
+    chunks_path.write_text(
+        "".join(json.dumps(c, ensure_ascii=False, separators=(",", ":")) + "\n" for c in chunks),
+        encoding="utf-8",
+    )
+    (site / DELTA_FILE).write_text(json.dumps(delta, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    print(f"Wrote {chunks_path} ({len(chunks)} chunks)")
+    print(f"Wrote {site / DELTA_FILE} (+{len(delta['added'])} / -{len(delta['removed'])})")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python tools/build_chunks.py <parts_dir> <site_dir>")
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2])
@@ -1,22 +1,30 @@
 # tools/build_claims.py
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
 import re
 import sys
+from dataclasses import dataclass, field
 from html import escape
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+from urllib.parse import urlsplit
 
+from build_sources import build_registry
+from claims_columnar import dumps_columnar, encode_columnar
+from dossier_model import Claim, Section, dumps_claims, dumps_claims_min
 
-BEGIN_PART_RE = re.compile(r"^\s*<!--\s*BEGIN\s+(.+?)\s*-->\s*$")
+
+BEGIN_PART_RE = re.compile(r"^\s*<!--\s*BEGIN\s+(\S(?:.*\S)?)\s*-->\s*$")
 
 # Single-line claims:
 #   [CLAIM] text...
 #   CLAIM: text...
 #   - [CLAIM] text...
 CLAIM_LINE_RE = re.compile(
-    r"^\s*(?:[-*]\s*)?(?:\[(?i:claim)\]\s*|(?i:claim)\s*:\s*)(.+?)\s*$"
+    r"^\s*(?:[-*]\s*)?(?:\[(?i:claim)\]|(?i:claim)\s*:)\s*(\S(?:.*\S)?)\s*$"
 )
 
 # Multi-line blocks:
@@ -28,18 +36,25 @@ CLAIM_BLOCK_END_RE = re.compile(r"^\s*\[/(?i:claim)\]\s*$")
 
 # Inline suffix claims:
 #   Some claim text here. [C]
-C_SUFFIX_RE = re.compile(r"^\s*(.+?)\s*\[c\]\s*$", re.IGNORECASE)
+C_SUFFIX_RE = re.compile(r"^\s*(\S(?:.*?\S)?)\s*\[c\]\s*$", re.IGNORECASE)
 
 URL_RE = re.compile(r"https?://[^\s)>\]]+")
 
 # Timeline-ish metadata inside evidence blocks
-META_LINE_RE = re.compile(r"^\s*(date|title|tags|note)\s*:\s*(.+?)\s*$", re.IGNORECASE)
+META_LINE_RE = re.compile(r"^\s*(date|title|tags|note)\s*:\s*(\S(?:.*\S)?)\s*$", re.IGNORECASE)
 EVIDENCE_LABEL_RE = re.compile(
-    r"^\s*(evidence|links|sources|verification paths?|verify|citations)\s*:?\s*(?:\(.*\))?\s*$",
+    r"^\s*(evidence|links|sources|verification paths?|verify|citations)\s*(?::\s*)?(?:\(.*\)\s*)?$",
     re.IGNORECASE,
 )
 ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+# claims.html is an index; the rows live in claims/<section_id>[-n].html pages.
+CLAIMS_PAGES_DIR = "claims"
+CLAIMS_PAGE_ROWS = 200
+
+# Claim pages are re-rendered when this file changes (templates live here).
+RENDER_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
 
 def _strip_wrapping_quotes(s: str) -> str:
     s = s.strip()
@@ -96,14 +111,14 @@ def parse_front_matter(text: str) -> tuple[dict, str]:
         if not line.strip():
             continue
 
-        m_item = re.match(r"^\s*-\s*(.+?)\s*$", line)
+        m_item = re.match(r"^\s*-\s*(.+)$", line)
         if m_item and cur_key:
             meta.setdefault(cur_key, [])
             if isinstance(meta[cur_key], list):
                 meta[cur_key].append(_strip_wrapping_quotes(m_item.group(1)))
             continue
 
-        m_kv = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*?)\s*$", line)
+        m_kv = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*)$", line)
         if m_kv:
             key = m_kv.group(1)
             val = m_kv.group(2)
@@ -124,11 +139,34 @@ def slugify(s: str) -> str:
     return s or "section"
 
 
-def load_parts_index(parts_dir: Path) -> dict[str, dict]:
+def section_meta(stem: str, meta: dict) -> Section:
+    """
+    Normalized section meta for one part, as used by split_dossier.py.
+    """
+    sec_id = meta.get("id") or slugify(stem)
+    order = meta.get("order") or "999999"
+    title = meta.get("title") or stem
+    number = meta.get("number") or ""
+    level = int(meta.get("level") or 1)
+
+    return Section(
+        id=str(sec_id),
+        order=str(order),
+        number=str(number),
+        level=level,
+        title=str(title),
+        keywords=_ensure_list(meta.get("keywords")),
+        summary=_ensure_list(meta.get("summary")),
+        related=_ensure_list(meta.get("related")),
+        url=f"{sec_id}.html",
+    )
+
+
+def load_parts_index(parts_dir: Path) -> dict[str, Section]:
     """
     Map "filename.md" -> normalized section meta used by split_dossier.py.
     """
-    out: dict[str, dict] = {}
+    out: dict[str, Section] = {}
     if not parts_dir.exists():
         return out
 
@@ -138,32 +176,116 @@ def load_parts_index(parts_dir: Path) -> dict[str, dict]:
 
         raw = p.read_text(encoding="utf-8")
         meta, _body = parse_front_matter(raw)
-
-        sec_id = meta.get("id") or slugify(p.stem)
-        order = meta.get("order") or "999999"
-        title = meta.get("title") or p.stem
-        number = meta.get("number") or ""
-        level = int(meta.get("level") or 1)
-
-        out[p.name] = {
-            "id": str(sec_id),
-            "order": str(order),
-            "number": str(number),
-            "level": level,
-            "title": str(title),
-            "keywords": _ensure_list(meta.get("keywords")),
-            "summary": _ensure_list(meta.get("summary")),
-            "related": _ensure_list(meta.get("related")),
-            "url": f"{sec_id}.html",
-        }
+        out[p.name] = section_meta(p.stem, meta)
 
     return out
 
 
+@dataclass
+class ClaimToken:
+    """
+    One unit from tokenize_claims:
+      kind "part"   -> text is the part file name from a BEGIN marker
+      kind "block"  -> [CLAIM] ... [/CLAIM]; text is the block body
+      kind "inline" -> "... [C]"; evidence_lines are the lines below until a blank line
+      kind "line"   -> CLAIM: / [CLAIM] single line
+    line_no is 1-based; end_line is the last line the claim spans (its evidence or [/CLAIM]).
+    """
+
+    kind: str
+    text: str
+    line_no: int
+    evidence_lines: list[str] = field(default_factory=list)
+    end_line: int = 0
+
+    @property
+    def evidence_text(self) -> str:
+        return "\n".join(self.evidence_lines).strip()
+
+
+def tokenize_claims(lines: list[str], start: int = 0) -> Iterator[ClaimToken]:
+    """
+    Claim tokenizer shared by the ledger build and the linter.
+    Claims with empty text are not emitted.
+    """
+    i = start
+    while i < len(lines):
+        line = lines[i]
+
+        m_begin = BEGIN_PART_RE.match(line)
+        if m_begin:
+            yield ClaimToken("part", m_begin.group(1).strip(), i + 1)
+            i += 1
+            continue
+
+        # 1) Block claim
+        if CLAIM_BLOCK_START_RE.match(line):
+            start_line_no = i + 1
+            block_lines: list[str] = []
+            i += 1
+            while i < len(lines) and not CLAIM_BLOCK_END_RE.match(lines[i]):
+                block_lines.append(lines[i])
+                i += 1
+            if i < len(lines) and CLAIM_BLOCK_END_RE.match(lines[i]):
+                i += 1
+
+            claim_text = "\n".join(block_lines).strip()
+            if claim_text:
+                yield ClaimToken("block", claim_text, start_line_no, end_line=i)
+            continue
+
+        # 2) Inline [C] suffix claim
+        m_c = C_SUFFIX_RE.match(line)
+        if m_c:
+            start_line_no = i + 1
+            claim_text = m_c.group(1).strip()
+
+            # Evidence is the following lines until a blank line.
+            # Safety stop: if a new claim begins before a blank line, stop there too.
+            evidence_lines: list[str] = []
+            i += 1
+            while i < len(lines):
+                nxt = lines[i]
+                if nxt.strip() == "":
+                    break
+                if CLAIM_BLOCK_START_RE.match(nxt) or CLAIM_LINE_RE.match(nxt) or C_SUFFIX_RE.match(nxt):
+                    break
+                evidence_lines.append(nxt.rstrip())
+                i += 1
+            end_line = i
+
+            # consume optional blank line
+            if i < len(lines) and lines[i].strip() == "":
+                i += 1
+
+            if claim_text:
+                yield ClaimToken("inline", claim_text, start_line_no, evidence_lines, end_line)
+            continue
+
+        # 3) Single-line CLAIM: or [CLAIM] text
+        m_line = CLAIM_LINE_RE.match(line)
+        if m_line:
+            claim_text = m_line.group(1).strip()
+            if claim_text:
+                yield ClaimToken("line", claim_text, i + 1, end_line=i + 1)
+            i += 1
+            continue
+
+        i += 1
+
+
 def claim_id(section_id: str, idx: int) -> str:
     return f"C-{section_id}-{idx:03d}"
 
 
+def claim_key(text: str) -> str:
+    """
+    Position-independent claim identity: claim ids are renumbered when claims are inserted
+    above, the whitespace-normalized text is not. Used to join git history onto the ledger.
+    """
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()[:16]
+
+
 def pick_doc_title(lines: list[str]) -> str:
     for ln in lines:
         if ln.strip():
@@ -171,16 +293,9 @@ def pick_doc_title(lines: list[str]) -> str:
     return "Dossier"
 
 
-def _section_fields(current_part_meta: dict | None) -> tuple[str, str, str]:
+def _section_fields(current_part_meta: Section | None) -> tuple[str, str, str]:
     if current_part_meta:
-        sec_id = current_part_meta["id"]
-        sec_label = (
-            f'{current_part_meta["number"]}. {current_part_meta["title"]}'.strip()
-            if current_part_meta.get("number")
-            else current_part_meta["title"]
-        )
-        url = current_part_meta["url"]
-        return sec_id, sec_label, url
+        return current_part_meta.id, current_part_meta.label, current_part_meta.url
     return "no-part", "No part", ""
 
 
@@ -233,56 +348,187 @@ def parse_event_meta(evidence_text: str) -> tuple[dict, str]:
     return meta, "\n".join(cleaned).strip()
 
 
-def render_claims_html(doc_title: str, claims: list[dict]) -> str:
-    rows: list[str] = []
+def encode_claims_ndjson(claims: list[dict], name: str = "claims.ndjson") -> tuple[bytes, dict]:
+    """
+    One compact claim per line, plus an index of claim id -> [byte offset, byte length].
+    Length excludes the trailing newline, so a client can fetch one claim with
+    `Range: bytes=<offset>-<offset + length - 1>`.
+    """
+    buf = bytearray()
+    offsets: dict[str, list[int]] = {}
+    for c in claims:
+        line = json.dumps(c, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        offsets[c["id"]] = [len(buf), len(line)]
+        buf += line + b"\n"
+    return bytes(buf), {"file": name, "bytes": len(buf), "claims": offsets}
+
+
+def write_claims_ndjson(claims: list[dict], ndjson_path: Path, index_path: Path) -> dict:
+    data, index = encode_claims_ndjson(claims, ndjson_path.name)
+    ndjson_path.write_bytes(data)
+    index_path.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    return index
+
+
+def read_ndjson_claim(ndjson_path: Path, index: dict, cid: str) -> dict | None:
+    """
+    Decode a single claim from claims.ndjson without parsing the rest of the file.
+    """
+    loc = index.get("claims", {}).get(cid)
+    if loc is None:
+        return None
+    offset, length = loc
+    with ndjson_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return json.loads(mm[offset : offset + length].decode("utf-8"))
 
+
+def paginate_claims(claims: list[dict], rows: int = CLAIMS_PAGE_ROWS) -> list[dict]:
+    """
+    Split claims into per-section pages of at most `rows` claims, in document order:
+      {file, section_id, section_label, section_url, page, pages, claims}
+    The first page of a section is claims/<section_id>.html, later ones claims/<section_id>-<n>.html.
+    """
+    by_section: dict[str, list[dict]] = {}
     for c in claims:
-        cid = escape(c["id"])
-        txt = escape(c["text"])
-        sec_label = escape(c.get("section_label", ""))
-        url = escape(c.get("url", ""))
-        line = c.get("line", None)
-        evc = int(c.get("evidence_count", 0))
-
-        date = escape((c.get("date") or c.get("date_raw") or "").strip())
-        title = escape((c.get("title") or "").strip())
-        tags = c.get("tags") or []
-        tags_str = ", ".join(tags)
-        tags_html = escape(tags_str)
-
-        where = sec_label
-        if url:
-            where = f'<a href="./{url}">{where}</a>'
-        if line is not None:
-            where += f" <span style='opacity:.7'>(line {int(line)})</span>"
-
-        links_html = ""
-        links = c.get("links", [])
-        if links:
-            links_html = " ".join(
-                [f'<a href="{escape(u)}" rel="noreferrer noopener">{escape(u)}</a>' for u in links]
+        by_section.setdefault(c.get("section_id") or "no-part", []).append(c)
+
+    pages: list[dict] = []
+    for sid, items in by_section.items():
+        total = (len(items) + rows - 1) // rows
+        for n in range(1, total + 1):
+            pages.append(
+                {
+                    "file": f"{CLAIMS_PAGES_DIR}/{sid}.html" if n == 1 else f"{CLAIMS_PAGES_DIR}/{sid}-{n}.html",
+                    "section_id": sid,
+                    "section_label": items[0].get("section_label", ""),
+                    "section_url": items[0].get("url", ""),
+                    "page": n,
+                    "pages": total,
+                    "claims": items[(n - 1) * rows : n * rows],
+                }
             )
+    return pages
 
-        # Anchor row for deep linking: claims.html#C-...
-        rows.append(
-            f"<tr id='{cid}'>"
-            f"<td style='white-space:nowrap'><a href='./claims.html#{cid}'>{cid}</a></td>"
-            f"<td>{txt}</td>"
-            f"<td style='white-space:nowrap'>{where}</td>"
-            f"<td style='white-space:nowrap'>{date}</td>"
-            f"<td>{title}</td>"
-            f"<td style='white-space:nowrap'>{tags_html}</td>"
-            f"<td style='text-align:right;white-space:nowrap'>{evc}</td>"
-            f"<td>{links_html}</td>"
-            "</tr>"
-        )
 
-    if rows:
+# The claim fields a claims page shows. The page hash covers only these, so a claim that
+# merely moved in source.md (an earlier part grew) does not re-render its section.
+PAGE_FIELDS = ("id", "text", "evidence_count", "date", "date_raw", "title", "tags", "links")
+
+
+def section_pages_hash(doc_title: str, pages: list[dict]) -> str:
+    """
+    Content hash of one section's pages: changes only when what they show (or the renderer) changes.
+    """
+    h = hashlib.sha256(f"{RENDER_HASH}\0{doc_title}\0".encode("utf-8"))
+    for pg in pages:
+        shown = [{k: c.get(k) for k in PAGE_FIELDS} for c in pg["claims"]]
+        head = [pg["file"], pg["pages"], pg["section_label"], pg["section_url"]]
+        h.update(json.dumps([*head, shown], ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _claim_row(c: dict) -> str:
+    cid = escape(c["id"])
+    txt = escape(c["text"])
+    evc = int(c.get("evidence_count", 0))
+
+    date = escape((c.get("date") or c.get("date_raw") or "").strip())
+    title = escape((c.get("title") or "").strip())
+    tags_html = escape(", ".join(c.get("tags") or []))
+
+    # Link text is the host only; the full URL is already in the href.
+    links_html = " ".join(
+        f'<a href="{escape(u)}" rel="noreferrer noopener">{escape(urlsplit(u).netloc or u)}</a>'
+        for u in c.get("links", [])
+    )
+
+    # Anchor row for deep linking: claims/<section>.html#C-...
+    return (
+        f"<tr id='{cid}'>"
+        f"<td style='white-space:nowrap'><a href='#{cid}'>{cid}</a></td>"
+        f"<td>{txt}</td>"
+        f"<td style='white-space:nowrap'>{date}</td>"
+        f"<td>{title}</td>"
+        f"<td style='white-space:nowrap'>{tags_html}</td>"
+        f"<td style='text-align:right;white-space:nowrap'>{evc}</td>"
+        f"<td>{links_html}</td>"
+        "</tr>"
+    )
+
+
+def render_claims_page(doc_title: str, page: dict) -> str:
+    sid = page["section_id"]
+    n, total = page["page"], page["pages"]
+    label = escape(page["section_label"] or sid)
+
+    def page_file(k: int) -> str:
+        return f"{sid}.html" if k == 1 else f"{sid}-{k}.html"
+
+    nav_bits = ['<a href="../index.html">Index</a>', '<a href="../claims.html">Claims</a>']
+    if page["section_url"]:
+        nav_bits.append(f'<a href="../{escape(page["section_url"])}">Section</a>')
+    if n > 1:
+        nav_bits.append(f'<a href="./{escape(page_file(n - 1))}">Prev</a>')
+    if n < total:
+        nav_bits.append(f'<a href="./{escape(page_file(n + 1))}">Next</a>')
+    nav = " | ".join(nav_bits)
+
+    page_note = f" <span style='opacity:.7'>(page {n} of {total})</span>" if total > 1 else ""
+    rows = "\n".join(_claim_row(c) for c in page["claims"])
+
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <title>{escape(doc_title)} - Claims - {label}</title>
+</head>
+<body>
+  <nav>{nav}</nav>
+  <main>
+    <h1>{label}{page_note}</h1>
+    <table border='1' cellspacing='0' cellpadding='6' style='border-collapse:collapse;width:100%'><thead><tr><th>ID</th><th>Claim</th><th>Date</th><th>Title</th><th>Tags</th><th>Evidence</th><th>Links</th></tr></thead><tbody>
+{rows}
+</tbody></table>
+  </main>
+</body>
+</html>
+"""
+
+
+# Old deep links (claims.html#C-...) are forwarded to the page that now holds the claim.
+CLAIMS_REDIRECT_JS = (
+    "(function(){var id=decodeURIComponent(location.hash.slice(1));if(!id)return;"
+    f"fetch('./{CLAIMS_PAGES_DIR}/pages.json').then(function(r){{return r.json();}})"
+    ".then(function(m){var f=(m.claims||{})[id];if(f)location.replace('./'+f+'#'+encodeURIComponent(id));});})();"
+)
+
+
+def render_claims_html(doc_title: str, claims: list[dict]) -> str:
+    """
+    Claims index: per-section counts with links to the section's claim pages.
+    """
+    sections: dict[str, list[dict]] = {}
+    for pg in paginate_claims(claims):
+        sections.setdefault(pg["section_id"], []).append(pg)
+
+    if sections:
+        rows: list[str] = []
+        for sid, pages in sections.items():
+            count = sum(len(pg["claims"]) for pg in pages)
+            label = escape(pages[0]["section_label"] or sid)
+            links = " ".join(f'<a href="./{escape(pg["file"])}">{pg["page"]}</a>' for pg in pages)
+            rows.append(
+                "<tr>"
+                f'<td><a href="./{escape(pages[0]["file"])}">{label}</a></td>'
+                f"<td style='text-align:right'>{count}</td>"
+                f"<td>{links}</td>"
+                "</tr>"
+            )
         body = (
-            "<table border='1' cellspacing='0' cellpadding='6' style='border-collapse:collapse;width:100%'>"
-            "<thead><tr>"
-            "<th>ID</th><th>Claim</th><th>Section</th><th>Date</th><th>Title</th><th>Tags</th><th>Evidence</th><th>Links</th>"
-            "</tr></thead>"
+            f"<p>{len(claims)} claim(s) in {len(sections)} section(s).</p>"
+            "<table border='1' cellspacing='0' cellpadding='6' style='border-collapse:collapse'>"
+            "<thead><tr><th>Section</th><th>Claims</th><th>Pages</th></tr></thead>"
             "<tbody>"
             + "\n".join(rows)
             + "</tbody></table>"
@@ -334,34 +580,86 @@ def render_claims_html(doc_title: str, claims: list[dict]) -> str:
     <ul>
       <li><a href="./claims.json">claims.json</a></li>
       <li><a href="./claims.min.json">claims.min.json</a></li>
+      <li><a href="./claims.min.cols.json">claims.min.cols.json</a> (columnar, interned)</li>
+      <li><a href="./sources.json">sources.json</a> (deduplicated source registry)</li>
+      <li><a href="./claims.ndjson">claims.ndjson</a> (one claim per line; byte ranges in <a href="./claims.ndjson.idx.json">claims.ndjson.idx.json</a>)</li>
+      <li><a href="./{CLAIMS_PAGES_DIR}/pages.json">{CLAIMS_PAGES_DIR}/pages.json</a> (claim id -&gt; page)</li>
     </ul>
     {body}
   </main>
+  <script>{CLAIMS_REDIRECT_JS}</script>
 </body>
 </html>
 """
 
 
-def main(src: str, outdir: str) -> None:
-    src_path = Path(src)
-    out = Path(outdir)
-    out.mkdir(parents=True, exist_ok=True)
+def claims_pages_manifest(doc_title: str, pages: list[dict]) -> dict:
+    """
+    claims/pages.json: per-section content hash and page files, plus the claim id -> page map
+    used by the claims.html redirect.
+    """
+    by_section: dict[str, list[dict]] = {}
+    for pg in pages:
+        by_section.setdefault(pg["section_id"], []).append(pg)
+    return {
+        "rows": CLAIMS_PAGE_ROWS,
+        "sections": {
+            sid: {"hash": section_pages_hash(doc_title, pgs), "pages": [pg["file"] for pg in pgs]}
+            for sid, pgs in by_section.items()
+        },
+        "claims": {c["id"]: pg["file"] for pg in pages for c in pg["claims"]},
+    }
+
+
+def write_claims_pages(out: Path, doc_title: str, claims: list[dict]) -> tuple[int, int, int]:
+    """
+    Render claims/<section>[-n].html, re-rendering a section only when its hash changed.
+    Pages listed in the previous manifest but no longer produced are removed.
+    Returns (sections rendered, sections unchanged, pages removed).
+    """
+    pages = paginate_claims(claims)
+    manifest = claims_pages_manifest(doc_title, pages)
+
+    pages_dir = out / CLAIMS_PAGES_DIR
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = pages_dir / "pages.json"
+
+    previous: dict = {}
+    if manifest_path.exists():
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("sections", {})
+        except (OSError, ValueError):
+            previous = {}
+
+    rendered = unchanged = 0
+    for sid, entry in manifest["sections"].items():
+        prev = previous.get(sid)
+        if prev and prev.get("hash") == entry["hash"] and all((out / f).exists() for f in entry["pages"]):
+            unchanged += 1
+            continue
+        for pg in pages:
+            if pg["section_id"] == sid:
+                (out / pg["file"]).write_text(render_claims_page(doc_title, pg), encoding="utf-8")
+        rendered += 1
 
-    text = src_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
+    live = {f for entry in manifest["sections"].values() for f in entry["pages"]}
+    stale = {f for entry in previous.values() for f in entry.get("pages", [])} - live
+    for f in stale:
+        (out / f).unlink(missing_ok=True)
 
-    doc_title = pick_doc_title(lines)
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    return rendered, unchanged, len(stale)
 
-    # Expect dossier/source.md next to dossier/parts
-    parts_dir = src_path.parent / "parts"
-    parts_index = load_parts_index(parts_dir)
 
-    claims: list[dict] = []
-    claims_min: list[dict] = []
+def extract_claims(lines: list[str], parts_index: dict[str, Section]) -> list[Claim]:
+    """
+    Run the claim tokenizer over source.md lines and return the ledger in document order.
+    parts_index maps part file names (from BEGIN markers) to section meta.
+    """
+    claims: list[Claim] = []
     section_counts: dict[str, int] = {}
 
-    current_part_name: str | None = None
-    current_part_meta: dict | None = None
+    current_part_meta: Section | None = None
 
     def push_claim(
         *,
@@ -369,8 +667,6 @@ def main(src: str, outdir: str) -> None:
         evidence_text: str,
         line_no: int,
     ) -> None:
-        nonlocal claims, claims_min, section_counts, current_part_meta
-
         sec_id, sec_label, url = _section_fields(current_part_meta)
 
         section_counts.setdefault(sec_id, 0)
@@ -381,129 +677,129 @@ def main(src: str, outdir: str) -> None:
 
         # links should still come from raw evidence_text (so DATE/TITLE/NOTE lines don't matter)
         links = _unique_urls(evidence_text if evidence_text else claim_text)
-        evidence_count = len(links)
 
         claims.append(
-            {
-                "id": cid,
-                "text": claim_text.strip(),
-                "evidence": cleaned_evidence.strip(),
-                "evidence_count": evidence_count,
-                "links": links,
-                "section_id": sec_id,
-                "section_label": sec_label,
-                "url": url,
-                "line": line_no,
-
+            Claim(
+                id=cid,
+                text=claim_text.strip(),
+                evidence=cleaned_evidence.strip(),
+                evidence_count=len(links),
+                links=links,
+                section_id=sec_id,
+                section_label=sec_label,
+                url=url,
+                line=line_no,
                 # event fields (optional)
-                "date": event_meta.get("date", ""),
-                "date_raw": event_meta.get("date_raw", ""),
-                "title": event_meta.get("title", ""),
-                "tags": event_meta.get("tags", []),
-                "note": event_meta.get("note", ""),
-            }
+                date=event_meta.get("date", ""),
+                date_raw=event_meta.get("date_raw", ""),
+                title=event_meta.get("title", ""),
+                tags=event_meta.get("tags", []),
+                note=event_meta.get("note", ""),
+            )
         )
 
-        claims_min.append(
-            {
-                "id": cid,
-                "u": url,
-                "t": " ".join(claim_text.split()),
-                "ec": evidence_count,
-                "d": event_meta.get("date", ""),
-                "ti": event_meta.get("title", ""),
-                "tg": event_meta.get("tags", []),
-            }
-        )
+    for tok in tokenize_claims(lines):
+        if tok.kind == "part":
+            current_part_meta = parts_index.get(tok.text)
+        elif tok.kind == "block":
+            # For blocks, treat entire block as both claim and evidence container.
+            push_claim(claim_text=tok.text, evidence_text=tok.text, line_no=tok.line_no)
+        else:
+            push_claim(claim_text=tok.text, evidence_text=tok.evidence_text, line_no=tok.line_no)
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    return claims
 
-        m_begin = BEGIN_PART_RE.match(line)
-        if m_begin:
-            current_part_name = m_begin.group(1).strip()
-            current_part_meta = parts_index.get(current_part_name)
-            i += 1
-            continue
 
-        # 1) Block claim
-        if CLAIM_BLOCK_START_RE.match(line):
-            start_line_no = i + 1
-            block_lines: list[str] = []
-            i += 1
-            while i < len(lines) and not CLAIM_BLOCK_END_RE.match(lines[i]):
-                block_lines.append(lines[i])
-                i += 1
-            if i < len(lines) and CLAIM_BLOCK_END_RE.match(lines[i]):
-                i += 1
+def load_claim_history(path: Path) -> dict[str, dict]:
+    """
+    claim_key -> {first_seen, last_changed, ...} from tools/claim_history.py. Empty if the
+    index has not been built (no git checkout), so the fields are just left blank.
+    """
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("claims", {})
+    except (OSError, ValueError):
+        return {}
 
-            claim_text = "\n".join(block_lines).strip()
-            if claim_text:
-                # For blocks, treat entire block as both claim and evidence container.
-                push_claim(claim_text=claim_text, evidence_text=claim_text, line_no=start_line_no)
-            continue
 
-        # 2) Inline [C] suffix claim
-        m_c = C_SUFFIX_RE.match(line)
-        if m_c:
-            start_line_no = i + 1
-            claim_text = m_c.group(1).strip()
+def apply_history(ledger: list[Claim], history: dict[str, dict]) -> None:
+    for c in ledger:
+        h = history.get(claim_key(c.text))
+        if h:
+            c.first_seen = h["first_seen"]
+            c.last_changed = h["last_changed"]
 
-            # Evidence is the following lines until a blank line.
-            # Safety stop: if a new claim begins before a blank line, stop there too.
-            evidence_lines: list[str] = []
-            i += 1
-            while i < len(lines):
-                nxt = lines[i]
-                if nxt.strip() == "":
-                    break
-                if CLAIM_BLOCK_START_RE.match(nxt) or CLAIM_LINE_RE.match(nxt) or C_SUFFIX_RE.match(nxt):
-                    break
-                evidence_lines.append(nxt.rstrip())
-                i += 1
 
-            # consume optional blank line
-            if i < len(lines) and lines[i].strip() == "":
-                i += 1
+def attach_sources(ledger: list[Claim]) -> tuple[list[dict], list[dict]]:
+    """
+    Build the global source registry and set source_ids on every claim.
+    Returns (claims.json records, sources.json entries).
+    """
+    sources, source_ids = build_registry(ledger)
+    for c in ledger:
+        c.source_ids = tuple(source_ids.get(c.id, ()))
+    return [c.to_json() for c in ledger], [s.to_json() for s in sources]
 
-            evidence_text = "\n".join(evidence_lines).strip()
-            if claim_text:
-                push_claim(claim_text=claim_text, evidence_text=evidence_text, line_no=start_line_no)
-            continue
 
-        # 3) Single-line CLAIM: or [CLAIM] text
-        m_line = CLAIM_LINE_RE.match(line)
-        if m_line:
-            start_line_no = i + 1
-            claim_text = m_line.group(1).strip()
-            if claim_text:
-                push_claim(claim_text=claim_text, evidence_text="", line_no=start_line_no)
-            i += 1
-            continue
+def main(src: str, outdir: str, parts: str | None = None) -> None:
+    src_path = Path(src)
+    out = Path(outdir)
+    out.mkdir(parents=True, exist_ok=True)
 
-        i += 1
+    text = src_path.read_text(encoding="utf-8")
+    lines = text.splitlines()
+
+    doc_title = pick_doc_title(lines)
+
+    # Default: dossier/source.md next to dossier/parts
+    parts_dir = Path(parts) if parts else src_path.parent / "parts"
+    parts_index = load_parts_index(parts_dir)
+
+    ledger = extract_claims(lines, parts_index)
+    apply_history(ledger, load_claim_history(src_path.parent / ".cache" / "claim_history.json"))
+
+    # Global source registry: claims reference canonical sources by id.
+    claims, sources = attach_sources(ledger)
 
     (out / "claims.json").write_text(
-        json.dumps(claims, ensure_ascii=False, indent=2),
+        dumps_claims(ledger),
         encoding="utf-8",
     )
     (out / "claims.min.json").write_text(
-        json.dumps(claims_min, ensure_ascii=False, separators=(",", ":")),
+        dumps_claims_min(ledger),
         encoding="utf-8",
     )
+    (out / "claims.min.cols.json").write_text(
+        dumps_columnar(encode_columnar([c.to_min_json() for c in ledger])),
+        encoding="utf-8",
+    )
+    write_claims_ndjson(claims, out / "claims.ndjson", out / "claims.ndjson.idx.json")
     (out / "claims.html").write_text(
         render_claims_html(doc_title, claims),
         encoding="utf-8",
     )
+    rendered, unchanged, removed = write_claims_pages(out, doc_title, claims)
+
+    (out / "sources.json").write_text(
+        json.dumps(sources, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
 
     print(f"Wrote {out / 'claims.json'} ({len(claims)} claims)")
-    print(f"Wrote {out / 'claims.min.json'} ({len(claims_min)} claims)")
+    print(f"Wrote {out / 'sources.json'} ({len(sources)} sources)")
+    print(f"Wrote {out / 'claims.min.json'} ({len(ledger)} claims)")
+    print(f"Wrote {out / 'claims.min.cols.json'} (columnar)")
+    print(f"Wrote {out / 'claims.ndjson'} (+ claims.ndjson.idx.json)")
     print(f"Wrote {out / 'claims.html'}")
+    print(
+        f"Wrote {out / CLAIMS_PAGES_DIR} ({rendered} section(s) rendered, {unchanged} unchanged, "
+        f"{removed} stale page(s) removed)"
+    )
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python tools/build_claims.py <source.md> <output_dir>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python tools/build_claims.py <source.md> <output_dir> [<parts_dir>]")
         sys.exit(1)
-    main(sys.argv[1], sys.argv[2])
+    main(*sys.argv[1:])
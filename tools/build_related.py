@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# tools/build_related.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+
+from split_dossier import RELATED_FILE, page_title_for, part_item
+
+try:  # optional: vectorized similarity; the pure-Python path gives the same neighbours
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+DEFAULT_CACHE = Path("dossier/.cache/related.json")
+DEFAULT_K = 5
+
+# Neighbours below this cosine are noise (shared boilerplate words), not related sections.
+MIN_SCORE = 0.05
+
+# Term weights: keywords and claim tags are curated, so they count for more than body words.
+KEYWORD_WEIGHT = 3
+TAG_WEIGHT = 2
+
+WORD_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+STOPWORDS = frozenset(
+    """
+    the and for are but not you all any can had her was one our out has him his how its may new now
+    old see two who did get let put say she too use that with have this will your from they been
+    were said each which their there what about would these other into more some than them then
+    also only over such when where while after before because being both could does most must
+    very just like make made many much should those through under until upon what whom why
+    """.split()
+)
+
+# Cached term counts are only valid for the tokenizer and weights that produced them.
+RULES_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def terms(body: str, keywords: list[str], tags: list[str]) -> dict[str, int]:
+    """
+    Raw term counts for one section. Tags are kept whole ("#tag") so "doj-probe" does not
+    collide with the body word "probe".
+    """
+    counts: dict[str, int] = {}
+    for w in WORD_RE.findall(body.lower()):
+        if w not in STOPWORDS:
+            counts[w] = counts.get(w, 0) + 1
+    for kw in keywords:
+        for w in WORD_RE.findall(str(kw).lower()):
+            if w not in STOPWORDS:
+                counts[w] = counts.get(w, 0) + KEYWORD_WEIGHT
+    for t in tags:
+        key = f"#{t.lower()}"
+        counts[key] = counts.get(key, 0) + TAG_WEIGHT
+    return counts
+
+
+def tfidf(docs: list[dict[str, int]]) -> list[dict[str, float]]:
+    """
+    Sublinear tf * smoothed idf, L2-normalized, as sparse dicts.
+    """
+    n = len(docs)
+    df: dict[str, int] = {}
+    for d in docs:
+        for t in d:
+            df[t] = df.get(t, 0) + 1
+    idf = {t: math.log((1 + n) / (1 + c)) + 1.0 for t, c in df.items()}
+
+    out: list[dict[str, float]] = []
+    for d in docs:
+        vec = {t: (1.0 + math.log(c)) * idf[t] for t, c in d.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        out.append({t: v / norm for t, v in vec.items()})
+    return out
+
+
+def similarity(vecs: list[dict[str, float]]) -> list[list[float]]:
+    n = len(vecs)
+    if np is not None and n:
+        vocab = {t: i for i, t in enumerate(sorted({t for v in vecs for t in v}))}
+        m = np.zeros((n, len(vocab)), dtype=np.float64)
+        for row, v in enumerate(vecs):
+            for t, w in v.items():
+                m[row, vocab[t]] = w
+        return (m @ m.T).tolist()
+
+    sims = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        sims[i][i] = 1.0
+        a = vecs[i]
+        for j in range(i + 1, n):
+            b = vecs[j]
+            small, big = (a, b) if len(a) <= len(b) else (b, a)
+            s = sum(w * big.get(t, 0.0) for t, w in small.items())
+            sims[i][j] = sims[j][i] = s
+    return sims
+
+
+def top_k(sims: list[list[float]], sections: list[dict], k: int) -> dict[str, list[dict]]:
+    out: dict[str, list[dict]] = {}
+    for i, sec in enumerate(sections):
+        ranked = sorted(
+            ((round(sims[i][j], 4), sections[j]["id"], j) for j in range(len(sections)) if j != i),
+            key=lambda x: (-x[0], x[1]),
+        )
+        out[sec["id"]] = [
+            {"id": sections[j]["id"], "title": sections[j]["title"], "url": sections[j]["url"], "score": score}
+            for score, _sid, j in ranked[:k]
+            if score >= MIN_SCORE
+        ]
+    return out
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("rules") != RULES_HASH:
+        return {}
+    return data.get("parts", {})
+
+
+def save_cache(path: Path, parts: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"rules": RULES_HASH, "parts": parts}, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def build_related(parts_dir: Path, claims: list[dict], cache: dict[str, dict], k: int) -> tuple[dict, int]:
+    """
+    Related-section graph for the parts in parts_dir. Returns (related.json payload,
+    sections tokenized); see related_graph().
+    """
+    parts = []
+    for p in sorted(x for x in parts_dir.glob("*.md") if x.is_file()):
+        raw = p.read_text(encoding="utf-8")
+        parts.append((raw, part_item(p.stem, raw)))
+    return related_graph(parts, claims, cache, k)
+
+
+def related_graph(parts: list[tuple[str, dict]], claims: list[dict], cache: dict[str, dict], k: int) -> tuple[dict, int]:
+    """
+    Related-section graph for (raw text, split_dossier.part_item()) pairs. cache maps a
+    part's content hash (text + its claims' tags) to its term counts and is updated in
+    place, so only changed sections are re-tokenized.
+    """
+    tags_by_section: dict[str, list[str]] = {}
+    for c in claims:
+        tags_by_section.setdefault(c.get("section_id", ""), []).extend(c.get("tags") or [])
+
+    sections: list[dict] = []
+    docs: list[dict[str, int]] = []
+    fresh = 0
+    live: set[str] = set()
+    for raw, item in parts:
+        sid = item["id"]
+        tags = sorted(tags_by_section.get(sid, []))
+        key = hashlib.sha256(f"{raw}\0{json.dumps(tags)}".encode("utf-8")).hexdigest()
+        live.add(key)
+        entry = cache.get(key)
+        if entry is None:
+            keywords = item["meta"]["keywords"] or []
+            if isinstance(keywords, str):
+                keywords = [keywords]
+            entry = cache[key] = {"terms": terms(item["clean"], keywords, tags)}
+            fresh += 1
+        sections.append(
+            {"id": sid, "order": item["order"], "title": page_title_for(item["meta"]), "url": item["meta"]["url"]}
+        )
+        docs.append(entry["terms"])
+
+    for key in [k_ for k_ in cache if k_ not in live]:
+        del cache[key]
+
+    order = sorted(range(len(sections)), key=lambda i: (sections[i]["order"], sections[i]["id"]))
+    sections = [sections[i] for i in order]
+    docs = [docs[i] for i in order]
+
+    graph = top_k(similarity(tfidf(docs)), sections, k)
+    return {"version": 1, "k": k, "sections": graph}, fresh
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compute related sections from TF-IDF similarity.")
+    parser.add_argument("parts", type=Path, help="Parts dir, e.g. dossier/parts")
+    parser.add_argument("site", type=Path, help="Site dir holding claims.json; related.json is written here")
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help=f"Neighbours per section (default: {DEFAULT_K})")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Term-count cache (default: {DEFAULT_CACHE})")
+    args = parser.parse_args()
+
+    claims_json = args.site / "claims.json"
+    claims = json.loads(claims_json.read_text(encoding="utf-8")) if claims_json.exists() else []
+
+    cache = load_cache(args.cache)
+    payload, fresh = build_related(args.parts, claims, cache, args.k)
+    save_cache(args.cache, cache)
+
+    args.site.mkdir(parents=True, exist_ok=True)
+    out = args.site / RELATED_FILE
+    text = json.dumps(payload, ensure_ascii=False, indent=2)
+    if not out.exists() or out.read_text(encoding="utf-8") != text:
+        out.write_text(text, encoding="utf-8")
+    backend = "numpy" if np is not None else "python"
+    print(f"Wrote {out} ({len(payload['sections'])} sections, {fresh} re-tokenized, {backend})")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -45,14 +46,14 @@ def parse_front_matter(text: str) -> tuple[dict, str]:
         if not line.strip():
             continue
 
-        m_item = re.match(r"^\s*-\s*(.+?)\s*$", line)
+        m_item = re.match(r"^\s*-\s*(.+)$", line)
         if m_item and cur_key:
             meta.setdefault(cur_key, [])
             if isinstance(meta[cur_key], list):
                 meta[cur_key].append(m_item.group(1))
             continue
 
-        m_kv = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*?)\s*$", line)
+        m_kv = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*)$", line)
         if m_kv:
             key = m_kv.group(1)
             val = m_kv.group(2)
@@ -79,45 +80,37 @@ def truthy(v: object) -> bool:
     return s in {"true", "1", "yes", "y", "on"}
 
 
-def main() -> None:
-    PARTS_DIR.mkdir(parents=True, exist_ok=True)
-
-    part_files = sorted([p for p in PARTS_DIR.glob("*.md") if p.is_file()])
-    if not part_files:
-        raise SystemExit(f"No parts found in {PARTS_DIR}. Add at least one .md file.")
-
-    parts: list[dict] = []
-
-    for p in part_files:
-        raw = p.read_text(encoding="utf-8")
+def part_entry(path: Path, raw: str) -> dict | None:
+    """
+    {path, order, title, body} for one part, or None if it is excluded or empty.
+    """
+    meta, body = parse_front_matter(raw)
 
-        meta, body = parse_front_matter(raw)
+    # Allow excluding a part from the merged source.md
+    if truthy(meta.get("exclude_from_source", False)):
+        return None
 
-        # Allow excluding a part from the merged source.md
-        if truthy(meta.get("exclude_from_source", False)):
-            continue
+    order = meta.get("order", "999999")
+    title = meta.get("title", path.stem)
 
-        order = meta.get("order", "999999")
-        title = meta.get("title", p.stem)
+    body = norm_ws(body)
+    if not body.strip():
+        return None
 
-        body = norm_ws(body)
-        if not body.strip():
-            continue
+    return {
+        "path": path,
+        "order": str(order),
+        "title": str(title),
+        "body": body,
+    }
 
-        parts.append(
-            {
-                "path": p,
-                "order": str(order),
-                "title": str(title),
-                "body": body,
-            }
-        )
 
+def render_source(parts: list[dict], title: str = DOC_TITLE) -> str:
     # Sort by YAML order, then filename as stable fallback
-    parts.sort(key=lambda x: (x["order"], x["path"].name))
+    parts = sorted(parts, key=lambda x: (x["order"], x["path"].name))
 
     chunks: list[str] = []
-    chunks.append(DOC_TITLE.strip() + "\n")
+    chunks.append(title.strip() + "\n")
 
     # IMPORTANT:
     # We insert a divider BETWEEN parts for readability and for the single-file splitter heuristic.
@@ -133,9 +126,28 @@ def main() -> None:
         chunks.append(body)
         chunks.append(f"\n<!-- END {p.name} -->\n")
 
-    OUT_FILE.write_text("".join(chunks).strip() + "\n", encoding="utf-8")
-    print(f"Wrote {OUT_FILE} from {len(parts)} part(s).")
+    return "".join(chunks).strip() + "\n"
+
+
+def main(parts_dir: Path = PARTS_DIR, out_file: Path = OUT_FILE, title: str = DOC_TITLE) -> None:
+    parts_dir.mkdir(parents=True, exist_ok=True)
+
+    part_files = sorted([p for p in parts_dir.glob("*.md") if p.is_file()])
+    if not part_files:
+        raise SystemExit(f"No parts found in {parts_dir}. Add at least one .md file.")
+
+    parts = [e for e in (part_entry(p, p.read_text(encoding="utf-8")) for p in part_files) if e]
+
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_text(render_source(parts, title), encoding="utf-8")
+    print(f"Wrote {out_file} from {len(parts)} part(s).")
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 1:
+        main()
+    elif len(sys.argv) in (3, 4):
+        main(Path(sys.argv[1]), Path(sys.argv[2]), *sys.argv[3:])
+    else:
+        print("Usage: python tools/build_source.py [<parts_dir> <source.md> [<title>]]")
+        sys.exit(1)
@@ -1,25 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import sys
 from html import escape
 from pathlib import Path
 
+from parse_cache import cached
+
 
 # Keep these regexes EXACTLY aligned with split_dossier.py
-NUM_HEADING_RE = re.compile(r"^\s*(\d+)\.\s+(.+?)\s*$")
-MD_HEADING_RE = re.compile(r"^\s*(#{1,6})\s+(.+?)\s*$")
+NUM_HEADING_RE = re.compile(r"^\s*(\d+)\.\s+(\S(?:.*\S)?)\s*$")
+MD_HEADING_RE = re.compile(r"^\s*(#{1,6})\s+(\S(?:.*\S)?)\s*$")
 DIVIDER_RE = re.compile(r"^\s*(?:⸻+|[-_]{3,}|={3,})\s*$")
 
 CLAIM_BLOCK_START_RE = re.compile(r"^\s*(?:[-*]\s*)?\[(?i:claim)\]\s*$")
 CLAIM_BLOCK_END_RE = re.compile(r"^\s*\[/(?i:claim)\]\s*$")
 CLAIM_LINE_RE = re.compile(
-    r"^\s*(?:[-*]\s*)?(?:\[(?i:claim)\]\s*|(?i:claim)\s*:\s*).+?\s*$"
+    r"^\s*(?:[-*]\s*)?(?:\[(?i:claim)\]|(?i:claim)\s*:)."
 )
 
-C_MARKER_RE = re.compile(r"\s*\[(?i:c)\]\s*")
+C_MARKER_RE = re.compile(r"(?:(?<!\s)\s*)?\[(?i:c)\]\s*")
 EVIDENCE_HEADER_RE = re.compile(
-    r"^\s*(?i:(evidence|links|sources|verification paths?|verify|citations))\s*:?\s*(?:\(.*\))?\s*$"
+    r"^\s*(?i:(evidence|links|sources|verification paths?|verify|citations))\s*(?::\s*)?(?:\(.*\)\s*)?$"
 )
 
 
@@ -38,6 +42,10 @@ def _looks_like_section_boundary(line: str) -> bool:
 
 
 def strip_claims(text: str) -> str:
+    return "\n".join(strip_claim_lines(text.splitlines())[0]).strip() + "\n"
+
+
+def strip_claim_lines(lines: list[str]) -> tuple[list[str], bool]:
     """
     Clean human-facing pages:
       - Removes [CLAIM]...[/CLAIM] blocks and single-line CLAIM markers
@@ -47,8 +55,9 @@ def strip_claims(text: str) -> str:
           * the next claim marker ([C], CLAIM:, [CLAIM] block), OR
           * a new section boundary (heading/divider)
       - Also strips standalone Evidence/Links/Sources blocks.
+    Returns (output lines, settled): settled is False if the input ended inside a claim
+    block or while hiding evidence, i.e. the lines that follow would be stripped differently.
     """
-    lines = text.splitlines()
     out: list[str] = []
 
     def is_boundary(s: str) -> bool:
@@ -72,8 +81,9 @@ def strip_claims(text: str) -> str:
             i += 1
             while i < len(lines) and not CLAIM_BLOCK_END_RE.match(lines[i]):
                 i += 1
-            if i < len(lines) and CLAIM_BLOCK_END_RE.match(lines[i]):
-                i += 1
+            if i >= len(lines):
+                return out, False
+            i += 1
             skip_after_c = False
             continue
 
@@ -114,8 +124,10 @@ def strip_claims(text: str) -> str:
                 if is_boundary(lines[i]) or is_claim_start(lines[i]):
                     break
                 i += 1
+            if i >= len(lines):
+                return out, False
 
-            if i < len(lines) and not lines[i].strip():
+            if not lines[i].strip():
                 if out and out[-1].strip():
                     out.append("")
                 i += 1
@@ -134,10 +146,13 @@ def strip_claims(text: str) -> str:
 
         i += 1
 
-    return "\n".join(out).strip() + "\n"
+    return out, not skip_after_c
 
 
-def render_source_html(doc_title: str, body_text: str) -> str:
+def page_frame(doc_title: str) -> tuple[str, str]:
+    """
+    The page around the stripped text: (everything up to <pre>, everything after it).
+    """
     nav = "\n".join(
         [
             "<nav>",
@@ -148,7 +163,7 @@ def render_source_html(doc_title: str, body_text: str) -> str:
         ]
     )
 
-    return "\n".join(
+    head = "\n".join(
         [
             "<!doctype html>",
             '<html lang="en">',
@@ -163,32 +178,145 @@ def render_source_html(doc_title: str, body_text: str) -> str:
             f"<h1>{escape(doc_title)} (Source)</h1>",
             "<p>Built from <code>dossier/source.md</code>. Claim evidence blocks are hidden for human reading.</p>",
             '<pre style="white-space:pre-wrap;line-height:1.35">',
-            escape(body_text),
+        ]
+    )
+    tail = "\n".join(
+        [
             "</pre>",
             "</main>",
             "</body>",
             "</html>",
         ]
     )
+    return head + "\n", "\n" + tail
+
+
+def render_source_html(doc_title: str, body_text: str) -> str:
+    head, tail = page_frame(doc_title)
+    return head + escape(body_text) + tail
+
 
+# -----------------------------
+# Per-part composition
+# -----------------------------
+# source.md is the title, then one "<!-- BEGIN part.md -->" ... "<!-- END part.md -->" run per
+# part with dividers between them (build_source.render_source). Every run starts on its
+# BEGIN line in the stripper's normal state, so stripping runs one at a time and joining
+# the results gives the same text as stripping the whole file, as long as no run leaves the
+# stripper mid-block (checked per run; any such run falls back to a whole-file strip).
+# Stripped runs are cached by content hash, so an edit to one part re-strips one run.
+PART_BEGIN_RE = re.compile(r"^<!-- BEGIN .+ -->$")
 
-def main(src_md: str, out_html: str) -> None:
+DEFAULT_CACHE_NAME = "source_html.json"
+
+# Cached runs are only valid for the stripping rules that produced them.
+RULES_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def split_runs(text: str) -> list[str]:
+    runs: list[list[str]] = [[]]
+    for line in text.splitlines():
+        if PART_BEGIN_RE.match(line) and runs[-1]:
+            runs.append([])
+        runs[-1].append(line)
+    return ["\n".join(r) for r in runs if r]
+
+
+def _strip_run(run: str) -> tuple[str | None, bool]:
+    # None (not "") for a run that strips to no lines at all, so joining skips it
+    out, settled = strip_claim_lines(run.split("\n"))
+    return ("\n".join(out) if out else None), settled
+
+
+def load_cache(path: Path) -> dict[str, list]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("rules") != RULES_HASH:
+        return {}
+    return data.get("runs", {})
+
+
+def save_cache(path: Path, runs: dict[str, list]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"rules": RULES_HASH, "runs": runs}, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def stripped_pieces(text: str, cache: dict[str, list] | None = None) -> tuple[list[str], int]:
+    """
+    strip_claims(text) as a list of pieces to be written back to back. cache maps a run's
+    content hash to its [stripped text or None, settled] and is updated in place (only live runs
+    are kept). Returns (pieces, runs stripped afresh).
+    """
+    cache = {} if cache is None else cache
+    runs = split_runs(text)
+    stripped: list[str] = []
+    fresh = 0
+    live: dict[str, list] = {}
+    for i, run in enumerate(runs):
+        key = hashlib.sha256(run.encode("utf-8")).hexdigest()
+        hit = cache.get(key)
+        if hit is None:
+            hit = list(cached("build_source_html.run", run, _strip_run))
+            fresh += 1
+        live[key] = hit
+        if not hit[1] and i < len(runs) - 1:
+            cache.clear()
+            cache.update(live)
+            return [strip_claims(text)], fresh
+        if hit[0] is not None:
+            stripped.append(hit[0])
+    cache.clear()
+    cache.update(live)
+
+    # runs are joined by newlines, then the whole text is trimmed as strip_claims does
+    pieces: list[str] = []
+    for i, s in enumerate(stripped):
+        pieces.append(s if i == 0 else "\n" + s)
+    while pieces and not pieces[0].strip():
+        pieces.pop(0)
+    while pieces and not pieces[-1].strip():
+        pieces.pop()
+    if not pieces:
+        return ["\n"], fresh
+    pieces[0] = pieces[0].lstrip()
+    pieces[-1] = pieces[-1].rstrip() + "\n"
+    return pieces, fresh
+
+
+def main(src_md: str, out_html: str, cache_file: str | None = None) -> None:
     src_path = Path(src_md)
     out_path = Path(out_html)
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path = Path(cache_file) if cache_file else src_path.parent / ".cache" / DEFAULT_CACHE_NAME
 
     text = src_path.read_text(encoding="utf-8")
     doc_title = pick_doc_title(text.splitlines())
 
-    clean = strip_claims(text)
-    html = render_source_html(doc_title, clean)
-    out_path.write_text(html, encoding="utf-8")
+    cache = load_cache(cache_path)
+    pieces, fresh = stripped_pieces(text, cache)
+    save_cache(cache_path, cache)
+
+    # escape() is per character, so escaping piece by piece equals escaping the whole text
+    head, tail = page_frame(doc_title)
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(head)
+        for piece in pieces:
+            f.write(escape(piece))
+        f.write(tail)
+    tmp.replace(out_path)
 
-    print(f"Wrote {out_path}")
+    print(f"Wrote {out_path} ({len(cache)} part run(s), {fresh} re-stripped)")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python tools/build_source_html.py <source.md> <out.html>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python tools/build_source_html.py <source.md> <out.html> [<cache.json>]")
         sys.exit(1)
-    main(sys.argv[1], sys.argv[2])
+    main(*sys.argv[1:])
@@ -0,0 +1,118 @@
+# tools/build_sources.py
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from dossier_model import Claim, Source
+
+
+# Query parameters that only track the click and never change the document.
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "mc_cid",
+    "mc_eid",
+    "igshid",
+    "ref_src",
+    "_hsenc",
+    "_hsmi",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _is_tracking_param(key: str) -> bool:
+    k = key.lower()
+    return k in TRACKING_PARAMS or k.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form used to dedup sources across claims:
+      - lowercase scheme and host, drop default ports
+      - drop tracking query parameters and the fragment
+      - drop a trailing slash (except for the bare root path)
+    Path and remaining query order are kept as-is; servers may care about both.
+    """
+    raw = (url or "").strip()
+    parts = urlsplit(raw)
+    if not parts.scheme or not parts.netloc:
+        return raw
+
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        # out-of-range or non-numeric port: not a URL we can normalize, keep it as written
+        return raw
+
+    # rebuilt from netloc rather than .hostname, which drops an IPv6 literal's brackets
+    userinfo, at, hostport = parts.netloc.rpartition("@")
+    if hostport.startswith("["):
+        host = hostport[: hostport.find("]") + 1]
+    else:
+        host = hostport.split(":", 1)[0]
+    netloc = f"{userinfo}{at}{host.lower()}"
+    if port is not None and str(port) != DEFAULT_PORTS.get(scheme):
+        netloc += f":{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    # filter raw "k=v" pairs so the remaining query keeps its original encoding
+    query = "&".join(
+        pair for pair in parts.query.split("&") if pair and not _is_tracking_param(pair.split("=", 1)[0])
+    )
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def source_id(canonical: str) -> str:
+    # Content-derived so ids stay stable as claims are added or reordered.
+    return "S-" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:10]
+
+
+def build_registry(claims: list[Claim]) -> tuple[list[Source], dict[str, list[str]]]:
+    """
+    Returns (sources, source_ids_by_claim).
+    sources is ordered by first appearance in the ledger:
+      {id, url, canonical, variants, first_seen, claims}
+    url is the first spelling seen (what links open); variants are other spellings.
+    """
+    by_canon: dict[str, Source] = {}
+    ids_by_claim: dict[str, list[str]] = {}
+
+    for c in claims:
+        cid = c.id
+        refs: list[str] = []
+        for u in c.links:
+            canon = canonicalize_url(u)
+            src = by_canon.get(canon)
+            if src is None:
+                src = Source(id=source_id(canon), url=u, canonical=canon, first_seen=cid)
+                by_canon[canon] = src
+            elif u != src.url and u not in src.variants:
+                src.variants.append(u)
+            if src.id not in refs:
+                refs.append(src.id)
+            if not src.claims or src.claims[-1] != cid:
+                src.claims.append(cid)
+        ids_by_claim[cid] = refs
+
+    return list(by_canon.values()), ids_by_claim
+
+
+def load_sources(sources_json: Path) -> dict[str, dict]:
+    """
+    Map source id -> registry entry; empty if sources.json has not been built.
+    """
+    if not sources_json.exists():
+        return {}
+    return {s["id"]: s for s in json.loads(sources_json.read_text(encoding="utf-8"))}
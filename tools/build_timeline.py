@@ -8,13 +8,16 @@ from collections import defaultdict
 from html import escape
 from pathlib import Path
 
+from build_sources import load_sources
+from dossier_model import Claim, Event
+
 
 CLAIM_SHORT_RE = re.compile(r"^(C-\d+)", re.IGNORECASE)          # C-08 from C-08-...
 SECTION_NUM_RE = re.compile(r"^\s*(\d+)\s*(?:[.)]|$)")           # 8 from "8. Title" or "8) Title"
 
 
-def load_claims(claims_json: Path) -> list[dict]:
-    return json.loads(claims_json.read_text(encoding="utf-8"))
+def load_claims(claims_json: Path) -> list[Claim]:
+    return [Claim.from_json(c) for c in json.loads(claims_json.read_text(encoding="utf-8"))]
 
 
 def _short_claim_id(claim_id: str) -> str:
@@ -28,48 +31,187 @@ def _section_number(section_label: str) -> str:
     return m.group(1) if m else ""
 
 
-def build_events(claims: list[dict]) -> list[dict]:
-    events: list[dict] = []
+def month_of(date: str) -> str:
+    return date[:7]
+
+
+def build_events(claims: list[Claim]) -> list[Event]:
+    """
+    Dated claims as timeline events. Events point at their claim by id; claim text
+    and links stay in claims.json / sources.json.
+    """
+    events: list[Event] = []
     for c in claims:
-        date = (c.get("date") or "").strip()
-        title = (c.get("title") or "").strip()
+        date = c.date.strip()
+        title = c.title.strip()
         if not date:
             continue  # only timeline claims
 
         if not title:
-            txt = " ".join((c.get("text") or "").split())
+            txt = " ".join(c.text.split())
             title = txt[:120] + ("…" if len(txt) > 120 else "")
 
-        sec_label = (c.get("section_label") or "").strip()
-
         events.append(
-            {
-                "date": date,
-                "title": title,
-                "id": c["id"],
-                "claim": c.get("text", ""),
-                "tags": c.get("tags", []),
-                "note": c.get("note", ""),
-                "section_url": c.get("url", ""),
-                "section_label": sec_label,
-                "section_num": _section_number(sec_label),
-                "claim_url": f"claims.html#{c['id']}",
-                "claim_short": _short_claim_id(c["id"]),
-                "links": c.get("links", []),
-            }
+            Event(
+                date=date,
+                title=title,
+                id=c.id,
+                claim_short=_short_claim_id(c.id),
+                tags=c.tags,
+                note=c.note,
+                section_url=c.url,
+                section_num=_section_number(c.section_label),
+                source_ids=c.source_ids,
+            )
         )
 
-    events.sort(key=lambda e: (e["date"], e["id"]))
+    events.sort(key=lambda e: (e.date, e.id))
     return events
 
 
-def render_html(events: list[dict]) -> str:
-    by_day: dict[str, list[dict]] = defaultdict(list)
+def shard_events(events: list[Event], sources: dict[str, dict]) -> dict[str, dict]:
+    """
+    Group events by YYYY-MM. Each shard carries the URLs of only the sources its events
+    cite, so the page can render a month without loading sources.json.
+    """
+    by_month: dict[str, list[Event]] = defaultdict(list)
     for e in events:
-        by_day[e["date"]].append(e)
-
-    days = sorted(by_day.keys())
-
+        by_month[month_of(e.date)].append(e)
+
+    shards: dict[str, dict] = {}
+    for month in sorted(by_month):
+        evs = by_month[month]
+        ids = sorted({s for e in evs for s in e.source_ids if s in sources})
+        shards[month] = {
+            "month": month,
+            "events": [e.to_json() for e in evs],
+            "sources": {s: sources[s]["url"] for s in ids},
+        }
+    return shards
+
+
+def build_index(shards: dict[str, dict]) -> dict:
+    buckets = [
+        {
+            "month": month,
+            "count": len(sh["events"]),
+            "first": sh["events"][0]["date"],
+            "last": sh["events"][-1]["date"],
+            "url": f"timeline/{month}.json",
+        }
+        for month, sh in shards.items()
+    ]
+    return {"version": 1, "events": sum(b["count"] for b in buckets), "buckets": buckets}
+
+
+def write_shards(site: Path, shards: dict[str, dict], index: dict) -> tuple[int, int]:
+    """
+    Write timeline/<month>.json and timeline/index.json, skipping shards whose bytes are
+    unchanged and removing shards from the previous index that no longer exist.
+    Returns (shards written, shards removed).
+    """
+    out = site / "timeline"
+    out.mkdir(parents=True, exist_ok=True)
+    index_path = out / "index.json"
+
+    previous: set[str] = set()
+    if index_path.exists():
+        try:
+            previous = {b["month"] for b in json.loads(index_path.read_text(encoding="utf-8")).get("buckets", [])}
+        except (OSError, ValueError):
+            previous = set()
+
+    written = 0
+    for month, shard in shards.items():
+        path = out / f"{month}.json"
+        data = json.dumps(shard, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if path.exists() and path.read_bytes() == data:
+            continue
+        path.write_bytes(data)
+        written += 1
+
+    removed = 0
+    for month in previous - set(shards):
+        (out / f"{month}.json").unlink(missing_ok=True)
+        removed += 1
+
+    index_path.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+    return written, removed
+
+
+# Renders one month's shard into its <section>. Mirrors the markup the page used
+# when every event was rendered server-side.
+TIMELINE_JS = r"""
+(function () {
+  function esc(s) {
+    return String(s == null ? "" : s).replace(/[&<>"']/g, function (c) {
+      return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}[c];
+    });
+  }
+
+  function renderEvent(e, sources) {
+    var tags = (e.tags || []).join(", ");
+    var html = "<li><strong>" + esc(e.title) + "</strong>";
+    if (tags) html += " <span style='opacity:.7'>[" + esc(tags) + "]</span>";
+    html += "<div><a href='./claims.html#" + esc(e.id) + "'>Claim " + esc(e.claim_short || e.id) + "</a>";
+    if (e.section_url) {
+      html += " | <a href='./" + esc(e.section_url) + "'>" + (e.section_num ? "Section " + esc(e.section_num) : "Section") + "</a>";
+    }
+    html += "</div>";
+    if (e.note) html += "<div style='opacity:.8;margin-top:4px'>" + esc(e.note) + "</div>";
+    var links = (e.source_ids || []).filter(function (s) { return sources[s]; }).map(function (s) {
+      return '<a href="' + esc(sources[s]) + '" rel="noreferrer noopener">' + esc(sources[s]) + "</a>";
+    });
+    if (links.length) html += "<div style='margin-top:4px'>" + links.join(" ") + "</div>";
+    return html + "</li>";
+  }
+
+  function renderShard(el, shard) {
+    var html = "", day = null;
+    shard.events.forEach(function (e) {
+      if (e.date !== day) {
+        if (day !== null) html += "</ul>";
+        day = e.date;
+        html += "<h3>" + esc(day) + "</h3><ul>";
+      }
+      html += renderEvent(e, shard.sources || {});
+    });
+    if (day !== null) html += "</ul>";
+    el.querySelector(".events").innerHTML = html;
+  }
+
+  function load(el) {
+    if (el.dataset.state) return;
+    el.dataset.state = "loading";
+    fetch(el.dataset.src)
+      .then(function (r) { if (!r.ok) throw new Error(r.status); return r.json(); })
+      .then(function (shard) { renderShard(el, shard); el.dataset.state = "loaded"; })
+      .catch(function (err) {
+        el.dataset.state = "";
+        el.querySelector(".events").textContent = "Could not load " + el.dataset.src + " (" + err + ")";
+      });
+  }
+
+  var months = document.querySelectorAll("section[data-src]");
+  if (!("IntersectionObserver" in window)) {
+    months.forEach(load);
+    return;
+  }
+  var io = new IntersectionObserver(function (entries) {
+    entries.forEach(function (en) {
+      if (en.isIntersecting) { io.unobserve(en.target); load(en.target); }
+    });
+  }, {rootMargin: "600px 0px"});
+  months.forEach(function (el) { io.observe(el); });
+})();
+"""
+
+
+def render_html(index: dict) -> str:
+    """
+    Page shell: one placeholder per month from the index; each month's events are
+    fetched from its shard when it scrolls near the viewport.
+    """
     out: list[str] = [
         "<!doctype html>",
         '<html lang="en">',
@@ -86,49 +228,23 @@ def render_html(events: list[dict]) -> str:
         "<main>",
         "<h1>Timeline</h1>",
         "<p>Timeline is generated from claims that include <code>DATE: YYYY-MM-DD</code>.</p>",
-        '<p><a href="./timeline.json">timeline.json</a></p>',
+        f'<p>{index["events"]} event(s) in {len(index["buckets"])} month(s). '
+        '<a href="./timeline/index.json">timeline/index.json</a> lists the monthly shards '
+        '(events reference claims by id; links are source ids in <a href="./sources.json">sources.json</a>)</p>',
         "<hr/>",
     ]
 
-    for d in days:
-        out.append(f"<h2>{escape(d)}</h2>")
-        out.append("<ul>")
-        for e in by_day[d]:
-            tags = ", ".join(e.get("tags") or [])
-            tags_html = f" <span style='opacity:.7'>[{escape(tags)}]</span>" if tags else ""
-
-            note = e.get("note") or ""
-            note_html = f"<div style='opacity:.8;margin-top:4px'>{escape(note)}</div>" if note else ""
-
-            links = e.get("links") or []
-            links_html = ""
-            if links:
-                links_html = "<div style='margin-top:4px'>" + " ".join(
-                    [f'<a href="{escape(u)}" rel="noreferrer noopener">{escape(u)}</a>' for u in links]
-                ) + "</div>"
-
-            claim_text = f"Claim {e.get('claim_short') or e['id']}"
-            claim_link = f"<a href='./{escape(e['claim_url'])}'>{escape(claim_text)}</a>"
-
-            section_link = ""
-            sec_url = e.get("section_url") or ""
-            sec_num = (e.get("section_num") or "").strip()
-            if sec_url:
-                section_text = f"Section {sec_num}" if sec_num else "Section"
-                section_link = f" | <a href='./{escape(sec_url)}'>{escape(section_text)}</a>"
-
-            out.append(
-                "<li>"
-                f"<strong>{escape(e['title'])}</strong>{tags_html}"
-                f"<div>{claim_link}{section_link}</div>"
-                f"{note_html}"
-                f"{links_html}"
-                "</li>"
-            )
-        out.append("</ul>")
+    for b in index["buckets"]:
+        month, src = escape(b["month"]), escape(b["url"])
+        out.append(f'<section id="m-{month}" data-src="./{src}">')
+        out.append(f"<h2>{month} <span style='opacity:.7'>({b['count']})</span></h2>")
+        out.append(f'<div class="events" style="min-height:{min(b["count"], 20) * 3}em">')
+        out.append(f'<noscript><a href="./{src}">{src}</a></noscript>')
+        out.append("</div>")
+        out.append("</section>")
         out.append("<hr/>")
 
-    out += ["</main>", "</body>", "</html>"]
+    out += ["</main>", f"<script>{TIMELINE_JS}</script>", "</body>", "</html>"]
     return "\n".join(out)
 
 
@@ -137,11 +253,20 @@ def main(site_dir: str) -> None:
     claims_json = site / "claims.json"
     claims = load_claims(claims_json)
     events = build_events(claims)
+    sources = load_sources(site / "sources.json")
+
+    shards = shard_events(events, sources)
+    index = build_index(shards)
+    written, removed = write_shards(site, shards, index)
+    (site / "timeline.html").write_text(render_html(index), encoding="utf-8")
 
-    (site / "timeline.json").write_text(json.dumps(events, ensure_ascii=False, indent=2), encoding="utf-8")
-    (site / "timeline.html").write_text(render_html(events), encoding="utf-8")
+    # Superseded by the monthly shards.
+    (site / "timeline.json").unlink(missing_ok=True)
 
-    print(f"Wrote {site / 'timeline.json'} ({len(events)} events)")
+    print(
+        f"Wrote {site / 'timeline'} ({len(events)} events in {len(shards)} month(s); "
+        f"{written} shard(s) written, {len(shards) - written} unchanged, {removed} removed)"
+    )
     print(f"Wrote {site / 'timeline.html'}")
 
 
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# tools/bundle_read.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mimetypes
+import sys
+import tarfile
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+
+# Stdlib only, so it can be copied next to a bundle onto a machine without the repo.
+#
+# A bundle is a plain tar of the built site (`tar xf site.bundle` works) with a sidecar
+# index, site.bundle.json:
+#   {"format": 1, "version": ..., "end": ..., "dead": ...,
+#    "members": {name: {"header": off, "offset": off, "size": n, "sha256": hex}}}
+# offset/size locate a member's bytes, so one member is read with a single seek. Without
+# the index the reader falls back to walking the tar headers.
+
+BUNDLE_FORMAT = 1
+INDEX_SUFFIX = ".json"
+
+
+def index_path_for(bundle: Path) -> Path:
+    return bundle.with_name(bundle.name + INDEX_SUFFIX)
+
+
+def read_index(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("format") != BUNDLE_FORMAT:
+        return None
+    return data
+
+
+class Bundle:
+    def __init__(self, path: Path, index: Path | None = None) -> None:
+        self.path = path
+        data = read_index(index or index_path_for(path))
+        if data is None:
+            data = {"format": BUNDLE_FORMAT, "version": "", "members": self._scan()}
+        self.version: str = data.get("version", "")
+        self.members: dict[str, dict] = data["members"]
+
+    def _scan(self) -> dict[str, dict]:
+        members: dict[str, dict] = {}
+        with tarfile.open(self.path, "r:") as tf:
+            for ti in tf:  # a later member with the same name replaces an earlier one
+                if ti.isfile():
+                    members[ti.name] = {"header": ti.offset, "offset": ti.offset_data, "size": ti.size, "sha256": ""}
+        return members
+
+    def names(self) -> list[str]:
+        return sorted(self.members)
+
+    def read(self, name: str, verify: bool = False) -> bytes:
+        m = self.members[name]
+        with self.path.open("rb") as f:
+            f.seek(m["offset"])
+            data = f.read(m["size"])
+        if verify and m.get("sha256") and hashlib.sha256(data).hexdigest() != m["sha256"]:
+            raise ValueError(f"{name}: content does not match the index hash")
+        return data
+
+
+class BundleHandler(BaseHTTPRequestHandler):
+    server: "BundleServer"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:
+        name = unquote(urlsplit(self.path).path).lstrip("/")
+        if name == "" or name.endswith("/"):
+            name += "index.html"
+        bundle = self.server.bundle
+        m = bundle.members.get(name)
+        if m is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        etag = f'"{m["sha256"][:20]}"' if m.get("sha256") else None
+        if etag and etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = bundle.read(name)
+        ctype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if ctype.startswith("text/") or ctype == "application/json":
+            ctype += "; charset=utf-8"
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class BundleServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: tuple[str, int], bundle: Bundle) -> None:
+        super().__init__(addr, BundleHandler)
+        self.bundle = bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Read members of a site bundle without unpacking it.")
+    parser.add_argument("bundle", type=Path, help="Bundle file, e.g. dossier/site.bundle")
+    parser.add_argument("--index", type=Path, default=None, help="Index file (default: <bundle>.json)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("list", help="List members with size and hash.")
+    p_cat = sub.add_parser("cat", help="Write one member to stdout.")
+    p_cat.add_argument("name")
+    p_ext = sub.add_parser("extract", help="Extract members (default: all) into a directory.")
+    p_ext.add_argument("names", nargs="*")
+    p_ext.add_argument("-o", "--out", type=Path, default=Path("."), help="Output dir (default: .)")
+    p_srv = sub.add_parser("serve", help="Serve the bundle over HTTP.")
+    p_srv.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    p_srv.add_argument("--port", type=int, default=8002, help="Port (default: 8002)")
+    args = parser.parse_args()
+
+    bundle = Bundle(args.bundle, args.index)
+
+    if args.cmd == "list":
+        for name in bundle.names():
+            m = bundle.members[name]
+            print(f"{m['size']:>10}  {m.get('sha256', '')[:12]:<12}  {name}")
+        print(f"{len(bundle.members)} member(s), version {bundle.version or 'unknown'}", file=sys.stderr)
+
+    elif args.cmd == "cat":
+        if args.name not in bundle.members:
+            raise SystemExit(f"No member {args.name!r} in {args.bundle}")
+        sys.stdout.buffer.write(bundle.read(args.name, verify=True))
+
+    elif args.cmd == "extract":
+        names = args.names or bundle.names()
+        missing = [n for n in names if n not in bundle.members]
+        if missing:
+            raise SystemExit(f"Not in {args.bundle}: {', '.join(missing)}")
+        out = args.out.resolve()
+        for name in names:
+            dest = (out / name).resolve()
+            if out not in dest.parents:
+                raise SystemExit(f"Refusing to extract {name!r} outside {out}")
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(bundle.read(name, verify=True))
+        print(f"Extracted {len(names)} member(s) to {out}")
+
+    else:
+        server = BundleServer((args.host, args.port), bundle)
+        print(f"Serving {args.bundle} ({len(bundle.members)} members) at http://{args.host}:{server.server_port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
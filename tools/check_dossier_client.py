@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# tools/check_dossier_client.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import tempfile
+import threading
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from build_claims import write_claims_ndjson
+from dossier_client import LRU, DossierClient
+
+
+RANGE_RE = re.compile(r"bytes=(\d+)-(\d+)$")
+
+
+class SiteHandler(SimpleHTTPRequestHandler):
+    """
+    Static files with the validators a real host sends: a content ETag (304 on
+    If-None-Match) and single byte ranges (206, honouring If-Range).
+    """
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self._log(404)
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        body = path.read_bytes()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self._log(304)
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        status = HTTPStatus.OK
+        m = RANGE_RE.match(self.headers.get("Range", ""))
+        if m and self.headers.get("If-Range", etag) == etag:
+            start, end = int(m.group(1)), min(int(m.group(2)), len(body) - 1)
+            status, body = HTTPStatus.PARTIAL_CONTENT, body[start : end + 1]
+
+        self._log(int(status))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{path.stat().st_size}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _log(self, status: int) -> None:
+        self.server.log.append((self.path, status))  # type: ignore[attr-defined]
+
+
+def write_site(site: Path, n: int = 200) -> list[dict]:
+    toc = [
+        {"id": "01-intro", "number": "1", "title": "Intro", "url": "01-intro.html"},
+        {"id": "02-courts", "number": "2", "title": "Courts", "url": "02-courts.html"},
+    ]
+    claims = [
+        {
+            "id": f"C-{toc[i % 2]['id']}-{i:03d}",
+            "text": f"Claim {i} " + "filler " * 20,
+            "url": toc[i % 2]["url"],
+            "section_id": toc[i % 2]["id"],
+            "links": [f"https://example.org/{i}"],
+            "tags": ["doj"] if i % 4 == 0 else [],
+        }
+        for i in range(n)
+    ]
+    mins = [{"id": c["id"], "u": c["url"], "t": c["text"], "tg": c["tags"]} for c in claims]
+    (site / "toc.json").write_text(json.dumps(toc), encoding="utf-8")
+    (site / "claims.json").write_text(json.dumps(claims), encoding="utf-8")
+    (site / "claims.min.json").write_text(json.dumps(mins), encoding="utf-8")
+    write_claims_ndjson(claims, site / "claims.ndjson", site / "claims.ndjson.idx.json")
+    for s in toc:
+        (site / s["url"]).write_text(f"<html><pre>{s['title']} text &amp; more</pre></html>", encoding="utf-8")
+    return claims
+
+
+def run_checks(tmp: Path) -> list[str]:
+    """
+    Serve a generated site with http.server on an ephemeral port and return the failed checks.
+    """
+    site = tmp / "site"
+    site.mkdir()
+    claims = write_site(site)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(SiteHandler, directory=str(site)))
+    server.log = []  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}/"
+    failures: list[str] = []
+
+    def expect(name: str, ok: bool) -> None:
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures.append(name)
+
+    def served(since: int) -> list[tuple[str, int]]:
+        return server.log[since:]  # type: ignore[attr-defined]
+
+    # a str cache_dir, as a caller writing cache_dir="..." would pass it
+    cache_dir = str(tmp / "cache")
+    try:
+        client = DossierClient(base, cache_dir=cache_dir, max_age=0)
+        expect("str cache_dir", [s.id for s in client.toc()] == ["01-intro", "02-courts"])
+        expect("section page", client.section_text("2") == "Courts text & more")
+
+        mark = len(server.log)
+        r = client.site.get("toc.json")
+        expect("ETag revalidation gets a 304", r.source == "revalidated" and served(mark) == [("/toc.json", 304)])
+
+        (site / "toc.json").write_text(json.dumps([{"id": "09-new", "number": "9"}]), encoding="utf-8")
+        expect("changed resource is refetched", [s.id for s in client.toc()] == ["09-new"])
+
+        mark = len(server.log)
+        want = claims[137]
+        got = client.claim(want["id"])
+        paths = [p for p, _s in served(mark)]
+        expect(
+            "claim read by Range through the ndjson index",
+            got.id == want["id"]
+            and got.links == tuple(want["links"])
+            and ("/claims.ndjson", 206) in served(mark)
+            and "/claims.json" not in paths,
+        )
+
+        mark = len(server.log)
+        client.claim(want["id"])
+        expect("claim reread without a Range request", ("/claims.ndjson", 206) not in served(mark))
+
+        server.shutdown()
+        server.server_close()
+        offline = DossierClient(base, cache_dir=cache_dir, max_age=0, timeout=2)
+        r = offline.site.get("toc.json")
+        expect("stale copy when the server is down", r.source == "stale" and json.loads(r.body)[0]["id"] == "09-new")
+        expect("claim served from the stale index and the LRU", client.claim(want["id"]).id == want["id"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    lru = LRU(max_entries=100, max_bytes=1000)
+    for i in range(10):
+        lru.put(i, i, 300)
+    expect("LRU keeps bytes under the bound", lru.bytes <= 1000 and list(lru._items) == [7, 8, 9])
+    lru.get(7)
+    lru.put("x", "x", 300)
+    expect("LRU evicts least recently used", list(lru._items) == [9, 7, "x"])
+    lru.put("big", "big", 1001)
+    expect("LRU skips an entry over the bound", "big" not in lru and lru.bytes == 900)
+
+    client = DossierClient(site, lru_bytes=(site / "claims.min.json").stat().st_size - 1)
+    client.claims()
+    client.toc()
+    expect("client LRU stays under lru_bytes", client.lru.bytes <= client.lru.max_bytes and len(client.lru) == 1)
+
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Self-check for dossier_client against http.server on an ephemeral port.")
+    parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        failures = run_checks(Path(tmp))
+    if failures:
+        print(f"{len(failures)} check(s) failed.")
+        raise SystemExit(1)
+    print("All client checks passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# tools/check_links.py
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, urljoin, urlsplit
+
+from build_sources import canonicalize_url
+
+
+USER_AGENT = "dossier-link-check/1.0 (+https://42ndmoose.github.io/llm-test-pad/)"
+
+DEFAULT_CACHE = Path("dossier/.cache/link_check.json")
+# Next to the cache, not in the site: the report carries check times, so a copy in the
+# committed site would change (and need rebundling) on every run.
+DEFAULT_REPORT = Path("dossier/.cache/link_status.json")
+
+# Cached results expire at different rates: dead links are re-checked sooner.
+TTL_OK_SECONDS = 7 * 24 * 3600
+TTL_FAIL_SECONDS = 24 * 3600
+
+MAX_REDIRECTS = 5
+# Some servers reject HEAD outright; retry those with GET.
+HEAD_FALLBACK_STATUSES = {400, 403, 405, 501}
+
+
+@dataclass
+class LinkResult:
+    url: str
+    ok: bool
+    status: int | None
+    final_url: str
+    error: str
+    checked_at: float
+
+    def to_json(self) -> dict:
+        return {
+            "url": self.url,
+            "ok": self.ok,
+            "status": self.status,
+            "final_url": self.final_url,
+            "error": self.error,
+            "checked_at": int(self.checked_at),
+        }
+
+
+class HostPool:
+    """
+    Keeps idle keep-alive connections per (scheme, host, port) and spaces
+    requests to the same host at least `min_interval` seconds apart.
+    """
+
+    def __init__(self, timeout: float, min_interval: float, max_idle_per_host: int = 4) -> None:
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_idle_per_host = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._next_slot: dict[tuple[str, str, int], float] = {}
+
+    @staticmethod
+    def key_for(url: str) -> tuple[str, str, int]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        return scheme, (parts.hostname or "").lower(), port
+
+    def wait_turn(self, key: tuple[str, str, int]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + self.min_interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def acquire(self, key: tuple[str, str, int]) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+def _request(pool: HostPool, method: str, url: str) -> tuple[int, str | None]:
+    """
+    One request over a pooled connection. Returns (status, Location header).
+    A stale keep-alive connection is retried once on a fresh one.
+    """
+    key = HostPool.key_for(url)
+    parts = urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    # http.client only sends ASCII; existing %-escapes are kept, everything else is encoded
+    target = quote(target, safe="/?&=%:@!$'()*+,;~-._")
+
+    for attempt in (1, 2):
+        # every request sent takes a turn, including the retry on a fresh connection
+        pool.wait_turn(key)
+        conn = pool.acquire(key)
+        try:
+            conn.request(method, target, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+            resp = conn.getresponse()
+            # drain the body so the connection can be reused (HEAD has none)
+            resp.read()
+            status, location = resp.status, resp.getheader("Location")
+            if resp.will_close:
+                conn.close()
+            else:
+                pool.release(key, conn)
+            return status, location
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if attempt == 2:
+                raise
+        except Exception:
+            conn.close()
+            raise
+    raise RuntimeError("unreachable")
+
+
+def check_url(pool: HostPool, url: str) -> LinkResult:
+    cur = url
+    method = "HEAD"
+    try:
+        for _hop in range(MAX_REDIRECTS + 1):
+            status, location = _request(pool, method, cur)
+
+            if method == "HEAD" and status in HEAD_FALLBACK_STATUSES:
+                method = "GET"
+                status, location = _request(pool, method, cur)
+
+            if 300 <= status < 400 and location:
+                cur = urljoin(cur, location)
+                continue
+
+            return LinkResult(url, 200 <= status < 400, status, cur, "", time.time())
+
+        return LinkResult(url, False, None, cur, "too many redirects", time.time())
+    except Exception as e:  # network errors are results, not crashes
+        return LinkResult(url, False, None, cur, f"{type(e).__name__}: {e}", time.time())
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path: Path, cache: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def is_fresh(entry: dict, now: float) -> bool:
+    ttl = TTL_OK_SECONDS if entry.get("ok") else TTL_FAIL_SECONDS
+    return now - float(entry.get("checked_at", 0)) < ttl
+
+
+def check_urls(
+    urls: list[str],
+    cache: dict[str, dict],
+    *,
+    workers: int = 16,
+    timeout: float = 10.0,
+    per_host_interval: float = 0.5,
+    force: bool = False,
+) -> tuple[list[dict], int]:
+    """
+    Check urls concurrently, reusing fresh cache entries (keyed by canonical URL).
+    Updates cache in place and prunes entries for URLs not in urls. Returns (results in input order, number of network checks).
+    """
+    now = time.time()
+    fresh: set[str] = set()
+    todo: dict[str, str] = {}  # canonical -> first spelling seen; each canonical is checked once
+
+    for u in urls:
+        canon = canonicalize_url(u)
+        entry = cache.get(canon)
+        if entry and not force and is_fresh(entry, now):
+            fresh.add(canon)
+        else:
+            todo.setdefault(canon, u)
+
+    pool = HostPool(timeout=timeout, min_interval=per_host_interval)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            for canon, res in zip(todo, ex.map(lambda u: check_url(pool, u), todo.values())):
+                cache[canon] = res.to_json()
+    finally:
+        pool.close()
+
+    # drop results for URLs no longer cited, so the cache (and the report) track the site
+    live = {canonicalize_url(u) for u in urls}
+    for canon in [c for c in cache if c not in live]:
+        del cache[canon]
+
+    results = [
+        dict(cache[canon], url=u, cached=canon in fresh)
+        for u, canon in ((u, canonicalize_url(u)) for u in urls)
+    ]
+    return results, len(todo)
+
+
+def collect_urls(site: Path) -> list[str]:
+    """
+    Evidence URLs from the extraction pass: sources.json when present, else claims.json links.
+    """
+    sources_json = site / "sources.json"
+    if sources_json.exists():
+        return [s["url"] for s in json.loads(sources_json.read_text(encoding="utf-8"))]
+
+    seen: set[str] = set()
+    out: list[str] = []
+    for c in json.loads((site / "claims.json").read_text(encoding="utf-8")):
+        for u in c.get("links", []):
+            canon = canonicalize_url(u)
+            if canon not in seen:
+                seen.add(canon)
+                out.append(u)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that evidence URLs in the claims ledger still resolve.")
+    parser.add_argument("site", type=Path, nargs="?", default=Path("dossier/site"), help="Built site dir (default: dossier/site)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Result cache (default: {DEFAULT_CACHE})")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help=f"Status report (default: {DEFAULT_REPORT})")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent checks (default: 16)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds (default: 10)")
+    parser.add_argument("--per-host-interval", type=float, default=0.5, help="Min seconds between requests to one host (default: 0.5)")
+    parser.add_argument("--force", action="store_true", help="Ignore cached results.")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if any link is broken.")
+    args = parser.parse_args()
+
+    urls = collect_urls(args.site)
+    cache = load_cache(args.cache)
+
+    started = time.monotonic()
+    results, checked = check_urls(
+        urls,
+        cache,
+        workers=args.workers,
+        timeout=args.timeout,
+        per_host_interval=args.per_host_interval,
+        force=args.force,
+    )
+    elapsed = time.monotonic() - started
+    save_cache(args.cache, cache)
+
+    broken = [r for r in results if not r["ok"]]
+    report = {
+        "generated_at": int(time.time()),
+        "total": len(results),
+        "checked": checked,
+        "cached": len(results) - checked,
+        "broken": len(broken),
+        "results": results,
+    }
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    print(f"Checked {checked} of {len(results)} link(s) in {elapsed:.2f}s ({len(results) - checked} cached).")
+    for r in broken:
+        print(f"- BROKEN {r['status'] or '-'} {r['url']} {r['error']}".rstrip())
+    print(f"Wrote {args.report}")
+
+    if args.strict and broken:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# tools/check_query_api.py
+from __future__ import annotations
+
+import argparse
+import gzip
+import http.client
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from query_api import QueryServer
+
+
+def make_claims(n: int) -> list[dict]:
+    """
+    n claims over three sections; every third is dated, every fourth tagged "doj".
+    """
+    out = []
+    for i in range(n):
+        sec = ("01-intro", "02-courts", "08-trump-vs-architecture")[i % 3]
+        out.append(
+            {
+                "id": f"C-{sec}-{i:03d}",
+                "text": f"Claim {i} about {'antitrust' if i % 5 == 0 else 'zoning'} filings.",
+                "section_id": sec,
+                "section_label": f"{int(sec[:2])}. {sec[3:]}",
+                "url": f"sections/{sec}.html#c{i}",
+                "date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}" if i % 3 == 0 else "",
+                "tags": ["doj"] if i % 4 == 0 else [],
+            }
+        )
+    return out
+
+
+TOC = [
+    {"id": "01-intro", "number": "1", "title": "Intro"},
+    {"id": "02-courts", "number": "2", "title": "Courts"},
+    {"id": "08-trump-vs-architecture", "number": "8", "title": "Architecture"},
+]
+
+
+def write_site(site: Path, claims: list[dict]) -> None:
+    tmp = site / "claims.json.tmp"
+    tmp.write_text(json.dumps(claims), encoding="utf-8")
+    tmp.replace(site / "claims.json")
+
+
+class Client:
+    def __init__(self, port: int) -> None:
+        self.port = port
+
+    def get(self, path: str, headers: dict[str, str] | None = None) -> tuple[int, dict[str, str], bytes]:
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            conn.request("GET", path, headers=headers or {})
+            resp = conn.getresponse()
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, resp.read()
+        finally:
+            conn.close()
+
+    def json(self, path: str) -> dict:
+        status, _h, body = self.get(path)
+        if status != 200:
+            raise AssertionError(f"GET {path}: {status}")
+        return json.loads(body)
+
+
+def run_checks(site: Path) -> list[str]:
+    """
+    Start a server on an ephemeral port over site and return the failed checks.
+    """
+    claims = make_claims(120)
+    write_site(site, claims)
+    (site / "toc.json").write_text(json.dumps(TOC), encoding="utf-8")
+
+    server = QueryServer(("127.0.0.1", 0), site)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api = Client(server.server_port)
+    failures: list[str] = []
+
+    def expect(name: str, ok: bool) -> None:
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures.append(name)
+
+    try:
+        want = [c["id"] for c in claims if "doj" in c["tags"] and c["section_id"] == "08-trump-vs-architecture"]
+        got = api.json("/claims?tag=doj&section=8&limit=500")
+        expect("tag + section filter", [c["id"] for c in got["items"]] == want and got["total"] == len(want))
+
+        want = [c["id"] for c in claims if "2025-03-01" <= c["date"] <= "2025-05-31"]
+        got = api.json("/claims?since=2025-03-01&until=2025-05&limit=500")
+        expect("since/until date range", [c["id"] for c in got["items"]] == want)
+
+        want = [c["id"] for c in claims if "antitrust" in c["text"]]
+        got = api.json("/claims?q=Antitrust&limit=500")
+        expect("text query", [c["id"] for c in got["items"]] == want)
+
+        pages, offset = [], 0
+        while offset is not None:
+            got = api.json(f"/claims?limit=50&offset={offset}")
+            pages.append(got["items"])
+            offset = got["next_offset"]
+        expect("pagination", [len(p) for p in pages] == [50, 50, 20] and [c["id"] for p in pages for c in p] == [c["id"] for c in claims])
+        expect("bad limit is a 400", api.get("/claims?limit=x")[0] == 400)
+        expect("unknown claim is a 404", api.get("/claims/C-nope")[0] == 404)
+
+        status, h, _body = api.get("/claims?limit=5")
+        etag = h.get("etag", "")
+        expect("etag on 200", status == 200 and bool(etag) and h.get("vary") == "Accept-Encoding")
+        status, h, body = api.get("/claims?limit=5", {"If-None-Match": etag})
+        expect("304 on If-None-Match", status == 304 and body == b"" and h.get("etag") == etag)
+
+        status, gh, gbody = api.get("/claims?limit=100", {"Accept-Encoding": "gzip"})
+        _s, ih, ibody = api.get("/claims?limit=100")
+        expect(
+            "gzip body decodes to the identity body",
+            gh.get("content-encoding") == "gzip" and gzip.decompress(gbody) == ibody and "content-encoding" not in ih,
+        )
+        expect("gzip variant has its own etag", gh.get("etag") not in ("", None, ih.get("etag")) and gh.get("vary") == "Accept-Encoding")
+        status, _h, _b = api.get("/claims?limit=100", {"If-None-Match": ih["etag"], "Accept-Encoding": "gzip"})
+        expect("identity etag does not validate the gzip variant", status == 200)
+
+        old = api.json("/version")["version"]
+        write_site(site, claims[:30])
+        # a rebuild in the same mtime tick still differs in size
+        os.utime(site / "claims.json", ns=(0, 0))
+        swapped = server.reload_if_changed()
+        ver = api.json("/version")
+        expect("hot-swap after rebuild", swapped and ver["version"] != old and ver["claims"] == 30)
+        status, _h, _b = api.get("/claims?limit=5", {"If-None-Match": etag})
+        expect("old etag is stale after rebuild", status == 200)
+        expect("no reload without a change", not server.reload_if_changed())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Self-check for query_api.py over a generated site on an ephemeral port.")
+    parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        failures = run_checks(Path(tmp))
+    if failures:
+        print(f"{len(failures)} check(s) failed.")
+        raise SystemExit(1)
+    print("All query API checks passed.")
+
+
+if __name__ == "__main__":
+    main()
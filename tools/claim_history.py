@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# tools/claim_history.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from build_claims import claim_key, tokenize_claims
+
+
+DEFAULT_PARTS = Path("dossier/parts")
+DEFAULT_CACHE = Path("dossier/.cache/claim_history.json")
+
+# The claim table depends on the tokenizer as well as on this file.
+RULES_HASH = hashlib.sha256(
+    Path(__file__).read_bytes() + (Path(__file__).parent / "build_claims.py").read_bytes()
+).hexdigest()[:16]
+
+COMMIT_MARK = "\x1e"
+
+
+# -----------------------------
+# Git plumbing
+# -----------------------------
+# One `git log -p -U0` over the parts dir replaces a `git blame` per claim. Every line of
+# every part carries (first, last): the commits that introduced it and last touched it,
+# as indexes into the commit table. Replaying each commit's hunks over those arrays keeps
+# them equal to the file at that commit, so the walk can stop and resume at any commit.
+
+
+def git(top: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(top), *args],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ).stdout.decode("utf-8", errors="replace")
+
+
+def git_toplevel(path: Path) -> Path | None:
+    try:
+        return Path(git(path, "rev-parse", "--show-toplevel").strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def is_ancestor(top: Path, old: str, new: str) -> bool:
+    try:
+        git(top, "merge-base", "--is-ancestor", old, new)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+
+def _split_lines(text: str) -> list[str]:
+    # git counts "\n"-terminated lines; str.splitlines would also split on \r, \x0b,  ...
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _hunk_header(line: str) -> tuple[int, int, int, int]:
+    # "@@ -a[,b] +c[,d] @@ ..."
+    old, new = line.split(" ", 3)[1:3]
+
+    def span(s: str) -> tuple[int, int]:
+        start, _, count = s[1:].partition(",")
+        return int(start), int(count) if count else 1
+
+    return (*span(old), *span(new))
+
+
+def apply_hunks(lines: list[list[int]], hunks: list[tuple[int, int, int, int]], commit: int) -> list[list[int]]:
+    """
+    Replay one file diff (zero-context hunks, in order) over a line provenance array.
+    Replaced lines keep the origin of the line they replace, so an edited claim keeps its
+    first_seen; inserted lines start at this commit.
+    """
+    out: list[list[int]] = []
+    pos = 0
+    for old_start, old_len, _new_start, new_len in hunks:
+        # with zero old lines the hunk inserts after old_start, otherwise it starts at it
+        start = old_start if old_len == 0 else old_start - 1
+        out.extend(lines[pos:start])
+        removed = lines[start : start + old_len]
+        for k in range(new_len):
+            out.append([removed[k][0] if k < len(removed) else commit, commit])
+        pos = start + old_len
+    out.extend(lines[pos:])
+    return out
+
+
+def replay_log(
+    top: Path,
+    rev_range: str,
+    pathspec: str,
+    files: dict[str, list[list[int]]],
+    commits: list[list[str]],
+) -> int:
+    """
+    Stream `git log -p` for rev_range and apply every commit to files in place, appending
+    [sha, author date] rows to commits. Returns the number of commits replayed.
+    """
+    cmd = [
+        "git",
+        "-C",
+        str(top),
+        "-c",
+        "core.quotePath=false",
+        "log",
+        "--reverse",
+        "--first-parent",
+        "--diff-merges=first-parent",
+        "-M",
+        "-U0",
+        "--no-color",
+        "--no-ext-diff",
+        f"--format={COMMIT_MARK}%H %as",
+        rev_range,
+        "--",
+        pathspec,
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    assert proc.stdout is not None
+
+    replayed = 0
+    commit = -1
+    old: str | None = None
+    new: str | None = None
+    deleted = False
+    hunks: list[tuple[int, int, int, int]] = []
+    in_diff = False
+    remaining = 0  # content lines left in the current hunk
+
+    def flush() -> None:
+        nonlocal in_diff
+        if not in_diff:
+            return
+        in_diff = False
+        src = files.pop(old, []) if old else []
+        if deleted or not new:
+            return
+        files[new] = apply_hunks(src, hunks, commit)
+
+    for raw in proc.stdout:
+        line = raw.decode("utf-8", errors="replace").rstrip("\n")
+
+        if remaining:
+            if line.startswith("\\"):  # "\ No newline at end of file"
+                continue
+            remaining -= 1
+            continue
+
+        if line.startswith(COMMIT_MARK):
+            flush()
+            sha, _, day = line[1:].partition(" ")
+            commits.append([sha, day])
+            commit = len(commits) - 1
+            replayed += 1
+        elif line.startswith("diff --git "):
+            flush()
+            in_diff = True
+            a, _, b = line[len("diff --git ") :].partition(" b/")
+            old, new = a[2:], b
+            deleted = False
+            hunks = []
+        elif not in_diff:
+            continue
+        elif line.startswith("new file mode"):
+            old = None
+        elif line.startswith("deleted file mode"):
+            deleted = True
+        elif line.startswith("rename from "):
+            old = line[len("rename from ") :]
+        elif line.startswith("rename to "):
+            new = line[len("rename to ") :]
+        elif line.startswith("--- "):
+            old = None if line == "--- /dev/null" else line[len("--- a/") :]
+        elif line.startswith("+++ "):
+            if line == "+++ /dev/null":
+                deleted = True
+            else:
+                new = line[len("+++ b/") :]
+        elif line.startswith("@@ "):
+            h = _hunk_header(line)
+            hunks.append(h)
+            remaining = h[1] + h[3]
+
+    flush()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return replayed
+
+
+# -----------------------------
+# Index
+# -----------------------------
+def load_index(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("rules") != RULES_HASH:
+        return {}
+    return data
+
+
+def save_index(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _is_part(path: str, prefix: str) -> bool:
+    rest = path[len(prefix) :]
+    return path.startswith(prefix) and "/" not in rest and rest.endswith(".md")
+
+
+def claim_table(top: Path, prefix: str, files: dict[str, list[list[int]]], commits: list[list[str]]) -> dict[str, dict]:
+    """
+    claim_key -> first/last commit for every claim in the parts at HEAD. first_seen is the
+    origin of the claim line itself; last_changed is the newest edit anywhere in its span
+    (claim line, metadata and evidence bullets).
+    """
+    out: dict[str, dict] = {}
+    for path in sorted(p for p in files if _is_part(p, prefix)):
+        prov = files[path]
+        lines = _split_lines(git(top, "show", f"HEAD:{path}"))
+        if len(lines) != len(prov):
+            raise ValueError(f"{path}: replayed {len(prov)} lines, HEAD has {len(lines)}")
+
+        for tok in tokenize_claims(lines):
+            if tok.kind == "part":
+                continue
+            span = prov[tok.line_no - 1 : max(tok.end_line, tok.line_no)]
+            first = span[0][0]
+            last = max(p[1] for p in span)
+            key = claim_key(tok.text)
+            prev = out.get(key)
+            if prev:
+                # the same claim text in two places: earliest origin, latest edit
+                first = min(first, prev["_first"])
+                last = max(last, prev["_last"])
+            out[key] = {
+                "_first": first,
+                "_last": last,
+                "first_seen": commits[first][1],
+                "first_commit": commits[first][0],
+                "last_changed": commits[last][1],
+                "last_commit": commits[last][0],
+                "part": path,
+                "line": tok.line_no,
+            }
+    for entry in out.values():
+        del entry["_first"], entry["_last"]
+    return out
+
+
+def update_index(parts: Path, cache: Path, full: bool = False) -> tuple[dict, int]:
+    """
+    Bring the index up to HEAD. Only commits after the cached head are replayed; a cached
+    head that is no longer an ancestor (rebase, force-push) or that replays to the wrong
+    line counts triggers a full walk. Returns (index, commits replayed).
+    """
+    top = git_toplevel(parts)
+    if top is None:
+        return {"version": 1, "rules": RULES_HASH, "head": None, "commits": [], "files": {}, "claims": {}}, 0
+
+    head = git(top, "rev-parse", "HEAD").strip()
+    prefix = parts.resolve().relative_to(top.resolve()).as_posix().rstrip("/") + "/"
+
+    data = {} if full else load_index(cache)
+    if data.get("head") == head and data.get("prefix") == prefix:
+        return data, 0
+
+    old = data.get("head")
+    if old and data.get("prefix") == prefix and is_ancestor(top, old, head):
+        commits, files = data["commits"], data["files"]
+        replayed = replay_log(top, f"{old}..{head}", prefix, files, commits)
+        try:
+            claims = claim_table(top, prefix, files, commits)
+        except ValueError:
+            return update_index(parts, cache, full=True)
+    else:
+        commits, files = [], {}
+        replayed = replay_log(top, head, prefix, files, commits)
+        claims = claim_table(top, prefix, files, commits)
+
+    return {
+        "version": 1,
+        "rules": RULES_HASH,
+        "prefix": prefix,
+        "head": head,
+        "commits": commits,
+        "files": files,
+        "claims": claims,
+    }, replayed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index when each claim was first added and last edited, from git history.")
+    parser.add_argument("parts", type=Path, nargs="?", default=DEFAULT_PARTS, help=f"Parts dir (default: {DEFAULT_PARTS})")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Index file (default: {DEFAULT_CACHE})")
+    parser.add_argument("--full", action="store_true", help="Ignore the cached index and walk the whole history.")
+    args = parser.parse_args()
+
+    data, replayed = update_index(args.parts, args.cache, args.full)
+    save_index(args.cache, data)
+    if data["head"] is None:
+        print(f"{args.parts} is not in a git checkout; wrote an empty index to {args.cache}", file=sys.stderr)
+        return
+    print(
+        f"Wrote {args.cache} ({len(data['claims'])} claims at {data['head'][:12]}, "
+        f"{replayed} new commit(s) replayed)"
+    )
+
+
+if __name__ == "__main__":
+    main()
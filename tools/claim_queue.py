@@ -2,9 +2,57 @@
 from __future__ import annotations
 
 import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import secrets
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+from build_claims import CLAIM_LINE_RE, C_SUFFIX_RE
+from dossier_config import Dossier, load_dossiers
+from find_duplicates import (
+    DEFAULT_THRESHOLD,
+    LSHIndex,
+    build_claim_index,
+    load_signature_cache,
+    save_signature_cache,
+    signature_for,
+)
+
+
+# Pending inserts are flushed to the part files every BATCH_SIZE items,
+# so memory stays bounded for large imports.
+BATCH_SIZE = 1000
+
+# CSV cells holding several sources: split on whitespace or "|"
+CSV_LIST_SPLIT_RE = re.compile(r"[\s|]+")
+
+# Per-part write locks, shared by every queue run (file or spool) on this checkout.
+LOCK_DIR = Path("dossier/.cache/locks")
+
+# Spool mode: one JSON file per pending item under <spool>/pending/. A worker claims items
+# by renaming them into <spool>/work/<worker>/ (rename is atomic, so each item goes to
+# exactly one worker), applies them, then moves each to done/ or failed/ and appends a line
+# to journal.jsonl. Producers write into tmp/ and rename into pending/, so a worker never
+# reads a half-written item.
+DEFAULT_SPOOL = Path("dossier/queue")
+SPOOL_DIRS = ("pending", "work", "done", "failed", "tmp")
+JOURNAL = "journal.jsonl"
+SPOOL_BATCH = 50
 
 
 @dataclass
@@ -85,6 +133,56 @@ def load_queue(path: Path) -> list[dict[str, Any]]:
     return items
 
 
+def iter_jsonl(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    with path.open(encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{lineno}: invalid JSON: {e}") from None
+            if not isinstance(raw, dict):
+                raise ValueError(f"{path}:{lineno}: expected a JSON object per line")
+            yield lineno, raw
+
+
+def iter_csv(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    with path.open(encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            raw: dict[str, Any] = {k.strip(): (v or "") for k, v in row.items() if k}
+            if "sources" in raw:
+                raw["sources"] = [s for s in CSV_LIST_SPLIT_RE.split(raw["sources"]) if s]
+            # line_num is the physical line after the row (rows may span lines)
+            yield reader.line_num, raw
+
+
+def iter_queue(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Yield (row number, raw item) from a YAML, JSONL or CSV queue.
+    JSONL and CSV are streamed; the minimal YAML subset is small and loaded whole.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Queue file not found: {path}")
+
+    suffix = path.suffix.lower()
+    if suffix in {".jsonl", ".ndjson"}:
+        yield from iter_jsonl(path)
+    elif suffix == ".csv":
+        yield from iter_csv(path)
+    else:
+        yield from enumerate(load_queue(path), start=1)
+
+
+def iter_items(path: Path) -> Iterator[QueueItem]:
+    for n, raw in iter_queue(path):
+        try:
+            yield normalize_item(raw)
+        except ValueError as e:
+            raise ValueError(f"{path}:{n}: {e}") from None
+
+
 def _ensure_list(value: Any) -> list[str]:
     if value is None:
         return []
@@ -153,49 +251,521 @@ def build_claim_block(item: QueueItem) -> list[str]:
 
 
 def insert_block(text: str, block_lines: list[str], insert_after: str | None) -> str:
+    return insert_blocks(text, [(block_lines, insert_after)])
+
+
+def _anchor_index(lines: list[str], insert_after: str, resume_after: str | None) -> int:
+    if resume_after is not None:
+        # continue after the block a previous batch inserted for this anchor
+        for i, line in enumerate(lines):
+            if line == resume_after:
+                while i < len(lines) and lines[i].strip():
+                    i += 1
+                return i
+    for i, line in enumerate(lines):
+        if insert_after in line:
+            return i + 1
+    return len(lines)
+
+
+def insert_blocks(
+    text: str,
+    inserts: list[tuple[list[str], str | None]],
+    resume: dict[str, str] | None = None,
+) -> str:
+    """
+    Apply many (block_lines, insert_after) inserts in one pass over the text.
+    Anchors are matched against the original lines; blocks sharing an anchor
+    (or appended at the end) keep their queue order. resume maps an anchor to the
+    first line of the last block inserted after it by an earlier batch, and is
+    updated so the next batch continues after this one.
+    """
     lines = text.splitlines()
-    insert_idx = len(lines)
-    if insert_after:
-        for idx, line in enumerate(lines):
-            if insert_after in line:
-                insert_idx = idx + 1
-                break
-
-    if insert_idx > 0 and lines[insert_idx - 1].strip():
-        block_lines = [""] + block_lines
-
-    new_lines = lines[:insert_idx] + block_lines + lines[insert_idx:]
-    return "\n".join(new_lines).rstrip() + "\n"
-
+    anchor_idx: dict[str, int] = {}
+    at: dict[int, list[list[str]]] = {}
+
+    for block_lines, insert_after in inserts:
+        idx = len(lines)
+        if insert_after:
+            if insert_after not in anchor_idx:
+                anchor_idx[insert_after] = _anchor_index(
+                    lines, insert_after, resume.get(insert_after) if resume is not None else None
+                )
+            idx = anchor_idx[insert_after]
+            if resume is not None:
+                resume[insert_after] = block_lines[0]
+        at.setdefault(idx, []).append(block_lines)
+
+    out: list[str] = []
+    for idx in range(len(lines) + 1):
+        for block_lines in at.get(idx, ()):
+            if out and out[-1].strip():
+                out.append("")
+            out.extend(block_lines)
+        if idx < len(lines):
+            out.append(lines[idx])
+
+    return "\n".join(out).rstrip() + "\n"
+
+
+def claim_text_key(text: str) -> bytes:
+    """
+    Exact-duplicate key for a claim sentence: [C] marker, case and whitespace ignored.
+    """
+    norm = " ".join(text.replace("[C]", " ").replace("[c]", " ").split()).lower()
+    return hashlib.sha256(norm.encode("utf-8")).digest()[:16]
+
+
+def existing_claim_keys(parts_dir: Path) -> set[bytes]:
+    """
+    Hash index of claims already written into the parts (inline [C] and CLAIM: lines).
+    """
+    keys: set[bytes] = set()
+    for p in sorted(parts_dir.glob("*.md")):
+        with p.open(encoding="utf-8") as f:
+            keys.update(claim_keys(f))
+    return keys
+
+
+def claim_keys(lines: Iterable[str]) -> Iterator[bytes]:
+    for line in lines:
+        m = C_SUFFIX_RE.match(line) or CLAIM_LINE_RE.match(line)
+        if m:
+            yield claim_text_key(m.group(1))
+
+
+def dossier_for(part: Path, dossiers: list[Dossier]) -> Dossier:
+    """
+    The dossier whose parts dir holds part; the first configured dossier otherwise.
+    """
+    p = part.as_posix()
+    for d in dossiers:
+        if p.startswith(f"{d.parts}/"):
+            return d
+    return dossiers[0]
+
+
+class PartKeys:
+    """
+    existing_claim_keys() per dossier, scanned on first use. Items are checked against the
+    parts dir (dossier/dossiers.json) their own part belongs to.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.dossiers = load_dossiers(root)
+        self._keys: dict[str, set[bytes]] = {}
+
+    def for_part(self, part: Path) -> set[bytes]:
+        d = dossier_for(part, self.dossiers)
+        if d.name not in self._keys:
+            self._keys[d.name] = existing_claim_keys(self.root / d.parts)
+        return self._keys[d.name]
+
+
+def ledger_index(root: Path, d: Dossier, threshold: float) -> LSHIndex:
+    """
+    LSH index over the dossier's built claims.json. Signatures come from the same cache
+    find_duplicates.py keeps, so only claims added since it last ran are hashed.
+    """
+    claims_json = root / d.site / "claims.json"
+    if not claims_json.exists():
+        raise FileNotFoundError(f"Claims ledger not found for duplicate check: {claims_json}")
+    cache_path = root / d.signatures
+    cache = load_signature_cache(cache_path)
+    index = build_claim_index(json.loads(claims_json.read_text(encoding="utf-8")), threshold, cache)
+    save_signature_cache(cache_path, cache)
+    return index
+
+
+class DuplicateFilter:
+    """
+    Near-duplicate check against the ledger of the dossier (dossier/dossiers.json) each
+    item's part belongs to. A dossier's LSH index is built on first use and kept; every
+    accepted item is added to it, so later items are also checked against earlier ones.
+    """
+
+    def __init__(self, root: Path, threshold: float) -> None:
+        self.root = root
+        self.threshold = threshold
+        self.dossiers = load_dossiers(root)
+        self.indexes: dict[str, LSHIndex] = {}
+
+    def match(self, key: str, item: QueueItem) -> tuple[str, float] | None:
+        """
+        The closest existing claim as (id, similarity), or None after adding item under key.
+        """
+        d = dossier_for(item.part, self.dossiers)
+        if d.name not in self.indexes:
+            self.indexes[d.name] = ledger_index(self.root, d, self.threshold)
+        index = self.indexes[d.name]
+        sig = signature_for(item.claim, item.title)
+        matches = index.query(sig)
+        if matches:
+            return matches[0]
+        index.add(key, sig)
+        return None
+
+
+def filter_duplicates(items: Iterable[QueueItem], root: Path, threshold: float) -> Iterator[QueueItem]:
+    """
+    Drop queue items that look like near-duplicates of existing ledger claims
+    (or of earlier items in the same queue) and report them.
+    """
+    dupes = DuplicateFilter(root, threshold)
+    for n, item in enumerate(items, start=1):
+        hit = dupes.match(f"queue-item-{n}", item)
+        if hit:
+            print(f"Skipping queue item {n} (~{hit[1]:.2f} similar to {hit[0]}): {item.claim[:80]}")
+            continue
+        yield item
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Exclusive advisory lock on path (created if missing), held for the with-block.
+    Blocks until every other holder, in any process, has released it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def part_lock(root: Path, part_path: Path):
+    digest = hashlib.sha1(str(part_path).encode("utf-8")).hexdigest()[:8]
+    return file_lock(root / LOCK_DIR / f"{part_path.name}.{digest}.lock")
+
+
+def write_atomic(path: Path, text: str) -> None:
+    # the tmp name does not end in .md, so builds globbing the parts never pick it up
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+def _flush(
+    root: Path,
+    pending: dict[Path, list[QueueItem]],
+    dry_run: bool,
+    touched: list[Path],
+    resume: dict[Path, dict[str, str]],
+) -> None:
+    for part, items in pending.items():
+        part_path = (root / part).resolve()
+        if not part_path.exists():
+            raise FileNotFoundError(f"Part not found: {part_path}")
 
-def apply_queue(queue_path: Path, root: Path, dry_run: bool) -> list[Path]:
-    items = [normalize_item(raw) for raw in load_queue(queue_path)]
+        # read-modify-write under the part's lock, so a concurrent run cannot write
+        # between our read and our write and have its inserts lost
+        with part_lock(root, part_path):
+            original = part_path.read_text(encoding="utf-8")
+            updated = insert_blocks(
+                original,
+                [(build_claim_block(it), it.insert_after) for it in items],
+                # a dry run never writes, so every batch sees the original text
+                None if dry_run else resume.setdefault(part_path, {}),
+            )
+
+            if updated != original:
+                if part_path not in touched:
+                    touched.append(part_path)
+                if not dry_run:
+                    write_atomic(part_path, updated)
+    pending.clear()
+
+
+def apply_queue(
+    queue_path: Path,
+    root: Path,
+    dry_run: bool,
+    dedupe_threshold: float | None = None,
+) -> list[Path]:
+    items: Iterable[QueueItem] = iter_items(queue_path)
+    if dedupe_threshold is not None:
+        items = filter_duplicates(items, root, dedupe_threshold)
+
+    seen = PartKeys(root)
+    pending: dict[Path, list[QueueItem]] = {}
+    resume: dict[Path, dict[str, str]] = {}
+    pending_count = 0
+    skipped = 0
     touched: list[Path] = []
 
     for item in items:
-        part_path = (root / item.part).resolve()
-        if not part_path.exists():
-            raise FileNotFoundError(f"Part not found: {part_path}")
+        key = claim_text_key(item.claim)
+        keys = seen.for_part(item.part)
+        if key in keys:
+            skipped += 1
+            continue
+        keys.add(key)
 
-        original = part_path.read_text(encoding="utf-8")
-        updated = insert_block(original, build_claim_block(item), item.insert_after)
+        pending.setdefault(item.part, []).append(item)
+        pending_count += 1
+        if pending_count >= BATCH_SIZE:
+            _flush(root, pending, dry_run, touched, resume)
+            pending_count = 0
 
-        if updated != original:
-            touched.append(part_path)
-            if not dry_run:
-                part_path.write_text(updated, encoding="utf-8")
+    _flush(root, pending, dry_run, touched, resume)
 
+    if skipped:
+        print(f"Skipped {skipped} item(s) already present in the parts.")
     return touched
 
 
+# -----------------------------
+# Spool mode
+# -----------------------------
+def init_spool(spool: Path) -> None:
+    for name in SPOOL_DIRS:
+        (spool / name).mkdir(parents=True, exist_ok=True)
+
+
+def spool_name() -> str:
+    # sorts by submission time, so workers take items roughly first-in first-out
+    return f"{time.time_ns():020d}-{os.getpid()}-{secrets.token_hex(4)}.json"
+
+
+def submit(spool: Path, queue_path: Path) -> int:
+    """
+    Validate a queue file (YAML, JSONL or CSV) and spool each item as its own file.
+    """
+    init_spool(spool)
+    n = 0
+    for item in iter_items(queue_path):
+        record = {
+            "claim": item.claim,
+            "part": item.part.as_posix(),
+            "insert_after": item.insert_after or "",
+            "date": item.date,
+            "title": item.title,
+            "tags": item.tags,
+            "note": item.note,
+            "sources": item.sources,
+        }
+        name = spool_name()
+        tmp = spool / "tmp" / name
+        tmp.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(spool / "pending" / name)
+        n += 1
+    return n
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # no signal-0 probe on Windows; never reclaim there
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def recover_stale(spool: Path) -> int:
+    """
+    Return items held by dead workers on this host to pending/. An item that was already
+    written into its part before the worker died is then skipped as a duplicate, so
+    recovery never applies a claim twice.
+    """
+    host = socket.gethostname()
+    moved = 0
+    for d in sorted((spool / "work").iterdir()):
+        h, _, pid = d.name.rpartition("-")
+        if not d.is_dir() or h != host or not pid.isdigit() or _alive(int(pid)):
+            continue
+        for p in sorted(d.glob("*.json")):
+            try:
+                p.rename(spool / "pending" / p.name)
+                moved += 1
+            except FileNotFoundError:
+                pass  # another worker recovered it first
+        try:
+            d.rmdir()
+        except OSError:
+            pass
+    return moved
+
+
+def claim_items(spool: Path, worker: str, limit: int) -> list[Path]:
+    mine = spool / "work" / worker
+    mine.mkdir(parents=True, exist_ok=True)
+    claimed: list[Path] = []
+    for p in sorted((spool / "pending").glob("*.json")):
+        if len(claimed) >= limit:
+            break
+        try:
+            p.rename(mine / p.name)
+        except FileNotFoundError:
+            continue  # another worker claimed it between the listing and the rename
+        claimed.append(mine / p.name)
+    return claimed
+
+
+def append_journal(spool: Path, records: list[dict]) -> None:
+    if not records:
+        return
+    text = "".join(json.dumps(r, ensure_ascii=False, sort_keys=True) + "\n" for r in records)
+    with file_lock(spool / f"{JOURNAL}.lock"):
+        with (spool / JOURNAL).open("a", encoding="utf-8") as f:
+            f.write(text)
+
+
+def process_batch(
+    spool: Path,
+    root: Path,
+    worker: str,
+    paths: list[Path],
+    dupes: DuplicateFilter | None,
+    resume: dict[Path, dict[str, str]],
+) -> list[str]:
+    """
+    Apply one worker's claimed items: one locked read-modify-write per part file, then
+    move every item to done/ or failed/ and journal it. Returns each item's status
+    ("applied", "skipped" or "failed").
+    """
+    results: dict[Path, tuple[str, str]] = {}
+    items: list[tuple[Path, QueueItem]] = []
+    for p in paths:
+        try:
+            items.append((p, normalize_item(json.loads(p.read_text(encoding="utf-8")))))
+        except (OSError, ValueError, AttributeError) as e:
+            results[p] = ("failed", str(e))
+
+    if dupes is not None:
+        kept = []
+        for p, it in items:
+            hit = dupes.match(p.name, it)
+            if hit:
+                results[p] = ("skipped", f"~{hit[1]:.2f} similar to {hit[0]}")
+            else:
+                kept.append((p, it))
+        items = kept
+
+    seen = PartKeys(root)
+    by_part: dict[Path, list[tuple[Path, QueueItem]]] = {}
+    for p, it in items:
+        key = claim_text_key(it.claim)
+        keys = seen.for_part(it.part)
+        if key in keys:
+            results[p] = ("skipped", "already in the parts")
+            continue
+        keys.add(key)
+        by_part.setdefault(it.part, []).append((p, it))
+
+    for part, group in by_part.items():
+        part_path = (root / part).resolve()
+        try:
+            with part_lock(root, part_path):
+                original = part_path.read_text(encoding="utf-8")
+                # the scan above is unlocked: another worker may have written one of these since
+                present = set(claim_keys(original.splitlines()))
+                fresh = []
+                for p, it in group:
+                    if claim_text_key(it.claim) in present:
+                        results[p] = ("skipped", "already in the parts")
+                    else:
+                        fresh.append((p, it))
+                if fresh:
+                    updated = insert_blocks(
+                        original,
+                        [(build_claim_block(it), it.insert_after) for _, it in fresh],
+                        resume.setdefault(part_path, {}),
+                    )
+                    write_atomic(part_path, updated)
+                for p, _ in fresh:
+                    results[p] = ("applied", part.as_posix())
+        except OSError as e:
+            for p, _ in group:
+                results.setdefault(p, ("failed", f"{part.as_posix()}: {e}"))
+
+    # parts are written before items leave work/: a crash in between leaves them to be
+    # recovered and then skipped as already present, never lost
+    records: list[dict] = []
+    at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    for p in paths:
+        status, detail = results[p]
+        p.rename(spool / ("failed" if status == "failed" else "done") / p.name)
+        records.append({"at": at, "worker": worker, "item": p.name, "status": status, "detail": detail})
+    append_journal(spool, records)
+    return [results[p][0] for p in paths]
+
+
+def run_worker(spool: Path, root: Path, batch: int, dedupe_threshold: float | None) -> dict[str, int]:
+    """
+    Claim and apply batches until pending/ is empty.
+    """
+    init_spool(spool)
+    recover_stale(spool)
+    worker = worker_id()
+    resume: dict[Path, dict[str, str]] = {}
+    # one index per worker, grown with each accepted item rather than rebuilt per batch
+    dupes = DuplicateFilter(root, dedupe_threshold) if dedupe_threshold is not None else None
+    totals = {"applied": 0, "skipped": 0, "failed": 0}
+    while True:
+        paths = claim_items(spool, worker, batch)
+        if not paths:
+            break
+        for status in process_batch(spool, root, worker, paths, dupes, resume):
+            totals[status] += 1
+    try:
+        (spool / "work" / worker).rmdir()
+    except OSError:
+        pass
+    return totals
+
+
+def run_spool(spool: Path, root: Path, batch: int, workers: int, dedupe_threshold: float | None) -> dict[str, int]:
+    if workers <= 1:
+        return run_worker(spool, root, batch, dedupe_threshold)
+    totals = {"applied": 0, "skipped": 0, "failed": 0}
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(run_worker, spool, root, batch, dedupe_threshold) for _ in range(workers)]
+        for fut in futures:
+            for k, v in fut.result().items():
+                totals[k] += v
+    return totals
+
+
+def spool_pending(spool: Path) -> dict[str, int]:
+    """
+    Pending item count per target part, for --dry-run.
+    """
+    counts: dict[str, int] = {}
+    for p in sorted((spool / "pending").glob("*.json")):
+        try:
+            part = str(json.loads(p.read_text(encoding="utf-8")).get("part", "?"))
+        except (OSError, ValueError, AttributeError):
+            part = "(unreadable)"
+        counts[part] = counts.get(part, 0) + 1
+    return counts
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Apply claim queue YAML into dossier parts.")
+    parser = argparse.ArgumentParser(description="Apply a claim queue (YAML, JSONL or CSV) into dossier parts.")
     parser.add_argument(
         "queue",
         type=Path,
         nargs="?",
         default=Path("dossier/claim_queue.yaml"),
-        help="Path to the queue YAML file (default: dossier/claim_queue.yaml)",
+        help="Queue file: .yaml, .jsonl/.ndjson or .csv, or a spool dir such as dossier/queue (default: dossier/claim_queue.yaml)",
     )
     parser.add_argument(
         "--root",
@@ -204,9 +774,45 @@ def main() -> None:
         help="Repository root (default: .)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Parse and report without writing files.")
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Skip items that near-duplicate claims in their dossier's built claims.json.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Similarity threshold for --dedupe (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--submit", type=Path, default=None, metavar="QUEUE_FILE", help="Spool mode: split this queue file into one pending item per claim under the spool dir given as the queue argument")
+    parser.add_argument("--batch", type=int, default=SPOOL_BATCH, help=f"Spool mode: items a worker claims at a time (default: {SPOOL_BATCH})")
+    parser.add_argument("--workers", type=int, default=1, help="Spool mode: worker processes (default: 1)")
     args = parser.parse_args()
-
-    touched = apply_queue(args.queue, args.root, args.dry_run)
+    dedupe_threshold = args.threshold if args.dedupe else None
+
+    if args.submit is not None or args.queue.is_dir():
+        spool = args.queue
+        if args.submit is not None:
+            n = submit(spool, args.submit)
+            print(f"Spooled {n} item(s) into {spool / 'pending'}")
+            return
+        if args.dry_run:
+            counts = spool_pending(spool)
+            for part, n in sorted(counts.items()):
+                print(f"- {part}: {n} pending")
+            print(f"{sum(counts.values())} item(s) pending in {spool / 'pending'}")
+            return
+        totals = run_spool(spool, args.root, args.batch, args.workers, dedupe_threshold)
+        print(
+            f"Applied {totals['applied']}, skipped {totals['skipped']}, failed {totals['failed']} "
+            f"(journal: {spool / JOURNAL})"
+        )
+        if totals["failed"]:
+            raise SystemExit(1)
+        return
+
+    touched = apply_queue(args.queue, args.root, args.dry_run, dedupe_threshold)
     if args.dry_run:
         if touched:
             print("Would update:")
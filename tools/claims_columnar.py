@@ -0,0 +1,152 @@
+# tools/claims_columnar.py
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+
+# Columnar, interned encoding of claims.min.json rows:
+#   {
+#     "v": 1,
+#     "n": <row count>,
+#     "s":  [section ids],    lookup table
+#     "u":  [section urls],   lookup table
+#     "tg": [tags],           lookup table
+#     "cols": {
+#       "s":  [section index per row],
+#       "i":  [claim number within section per row],   id = C-<section>-<NNN>
+#       "u":  [url index per row],
+#       "t":  [claim text per row],
+#       "ec": [evidence count per row],
+#       "d":  [date per row],
+#       "ti": [title per row],
+#       "tg": [[tag index, ...] per row]
+#     }
+#   }
+COLUMNAR_VERSION = 1
+
+
+def _split_claim_id(cid: str) -> tuple[str, int] | None:
+    # C-<section id>-<NNN>, where the section id itself may contain dashes
+    if not cid.startswith("C-"):
+        return None
+    head, _, num = cid[2:].rpartition("-")
+    if not head or not num.isdigit():
+        return None
+    return head, int(num)
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.table: list[str] = []
+        self.index: dict[str, int] = {}
+
+    def __call__(self, s: str) -> int:
+        i = self.index.get(s)
+        if i is None:
+            i = len(self.table)
+            self.index[s] = i
+            self.table.append(s)
+        return i
+
+
+def encode_columnar(claims_min: list[dict]) -> dict:
+    secs = _Interner()
+    urls = _Interner()
+    tags = _Interner()
+
+    cols: dict[str, list] = {k: [] for k in ("s", "i", "u", "t", "ec", "d", "ti", "tg")}
+
+    for row in claims_min:
+        parts = _split_claim_id(row["id"])
+        if parts is None:
+            raise ValueError(f"Claim id is not in C-<section>-<NNN> form: {row['id']}")
+        sec_id, num = parts
+
+        cols["s"].append(secs(sec_id))
+        cols["i"].append(num)
+        cols["u"].append(urls(row.get("u", "")))
+        cols["t"].append(row.get("t", ""))
+        cols["ec"].append(int(row.get("ec", 0)))
+        cols["d"].append(row.get("d", ""))
+        cols["ti"].append(row.get("ti", ""))
+        cols["tg"].append([tags(t) for t in row.get("tg", [])])
+
+    return {
+        "v": COLUMNAR_VERSION,
+        "n": len(claims_min),
+        "s": secs.table,
+        "u": urls.table,
+        "tg": tags.table,
+        "cols": cols,
+    }
+
+
+def decode_columnar(doc: dict) -> list[dict]:
+    """
+    Rebuild claims.min.json rows (same keys, same order) from the columnar form.
+    """
+    if doc.get("v") != COLUMNAR_VERSION:
+        raise ValueError(f"Unsupported columnar version: {doc.get('v')}")
+
+    secs = doc["s"]
+    urls = doc["u"]
+    tags = doc["tg"]
+    c = doc["cols"]
+
+    return [
+        {
+            "id": f"C-{secs[s]}-{i:03d}",
+            "u": urls[u],
+            "t": t,
+            "ec": ec,
+            "d": d,
+            "ti": ti,
+            "tg": [tags[k] for k in tg],
+        }
+        for s, i, u, t, ec, d, ti, tg in zip(
+            c["s"], c["i"], c["u"], c["t"], c["ec"], c["d"], c["ti"], c["tg"]
+        )
+    ]
+
+
+def dumps_columnar(doc: dict) -> str:
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def compare(site: Path, repeat: int = 20) -> None:
+    """
+    Print size and parse-time numbers for claims.min.json vs claims.min.cols.json.
+    """
+    row_text = (site / "claims.min.json").read_text(encoding="utf-8")
+    col_text = (site / "claims.min.cols.json").read_text(encoding="utf-8")
+
+    row_bytes = len(row_text.encode("utf-8"))
+    col_bytes = len(col_text.encode("utf-8"))
+
+    t_row = _best_of(lambda: json.loads(row_text), repeat)
+    t_col = _best_of(lambda: json.loads(col_text), repeat)
+    t_dec = _best_of(lambda: decode_columnar(json.loads(col_text)), repeat)
+
+    print(f"claims.min.json       {row_bytes:>9} bytes  parse {t_row * 1000:.3f} ms")
+    print(f"claims.min.cols.json  {col_bytes:>9} bytes  parse {t_col * 1000:.3f} ms  parse+decode {t_dec * 1000:.3f} ms")
+    if row_bytes:
+        print(f"size ratio: {col_bytes / row_bytes:.3f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python tools/claims_columnar.py <site_dir>")
+        sys.exit(1)
+    compare(Path(sys.argv[1]))
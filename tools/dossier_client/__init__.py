@@ -0,0 +1,35 @@
+# tools/dossier_client/__init__.py
+"""
+Caching reader for a published dossier site (a local site dir or a base URL).
+
+    from dossier_client import DossierClient
+
+    client = DossierClient("https://42ndmoose.github.io/llm-test-pad/dossier/site/")
+    for s in client.toc():
+        print(s.label, s.url)
+    print(client.section_text("8")[:500])
+    for c in client.claims(section="8", tag="doj"):
+        print(c.id, client.claim(c.id).links)
+
+Standard library only, so the package can be copied into an agent's own tree.
+"""
+from __future__ import annotations
+
+from .client import DossierClient, LocalSite, RemoteSite
+from .http_cache import FetchError, HttpCache, Response
+from .lru import LRU
+from .models import Claim, ClaimSummary, Related, Section
+
+__all__ = [
+    "Claim",
+    "ClaimSummary",
+    "DossierClient",
+    "FetchError",
+    "HttpCache",
+    "LRU",
+    "LocalSite",
+    "Related",
+    "RemoteSite",
+    "Response",
+    "Section",
+]
@@ -0,0 +1,51 @@
+# tools/dossier_client/__main__.py
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from .client import DossierClient
+from .http_cache import FetchError, default_cache_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m dossier_client", description="Read a dossier site through the caching client.")
+    parser.add_argument("source", help="Site dir (dossier/site) or base URL")
+    parser.add_argument("--cache-dir", type=Path, default=None, help=f"HTTP cache dir (default: {default_cache_dir()})")
+    parser.add_argument("--max-age", type=float, default=60.0, help="Seconds a cached resource is used without revalidating (default: 60)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("toc", help="List sections.")
+    p_sec = sub.add_parser("section", help="Print one section's text.")
+    p_sec.add_argument("ref", help="Section id, id prefix or number")
+    p_cl = sub.add_parser("claims", help="List claims.")
+    p_cl.add_argument("--section", default=None)
+    p_cl.add_argument("--tag", default=None)
+    p_one = sub.add_parser("claim", help="Print one claim record as JSON.")
+    p_one.add_argument("id")
+    p_get = sub.add_parser("fetch", help="Write one raw resource to stdout.")
+    p_get.add_argument("name")
+    args = parser.parse_args()
+
+    client = DossierClient(args.source, cache_dir=args.cache_dir, max_age=args.max_age)
+    try:
+        if args.cmd == "toc":
+            for s in client.toc():
+                print(f"{'  ' * (s.level - 1)}{s.label}  ({s.id})")
+        elif args.cmd == "section":
+            sys.stdout.write(client.section_text(args.ref))
+        elif args.cmd == "claims":
+            for c in client.claims(args.section, args.tag):
+                print(f"{c.id:<44} {c.date or '-':<10} {c.text[:80]}")
+        elif args.cmd == "claim":
+            print(json.dumps(asdict(client.claim(args.id)), ensure_ascii=False, indent=2))
+        else:
+            sys.stdout.buffer.write(client.fetch(args.name).body)
+    except (KeyError, FetchError) as e:
+        raise SystemExit(str(e).strip("'\"")) from None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# tools/dossier_client/client.py
+from __future__ import annotations
+
+import json
+import re
+import time
+from html import unescape
+from pathlib import Path
+from typing import Callable, TypeVar
+from urllib.parse import quote, urljoin
+
+from .http_cache import FetchError, HttpCache, Response
+from .lru import LRU
+from .models import Claim, ClaimSummary, Related, Section
+
+
+T = TypeVar("T")
+
+PRE_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL)
+SECTION_META_RE = re.compile(r'<script type="application/json" id="section-meta">(.*?)</script>', re.DOTALL)
+
+MANIFEST = "assets.json"
+
+
+class LocalSite:
+    """
+    A built site dir on disk. Versions come from (mtime, size), so nothing is hashed.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.location = root.as_posix()
+
+    def _path(self, name: str) -> Path:
+        p = (self.root / name).resolve()
+        if self.root.resolve() not in p.parents:
+            raise FetchError(name, "outside the site dir")
+        return p
+
+    def get(self, name: str, immutable: bool = False) -> Response:
+        p = self._path(name)
+        try:
+            st = p.stat()
+            body = p.read_bytes()
+        except FileNotFoundError:
+            raise FetchError(p.as_posix(), "not found", 404) from None
+        return Response(p.as_posix(), body, f'"{st.st_mtime_ns:x}-{st.st_size:x}"', "", "local")
+
+    def get_range(self, name: str, start: int, length: int, if_range: str = "") -> bytes:
+        try:
+            with self._path(name).open("rb") as f:
+                f.seek(start)
+                return f.read(length)
+        except FileNotFoundError:
+            raise FetchError(name, "not found", 404) from None
+
+
+class RemoteSite:
+    """
+    A published site under a base URL, fetched through the on-disk HTTP cache.
+    """
+
+    def __init__(self, base_url: str, cache: HttpCache) -> None:
+        self.base = base_url if base_url.endswith("/") else base_url + "/"
+        self.cache = cache
+        self.location = self.base
+
+    def url(self, name: str) -> str:
+        return urljoin(self.base, quote(name))
+
+    def get(self, name: str, immutable: bool = False) -> Response:
+        return self.cache.get(self.url(name), immutable=immutable)
+
+    def get_range(self, name: str, start: int, length: int, if_range: str = "") -> bytes:
+        return self.cache.get_range(self.url(name), start, length, if_range=if_range)
+
+
+class DossierClient:
+    """
+    Reads a dossier site, from a local dir or a base URL, and hands back parsed records.
+
+    Raw resources go through the HTTP cache (remote) or the file system (local); parsed
+    objects are kept in a bounded LRU keyed by (resource, version), so a resource is
+    parsed once per version and memory stays capped however many sections are read.
+    Claims are fetched one at a time through claims.ndjson.idx.json when the site has it.
+    When the site publishes fingerprinted copies (assets.json), those are fetched instead
+    and never revalidated.
+    """
+
+    def __init__(
+        self,
+        source: str | Path,
+        *,
+        cache_dir: str | Path | None = None,
+        max_age: float = 60.0,
+        timeout: float = 30.0,
+        lru_entries: int = 256,
+        lru_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        src = str(source)
+        if src.startswith(("http://", "https://")):
+            self.site: LocalSite | RemoteSite = RemoteSite(src, HttpCache(cache_dir, max_age=max_age, timeout=timeout))
+        else:
+            root = Path(src)
+            if not root.is_dir():
+                raise FileNotFoundError(f"No site dir at {root}")
+            self.site = LocalSite(root)
+        self.max_age = max_age
+        self.lru = LRU(lru_entries, lru_bytes)
+        self._no_manifest_until = 0.0
+
+    # -----------------------------
+    # Raw resources
+    # -----------------------------
+    def _manifest(self) -> dict[str, str]:
+        if time.monotonic() < self._no_manifest_until:
+            return {}
+        try:
+            r = self.site.get(MANIFEST)
+        except FetchError as e:
+            if e.status not in (404, None):
+                raise
+            # not published (404), or unreachable with nothing cached: use the plain names,
+            # which may still be served from the cache
+            self._no_manifest_until = time.monotonic() + self.max_age
+            return {}
+        return self._parse(MANIFEST, r, lambda b: json.loads(b).get("assets", {}))
+
+    def fetch(self, name: str) -> Response:
+        """
+        One resource by its published name (e.g. "toc.json", "claims/pages.json").
+        """
+        hashed = self._manifest().get(name) if name != MANIFEST else None
+        if hashed:
+            return self.site.get(hashed, immutable=True)
+        return self.site.get(name)
+
+    def _parse(self, name: str, r: Response, parse: Callable[[bytes], T]) -> T:
+        key = (name, r.version)
+        hit = self.lru.get(key)
+        if hit is None:
+            hit = parse(r.body)
+            self.lru.put(key, hit, len(r.body))
+        return hit  # type: ignore[return-value]
+
+    def _load(self, name: str, parse: Callable[[bytes], T]) -> T:
+        return self._parse(name, self.fetch(name), parse)
+
+    def text(self, name: str) -> str:
+        return self.fetch(name).body.decode("utf-8")
+
+    # -----------------------------
+    # Sections
+    # -----------------------------
+    def index_html(self) -> str:
+        return self.text("index.html")
+
+    def toc(self) -> list[Section]:
+        return self._load("toc.json", lambda b: [Section.from_json(e) for e in json.loads(b)])
+
+    def section(self, ref: str) -> Section:
+        """
+        A section by id ("08-trump-vs-architecture"), id prefix ("08") or number ("8"),
+        the same forms the query API accepts.
+        """
+        toc = self.toc()
+        for s in toc:
+            if s.id == ref:
+                return s
+        prefixed = [s for s in toc if s.id.startswith(f"{ref}-")]
+        if len(prefixed) == 1:
+            return prefixed[0]
+        numbered = [s for s in toc if s.number and s.number == ref]
+        if len(numbered) == 1:
+            return numbered[0]
+        raise KeyError(f"No section {ref!r} in {self.site.location}")
+
+    def _page(self, ref: str) -> tuple[str, dict]:
+        s = self.section(ref)
+
+        def parse(body: bytes) -> tuple[str, dict]:
+            html = body.decode("utf-8")
+            pre = PRE_RE.search(html)
+            meta = SECTION_META_RE.search(html)
+            return (
+                unescape(pre.group(1)) if pre else "",
+                json.loads(unescape(meta.group(1))) if meta else {},
+            )
+
+        return self._load(s.url, parse)
+
+    def section_text(self, ref: str) -> str:
+        """
+        The section's text as the page shows it (claims stripped).
+        """
+        return self._page(ref)[0]
+
+    def section_meta(self, ref: str) -> dict:
+        return self._page(ref)[1]
+
+    def related(self, ref: str) -> list[Related]:
+        return self.section(ref).related_auto
+
+    # -----------------------------
+    # Claims
+    # -----------------------------
+    def claims(self, section: str | None = None, tag: str | None = None) -> list[ClaimSummary]:
+        """
+        Claim summaries from claims.min.json, optionally for one section and/or tag.
+        """
+        rows = self._load("claims.min.json", lambda b: [ClaimSummary.from_min_json(d) for d in json.loads(b)])
+        if section is not None:
+            url = self.section(section).url
+            rows = [c for c in rows if c.url == url]
+        if tag is not None:
+            t = tag.lower()
+            rows = [c for c in rows if any(x.lower() == t for x in c.tags)]
+        return rows
+
+    def all_claims(self) -> dict[str, Claim]:
+        """
+        Every full claim record by id (claims.json).
+        """
+        return self._load("claims.json", lambda b: {d["id"]: Claim.from_json(d) for d in json.loads(b)})
+
+    def claim(self, claim_id: str) -> Claim:
+        """
+        One full claim record. Reads just its line of claims.ndjson when the site has the
+        offset index, so looking up one claim does not download the whole ledger.
+        """
+        try:
+            idx_resp = self.fetch("claims.ndjson.idx.json")
+        except FetchError as e:
+            if e.status != 404:
+                raise
+            return self._from_ledger(claim_id)
+
+        idx = self._parse("claims.ndjson.idx.json", idx_resp, json.loads)
+        span = idx.get("claims", {}).get(claim_id)
+        if span is None:
+            raise KeyError(f"No claim {claim_id!r} in {self.site.location}")
+
+        key = ("claim", claim_id, idx_resp.version)
+        hit = self.lru.get(key)
+        if hit is not None:
+            return hit  # type: ignore[return-value]
+        offset, length = span
+        raw = self.site.get_range(idx.get("file", "claims.ndjson"), offset, length)
+        try:
+            claim = Claim.from_json(json.loads(raw))
+        except (ValueError, KeyError):
+            claim = None
+        if claim is None or claim.id != claim_id:
+            # the ndjson moved on since the index was cached; the full ledger is authoritative
+            return self._from_ledger(claim_id)
+        self.lru.put(key, claim, length)
+        return claim
+
+    def _from_ledger(self, claim_id: str) -> Claim:
+        try:
+            return self.all_claims()[claim_id]
+        except KeyError:
+            raise KeyError(f"No claim {claim_id!r} in {self.site.location}") from None
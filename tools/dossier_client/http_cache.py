@@ -0,0 +1,188 @@
+# tools/dossier_client/http_cache.py
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+
+USER_AGENT = "dossier-client/1"
+DEFAULT_TIMEOUT = 30.0
+
+
+class FetchError(OSError):
+    """
+    A resource could not be fetched and there was no cached copy to fall back on.
+    """
+
+    def __init__(self, url: str, reason: str, status: int | None = None) -> None:
+        super().__init__(f"{url}: {reason}")
+        self.url = url
+        self.status = status
+
+
+@dataclass(slots=True)
+class Response:
+    url: str
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+    # "network" (200), "revalidated" (304), "fresh" (cached, within max_age or immutable)
+    # or "stale" (cached, the server could not be reached)
+    source: str = "network"
+
+    @property
+    def version(self) -> str:
+        """
+        Identifies this body: the ETag when the server sent one, else a content hash.
+        """
+        return self.etag or hashlib.sha256(self.body).hexdigest()[:20]
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "dossier_client"
+
+
+def _decode(body: bytes, encoding: str | None) -> bytes:
+    return gzip.decompress(body) if (encoding or "").lower() == "gzip" else body
+
+
+class HttpCache:
+    """
+    On-disk HTTP cache with conditional revalidation. Each URL is stored as <key>.body plus
+    <key>.json holding its ETag/Last-Modified and when it was last confirmed current.
+    A cached entry younger than max_age seconds (or fetched as immutable, for fingerprinted
+    names) is served without a request; older ones are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged resource costs one empty 304.
+    """
+
+    def __init__(self, root: str | Path | None = None, *, max_age: float = 60.0, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_age = max_age
+        self.timeout = timeout
+        self.requests = 0
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def cached(self, url: str) -> tuple[dict, bytes] | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or meta.get("sha256") != hashlib.sha256(body).hexdigest():
+            return None  # torn write or hash collision: refetch
+        return meta, body
+
+    def _store(self, url: str, body: bytes, etag: str, last_modified: str, immutable: bool) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked": time.time(),
+            "immutable": immutable,
+            "sha256": hashlib.sha256(body).hexdigest(),
+        }
+        # body first: a meta file never points at a body that is not there yet
+        for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode("utf-8"))):
+            tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+
+    def _touch(self, url: str, meta: dict) -> None:
+        meta_path, _ = self._paths(url)
+        meta["checked"] = time.time()
+        tmp = meta_path.with_name(meta_path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(meta_path)
+
+    def _open(self, req: urllib.request.Request):
+        self.requests += 1
+        return urllib.request.urlopen(req, timeout=self.timeout)
+
+    def get(self, url: str, *, immutable: bool = False) -> Response:
+        hit = self.cached(url)
+        if hit is not None:
+            meta, body = hit
+            age = time.time() - float(meta.get("checked", 0))
+            if meta.get("immutable") or immutable or age < self.max_age:
+                return Response(url, body, meta.get("etag", ""), meta.get("last_modified", ""), "fresh")
+
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"})
+        if hit is not None:
+            if hit[0].get("etag"):
+                req.add_header("If-None-Match", hit[0]["etag"])
+            if hit[0].get("last_modified"):
+                req.add_header("If-Modified-Since", hit[0]["last_modified"])
+
+        try:
+            with self._open(req) as resp:
+                body = _decode(resp.read(), resp.headers.get("Content-Encoding"))
+                etag = resp.headers.get("ETag", "")
+                last_modified = resp.headers.get("Last-Modified", "")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and hit is not None:
+                meta, body = hit
+                self._touch(url, meta)
+                return Response(url, body, meta.get("etag", ""), meta.get("last_modified", ""), "revalidated")
+            raise FetchError(url, f"HTTP {e.code}", e.code) from None
+        except (urllib.error.URLError, OSError) as e:
+            if hit is not None:
+                meta, body = hit
+                return Response(url, body, meta.get("etag", ""), meta.get("last_modified", ""), "stale")
+            raise FetchError(url, str(getattr(e, "reason", e))) from None
+
+        self._store(url, body, etag, last_modified, immutable)
+        return Response(url, body, etag, last_modified, "network")
+
+    def get_range(self, url: str, start: int, length: int, *, if_range: str = "") -> bytes:
+        """
+        bytes [start, start + length) of a resource. Uses a Range request when there is no
+        fresh cached copy; a server that ignores Range sends the whole body, which is then
+        cached like a normal fetch. if_range (an ETag) makes the server send the whole
+        current body instead of a slice of a newer version.
+        """
+        hit = self.cached(url)
+        if hit is not None:
+            meta, body = hit
+            if meta.get("immutable") or time.time() - float(meta.get("checked", 0)) < self.max_age:
+                return body[start : start + length]
+
+        headers = {"User-Agent": USER_AGENT, "Range": f"bytes={start}-{start + length - 1}"}
+        if if_range:
+            headers["If-Range"] = if_range
+        try:
+            with self._open(urllib.request.Request(url, headers=headers)) as resp:
+                data = resp.read()
+                if resp.status == 206:
+                    return data
+                data = _decode(data, resp.headers.get("Content-Encoding"))
+                self._store(url, data, resp.headers.get("ETag", ""), resp.headers.get("Last-Modified", ""), False)
+                return data[start : start + length]
+        except urllib.error.HTTPError as e:
+            raise FetchError(url, f"HTTP {e.code}", e.code) from None
+        except (urllib.error.URLError, OSError) as e:
+            if hit is not None:
+                return hit[1][start : start + length]
+            raise FetchError(url, str(getattr(e, "reason", e))) from None
+
+    def clear(self) -> int:
+        removed = 0
+        if self.root.is_dir():
+            for p in self.root.iterdir():
+                if p.suffix in {".json", ".body", ".tmp"}:
+                    p.unlink()
+                    removed += 1
+        return removed
@@ -0,0 +1,147 @@
+# tools/dossier_client/models.py
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+
+# Read-side records for the published artifacts. They mirror tools/dossier_model.py but
+# are tolerant of missing/extra keys, so a client keeps working against older or newer
+# builds of a site.
+
+
+def _unquote(s: object) -> str:
+    # the front-matter parser keeps list items' quotes ("\"navigation\"")
+    return str(s).strip().strip('"').strip("'")
+
+
+def _str_list(v: object) -> list[str]:
+    if isinstance(v, list):
+        return [_unquote(x) for x in v]
+    if isinstance(v, str) and v.strip():
+        s = v.strip()
+        if s.startswith("["):
+            try:
+                return [_unquote(x) for x in json.loads(s)]
+            except ValueError:
+                pass
+        return [_unquote(s)]
+    return []
+
+
+@dataclass(slots=True)
+class Related:
+    id: str
+    title: str
+    url: str
+    score: float
+
+
+@dataclass(slots=True)
+class Section:
+    id: str
+    order: str
+    number: str
+    level: int
+    title: str
+    url: str
+    keywords: list[str] = field(default_factory=list)
+    summary: list[str] = field(default_factory=list)
+    related: list[str] = field(default_factory=list)
+    related_auto: list[Related] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return f"{self.number}. {self.title}".strip() if self.number else self.title
+
+    @classmethod
+    def from_json(cls, d: dict) -> "Section":
+        return cls(
+            id=str(d["id"]),
+            order=str(d.get("order", "")),
+            number=str(d.get("number") or ""),
+            level=int(d.get("level") or 1),
+            title=str(d.get("title") or d["id"]),
+            url=str(d.get("url") or f"{d['id']}.html"),
+            keywords=_str_list(d.get("keywords")),
+            summary=_str_list(d.get("summary")),
+            related=_str_list(d.get("related")),
+            related_auto=[
+                Related(r["id"], r.get("title", ""), r.get("url", ""), float(r.get("score", 0.0)))
+                for r in d.get("related_auto") or []
+            ],
+        )
+
+
+@dataclass(slots=True)
+class ClaimSummary:
+    """
+    One claims.min.json row: enough to list and filter claims without the evidence.
+    """
+
+    id: str
+    url: str
+    text: str
+    evidence_count: int
+    date: str
+    title: str
+    tags: tuple[str, ...]
+
+    @classmethod
+    def from_min_json(cls, d: dict) -> "ClaimSummary":
+        return cls(
+            id=d["id"],
+            url=d.get("u", ""),
+            text=d.get("t", ""),
+            evidence_count=int(d.get("ec", 0)),
+            date=d.get("d") or "",
+            title=d.get("ti") or "",
+            tags=tuple(d.get("tg") or ()),
+        )
+
+
+@dataclass(slots=True)
+class Claim:
+    """
+    One claims.json record.
+    """
+
+    id: str
+    text: str
+    evidence: str = ""
+    evidence_count: int = 0
+    links: tuple[str, ...] = ()
+    section_id: str = ""
+    section_label: str = ""
+    url: str = ""
+    line: int | None = None
+    date: str = ""
+    date_raw: str = ""
+    title: str = ""
+    tags: tuple[str, ...] = ()
+    note: str = ""
+    source_ids: tuple[str, ...] = ()
+    first_seen: str = ""
+    last_changed: str = ""
+
+    @classmethod
+    def from_json(cls, d: dict) -> "Claim":
+        return cls(
+            id=d["id"],
+            text=d.get("text", ""),
+            evidence=d.get("evidence", ""),
+            evidence_count=int(d.get("evidence_count", 0)),
+            links=tuple(d.get("links") or ()),
+            section_id=d.get("section_id", ""),
+            section_label=d.get("section_label", ""),
+            url=d.get("url", ""),
+            line=d.get("line"),
+            date=d.get("date") or "",
+            date_raw=d.get("date_raw") or "",
+            title=d.get("title") or "",
+            tags=tuple(d.get("tags") or ()),
+            note=d.get("note") or "",
+            source_ids=tuple(d.get("source_ids") or ()),
+            first_seen=d.get("first_seen") or "",
+            last_changed=d.get("last_changed") or "",
+        )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# tools/dossier_config.py
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from build_source import DOC_TITLE
+
+
+DEFAULT_CONFIG = Path("dossier/dossiers.json")
+
+NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+
+@dataclass
+class Dossier:
+    """
+    One dossier hosted from this repo. Paths are relative to the repo root.
+    The claim history index lives in .cache/ next to source.md, as it always has.
+    fingerprint > 0 turns on content-hashed artifact copies, kept for that many builds;
+    rewrite lists files outside the site (llms.txt) whose artifact links follow them.
+    """
+
+    name: str
+    title: str
+    parts: str
+    source: str
+    site: str
+    fingerprint: int = 0
+    rewrite: list[str] = field(default_factory=list)
+
+    @property
+    def cache(self) -> str:
+        return (Path(self.source).parent / ".cache").as_posix()
+
+    @property
+    def history(self) -> str:
+        return f"{self.cache}/claim_history.json"
+
+    @property
+    def signatures(self) -> str:
+        return f"{self.cache}/minhash.json"
+
+    @property
+    def bundle(self) -> str:
+        return f"{self.site}.bundle"
+
+
+DEFAULT_DOSSIER = Dossier(
+    name="main",
+    title=DOC_TITLE,
+    parts="dossier/parts",
+    source="dossier/source.md",
+    site="dossier/site",
+)
+
+
+def load_dossiers(root: Path, config: Path = DEFAULT_CONFIG) -> list[Dossier]:
+    """
+    Dossiers listed in the config, in order. Without a config file the repo builds the one
+    dossier under dossier/.
+    """
+    path = config if config.is_absolute() else root / config
+    if not path.exists():
+        return [DEFAULT_DOSSIER]
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    out: list[Dossier] = []
+    for i, d in enumerate(data.get("dossiers", [])):
+        missing = [k for k in ("name", "parts", "source", "site") if not d.get(k)]
+        if missing:
+            raise SystemExit(f"{path}: dossier #{i + 1} is missing {', '.join(missing)}")
+        if not NAME_RE.match(d["name"]):
+            raise SystemExit(f"{path}: dossier name {d['name']!r} must be lowercase-hyphenated")
+        out.append(
+            Dossier(
+                name=d["name"],
+                title=d.get("title") or DOC_TITLE,
+                parts=d["parts"].rstrip("/"),
+                source=d["source"],
+                site=d["site"].rstrip("/"),
+                fingerprint=int(d.get("fingerprint") or 0),
+                rewrite=list(d.get("rewrite") or []),
+            )
+        )
+
+    if not out:
+        raise SystemExit(f"{path}: no dossiers configured")
+    for key in ("name", "parts", "source", "site", "history"):
+        seen: set[str] = set()
+        for d in out:
+            v = getattr(d, key)
+            if v in seen:
+                raise SystemExit(f"{path}: two dossiers share {key} {v!r}")
+            seen.add(v)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List the dossiers configured for this repo.")
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG, help=f"Config file (default: {DEFAULT_CONFIG})")
+    parser.add_argument("--outputs", action="store_true", help="Print only the committed build paths (source.md, site dir), one per line.")
+    parser.add_argument("--bundles", action="store_true", help="Print only the bundle paths (bundle, bundle index), one per line.")
+    args = parser.parse_args()
+
+    for d in load_dossiers(Path.cwd(), args.config):
+        if args.outputs:
+            print(d.source)
+            print(d.site)
+        elif args.bundles:
+            # not committed: a rebuilt tar differs wherever a member changed, so every push
+            # would add a whole new copy of the site to history. CI publishes it as an artifact.
+            print(d.bundle)
+            print(f"{d.bundle}.json")
+        else:
+            print(f"{d.name:<16} {d.parts} -> {d.site}  ({d.title})")
+
+
+if __name__ == "__main__":
+    main()
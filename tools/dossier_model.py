@@ -0,0 +1,274 @@
+# tools/dossier_model.py
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from json.encoder import encode_basestring
+
+
+# Shared records passed between build stages. __slots__ keeps each record to a fixed
+# struct instead of a per-object dict; strings that repeat across thousands of records
+# (section ids/labels/urls, tags) are interned so every record shares one copy.
+#
+# to_json() returns the exact dict layout of the published JSON artifacts, so switching
+# a stage to these classes does not change its output.
+
+
+def _istr(s: str) -> str:
+    return sys.intern(s) if s else ""
+
+
+def _itags(tags) -> tuple[str, ...]:
+    return tuple(sys.intern(t) for t in tags or ())
+
+
+def _jlist(items) -> str:
+    return "[" + ",".join(encode_basestring(s) for s in items) + "]"
+
+
+def _jlist_indented(items, pad: str) -> str:
+    # json.dumps(indent=2) layout for a list of strings whose key sits at indent pad
+    if not items:
+        return "[]"
+    inner = ",\n".join(f"{pad}  {encode_basestring(s)}" for s in items)
+    return f"[\n{inner}\n{pad}]"
+
+
+@dataclass(slots=True)
+class Section:
+    id: str
+    order: str
+    number: str
+    level: int
+    title: str
+    keywords: list[str] = field(default_factory=list)
+    summary: list[str] = field(default_factory=list)
+    related: list[str] = field(default_factory=list)
+    url: str = ""
+
+    def __post_init__(self) -> None:
+        self.id = _istr(self.id)
+        self.url = _istr(self.url)
+
+    @property
+    def label(self) -> str:
+        return f"{self.number}. {self.title}".strip() if self.number else self.title
+
+    def to_json(self) -> dict:
+        return {
+            "id": self.id,
+            "order": self.order,
+            "number": self.number,
+            "level": self.level,
+            "title": self.title,
+            "keywords": self.keywords,
+            "summary": self.summary,
+            "related": self.related,
+            "url": self.url,
+        }
+
+
+@dataclass(slots=True)
+class Claim:
+    id: str
+    text: str
+    evidence: str
+    evidence_count: int
+    links: tuple[str, ...]
+    section_id: str
+    section_label: str
+    url: str
+    line: int | None
+    date: str = ""
+    date_raw: str = ""
+    title: str = ""
+    tags: tuple[str, ...] = ()
+    note: str = ""
+    source_ids: tuple[str, ...] = ()
+    first_seen: str = ""
+    last_changed: str = ""
+
+    def __post_init__(self) -> None:
+        self.links = tuple(self.links)
+        self.section_id = _istr(self.section_id)
+        self.section_label = _istr(self.section_label)
+        self.url = _istr(self.url)
+        self.tags = _itags(self.tags)
+        self.source_ids = _itags(self.source_ids)
+
+    @classmethod
+    def from_json(cls, d: dict) -> "Claim":
+        return cls(
+            id=d["id"],
+            text=d.get("text", ""),
+            evidence=d.get("evidence", ""),
+            evidence_count=int(d.get("evidence_count", 0)),
+            links=d.get("links") or (),
+            section_id=d.get("section_id", ""),
+            section_label=d.get("section_label", ""),
+            url=d.get("url", ""),
+            line=d.get("line"),
+            date=d.get("date") or "",
+            date_raw=d.get("date_raw") or "",
+            title=d.get("title") or "",
+            tags=d.get("tags") or (),
+            note=d.get("note") or "",
+            source_ids=d.get("source_ids") or (),
+            first_seen=d.get("first_seen") or "",
+            last_changed=d.get("last_changed") or "",
+        )
+
+    def to_json(self) -> dict:
+        """
+        claims.json record.
+        """
+        return {
+            "id": self.id,
+            "text": self.text,
+            "evidence": self.evidence,
+            "evidence_count": self.evidence_count,
+            # kept beside source_ids: the claims pages, dossier_client's Claim and
+            # check_links (without sources.json) read the claim's own URLs from here
+            "links": list(self.links),
+            "section_id": self.section_id,
+            "section_label": self.section_label,
+            "url": self.url,
+            "line": self.line,
+            "date": self.date,
+            "date_raw": self.date_raw,
+            "title": self.title,
+            "tags": list(self.tags),
+            "note": self.note,
+            "source_ids": list(self.source_ids),
+            "first_seen": self.first_seen,
+            "last_changed": self.last_changed,
+        }
+
+    def json_text(self) -> str:
+        """
+        to_json() already encoded as one element of claims.json, without building the dict;
+        same bytes as json.dumps([...], ensure_ascii=False, indent=2) gives each element.
+        """
+        e = encode_basestring
+        p = "    "
+        line = "null" if self.line is None else str(int(self.line))
+        return (
+            f"  {{\n"
+            f'{p}"id": {e(self.id)},\n'
+            f'{p}"text": {e(self.text)},\n'
+            f'{p}"evidence": {e(self.evidence)},\n'
+            f'{p}"evidence_count": {int(self.evidence_count)},\n'
+            f'{p}"links": {_jlist_indented(self.links, p)},\n'
+            f'{p}"section_id": {e(self.section_id)},\n'
+            f'{p}"section_label": {e(self.section_label)},\n'
+            f'{p}"url": {e(self.url)},\n'
+            f'{p}"line": {line},\n'
+            f'{p}"date": {e(self.date)},\n'
+            f'{p}"date_raw": {e(self.date_raw)},\n'
+            f'{p}"title": {e(self.title)},\n'
+            f'{p}"tags": {_jlist_indented(self.tags, p)},\n'
+            f'{p}"note": {e(self.note)},\n'
+            f'{p}"source_ids": {_jlist_indented(self.source_ids, p)},\n'
+            f'{p}"first_seen": {e(self.first_seen)},\n'
+            f'{p}"last_changed": {e(self.last_changed)}\n'
+            f"  }}"
+        )
+
+    def to_min_json(self) -> dict:
+        """
+        claims.min.json record.
+        """
+        return {
+            "id": self.id,
+            "u": self.url,
+            "t": " ".join(self.text.split()),
+            "ec": self.evidence_count,
+            "d": self.date,
+            "ti": self.title,
+            "tg": list(self.tags),
+        }
+
+    def min_json_text(self) -> str:
+        """
+        to_min_json() already encoded, without building the dict; same bytes as
+        json.dumps(..., ensure_ascii=False, separators=(",", ":")).
+        """
+        e = encode_basestring
+        return (
+            f'{{"id":{e(self.id)},"u":{e(self.url)},"t":{e(" ".join(self.text.split()))},'
+            f'"ec":{self.evidence_count},"d":{e(self.date)},"ti":{e(self.title)},"tg":{_jlist(self.tags)}}}'
+        )
+
+
+def dumps_claims(claims: list[Claim]) -> str:
+    """
+    claims.json text for a ledger; equal to json.dumps([c.to_json() ...], ensure_ascii=False, indent=2).
+    """
+    if not claims:
+        return "[]"
+    return "[\n" + ",\n".join(c.json_text() for c in claims) + "\n]"
+
+
+def dumps_claims_min(claims: list[Claim]) -> str:
+    """
+    claims.min.json text for a ledger.
+    """
+    return "[" + ",".join(c.min_json_text() for c in claims) + "]"
+
+
+@dataclass(slots=True)
+class Event:
+    date: str
+    title: str
+    id: str
+    claim_short: str
+    tags: tuple[str, ...]
+    note: str
+    section_url: str
+    section_num: str
+    source_ids: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        self.tags = _itags(self.tags)
+        self.section_url = _istr(self.section_url)
+        self.section_num = _istr(self.section_num)
+        self.source_ids = _itags(self.source_ids)
+
+    def to_json(self) -> dict:
+        """
+        timeline/<month>.json event.
+        """
+        return {
+            "date": self.date,
+            "title": self.title,
+            "id": self.id,
+            "claim_short": self.claim_short,
+            "tags": list(self.tags),
+            "note": self.note,
+            "section_url": self.section_url,
+            "section_num": self.section_num,
+            "source_ids": list(self.source_ids),
+        }
+
+
+@dataclass(slots=True)
+class Source:
+    id: str
+    url: str
+    canonical: str
+    first_seen: str
+    variants: list[str] = field(default_factory=list)
+    claims: list[str] = field(default_factory=list)
+
+    def to_json(self) -> dict:
+        """
+        sources.json entry.
+        """
+        return {
+            "id": self.id,
+            "url": self.url,
+            "canonical": self.canonical,
+            "variants": self.variants,
+            "first_seen": self.first_seen,
+            "claims": self.claims,
+        }
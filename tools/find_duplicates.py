@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# tools/find_duplicates.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+SHINGLE_WORDS = 3
+NUM_PERM = 128
+DEFAULT_THRESHOLD = 0.6
+# Share of pairs at exactly the threshold that must land in a common LSH bucket.
+TARGET_RECALL = 0.95
+
+DEFAULT_CACHE = Path("dossier/.cache/minhash.json")
+DEFAULT_REPORT = Path("dossier/site/duplicates.json")
+
+# Universal hashing (a*x + b) mod p over a Mersenne prime; coefficients are fixed
+# so signatures stay comparable across runs and can be cached.
+_MERSENNE_P = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _coefficients(n: int) -> list[tuple[int, int]]:
+    out: list[tuple[int, int]] = []
+    for i in range(n):
+        d = hashlib.sha256(f"minhash-{i}".encode("ascii")).digest()
+        a = int.from_bytes(d[:8], "big") % (_MERSENNE_P - 1) + 1
+        b = int.from_bytes(d[8:16], "big") % _MERSENNE_P
+        out.append((a, b))
+    return out
+
+
+_COEFFS = _coefficients(NUM_PERM)
+
+# Bump when shingling or hashing changes so cached signatures are discarded.
+SIGNATURE_VERSION = f"v1-w{SHINGLE_WORDS}-p{NUM_PERM}"
+
+
+def claim_key(text: str, title: str = "") -> str:
+    """
+    Stable identity for a claim's content, independent of its positional id.
+    """
+    norm = " ".join(WORD_RE.findall(f"{title}\n{text}".lower()))
+    return hashlib.sha256(norm.encode("utf-8")).hexdigest()[:16]
+
+
+def shingles(text: str, k: int = SHINGLE_WORDS) -> set[int]:
+    words = WORD_RE.findall(text.lower())
+    if len(words) < k:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i : i + k]) for i in range(len(words) - k + 1)]
+    return {int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big") for g in grams}
+
+
+# Signature of a claim with no words (empty or punctuation-only). It is never indexed or
+# matched: every such claim would otherwise be a 1.0 "duplicate" of all the others.
+EMPTY_SIGNATURE = [_MAX_HASH] * NUM_PERM
+
+
+def minhash(sh: set[int]) -> list[int]:
+    if not sh:
+        return list(EMPTY_SIGNATURE)
+    return [min(((a * x + b) % _MERSENNE_P) & _MAX_HASH for x in sh) for a, b in _COEFFS]
+
+
+def signature_for(text: str, title: str = "") -> list[int]:
+    return minhash(shingles(f"{title}\n{text}"))
+
+
+def estimate_jaccard(s1: list[int], s2: list[int]) -> float:
+    return sum(1 for a, b in zip(s1, s2) if a == b) / len(s1)
+
+
+def band_recall(similarity: float, bands: int, rows: int) -> float:
+    """
+    Chance that a pair with this Jaccard similarity shares at least one LSH bucket.
+    """
+    return 1 - (1 - similarity**rows) ** bands
+
+
+def choose_bands(threshold: float, num_perm: int = NUM_PERM, recall: float = TARGET_RECALL) -> tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows <= num_perm: the most rows per band (fewest
+    candidates to verify) that still buckets `recall` of the pairs at the threshold.
+    Signature positions past bands * rows are simply not banded.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if band_recall(threshold, bands, rows) < recall:
+            break
+        best = (bands, rows)
+    return best
+
+
+class LSHIndex:
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.bands, self.rows = choose_bands(threshold)
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = [{} for _ in range(self.bands)]
+        self.signatures: dict[str, list[int]] = {}
+
+    def _band_keys(self, sig: list[int]):
+        r = self.rows
+        for b in range(self.bands):
+            yield b, tuple(sig[b * r : (b + 1) * r])
+
+    def add(self, key: str, sig: list[int]) -> None:
+        if sig == EMPTY_SIGNATURE:
+            return
+        self.signatures[key] = sig
+        for b, band in self._band_keys(sig):
+            self._buckets[b].setdefault(band, []).append(key)
+
+    def query(self, sig: list[int]) -> list[tuple[str, float]]:
+        """
+        Keys whose estimated Jaccard similarity with sig meets the threshold, best first.
+        """
+        if sig == EMPTY_SIGNATURE:
+            return []
+        candidates: set[str] = set()
+        for b, band in self._band_keys(sig):
+            candidates.update(self._buckets[b].get(band, ()))
+        scored = [(k, estimate_jaccard(sig, self.signatures[k])) for k in candidates]
+        return sorted([(k, s) for k, s in scored if s >= self.threshold], key=lambda x: (-x[1], x[0]))
+
+
+def load_signature_cache(path: Path) -> dict[str, list[int]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != SIGNATURE_VERSION:
+        return {}
+    return data.get("signatures", {})
+
+
+def save_signature_cache(path: Path, sigs: dict[str, list[int]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # per-process tmp name: queue workers may save the cache at the same time
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"version": SIGNATURE_VERSION, "signatures": sigs}, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+def claim_signatures(claims: list[dict], cache: dict[str, list[int]]) -> tuple[dict[str, list[int]], int]:
+    """
+    Map claim id -> signature, hashing only claims whose content key is not cached.
+    Returns (signatures by claim id, number of claims hashed). cache is pruned to live keys.
+    """
+    live: dict[str, list[int]] = {}
+    by_id: dict[str, list[int]] = {}
+    hashed = 0
+    for c in claims:
+        key = claim_key(c.get("text", ""), c.get("title", ""))
+        sig = cache.get(key) or live.get(key)
+        if sig is None:
+            sig = signature_for(c.get("text", ""), c.get("title", ""))
+            hashed += 1
+        live[key] = sig
+        by_id[c["id"]] = sig
+
+    cache.clear()
+    cache.update(live)
+    return by_id, hashed
+
+
+def find_duplicate_pairs(sigs: dict[str, list[int]], threshold: float) -> list[dict]:
+    index = LSHIndex(threshold)
+    pairs: list[dict] = []
+    for cid, sig in sigs.items():
+        for other, score in index.query(sig):
+            pairs.append({"a": other, "b": cid, "similarity": round(score, 3)})
+        index.add(cid, sig)
+    pairs.sort(key=lambda p: (-p["similarity"], p["a"], p["b"]))
+    return pairs
+
+
+def build_claim_index(claims: list[dict], threshold: float, cache: dict[str, list[int]] | None = None) -> LSHIndex:
+    sigs, _hashed = claim_signatures(claims, cache if cache is not None else {})
+    index = LSHIndex(threshold)
+    for cid, sig in sigs.items():
+        index.add(cid, sig)
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report near-duplicate claims using MinHash + LSH.")
+    parser.add_argument("site", type=Path, nargs="?", default=Path("dossier/site"), help="Built site dir (default: dossier/site)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help=f"Jaccard threshold (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Signature cache (default: {DEFAULT_CACHE})")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help=f"Report path (default: {DEFAULT_REPORT})")
+    args = parser.parse_args()
+
+    claims = json.loads((args.site / "claims.json").read_text(encoding="utf-8"))
+    by_id = {c["id"]: c for c in claims}
+
+    cache = load_signature_cache(args.cache)
+    sigs, hashed = claim_signatures(claims, cache)
+    save_signature_cache(args.cache, cache)
+
+    pairs = find_duplicate_pairs(sigs, args.threshold)
+    for p in pairs:
+        for side in ("a", "b"):
+            c = by_id[p[side]]
+            p[f"{side}_section"] = c.get("section_id", "")
+            p[f"{side}_text"] = " ".join((c.get("text") or "").split())
+
+    bands, rows = choose_bands(args.threshold)
+    report = {"threshold": args.threshold, "bands": bands, "rows": rows, "claims": len(claims), "pairs": pairs}
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    print(f"Hashed {hashed} of {len(claims)} claim(s); {len(pairs)} candidate duplicate pair(s).")
+    for p in pairs:
+        print(f"- {p['similarity']:.2f} {p['a']} ~ {p['b']}")
+    print(f"Wrote {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# tools/fingerprint_assets.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+from html import escape, unescape
+from pathlib import Path
+
+
+# Data artifacts that get content-hashed copies (claims.json -> claims.3fa9c1d2.json).
+# A hashed name never changes content, so clients can cache it forever and only fetch
+# the small pages and manifest that point at it.
+ARTIFACTS = [
+    "claims.json",
+    "claims.min.json",
+    "claims.min.cols.json",
+    "sources.json",
+    "toc.json",
+    "timeline/index.json",
+]
+
+# Pages whose ./<artifact> links are repointed at the hashed copies.
+REFERRERS = ["index.html", "claims.html", "timeline.html"]
+
+MANIFEST = "assets.json"
+HASH_LEN = 8
+DEFAULT_KEEP = 5
+
+SECTION_META_RE = re.compile(r'(<script type="application/json" id="section-meta">)(.*?)(</script>)', re.DOTALL)
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    stem, ext = name.rsplit(".", 1)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LEN]}.{ext}"
+
+
+def ref_re(name: str, prefix: str) -> re.Pattern:
+    """
+    prefix + name, plain or already fingerprinted, so rewriting is idempotent.
+    claims.json does not match claims.min.json: the optional part is only the hash.
+    """
+    stem, ext = name.rsplit(".", 1)
+    return re.compile(
+        r"(?<![\w.-])" + re.escape(prefix + stem) + r"(?:\.[0-9a-f]{%d})?" % HASH_LEN + re.escape("." + ext) + r"(?![\w-])"
+    )
+
+
+def rewrite_refs(text: str, assets: dict[str, str], prefix: str) -> str:
+    for name, hashed in assets.items():
+        text = ref_re(name, prefix).sub(lambda _m, h=hashed: prefix + h, text)
+    return text
+
+
+def rewrite_section_meta(html: str, assets: dict[str, str]) -> str:
+    def sub(m: re.Match) -> str:
+        meta = json.loads(unescape(m.group(2)))
+        meta["assets"] = assets
+        return m.group(1) + escape(json.dumps(meta, ensure_ascii=False, indent=2)) + m.group(3)
+
+    return SECTION_META_RE.sub(sub, html, count=1)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def fingerprint_site(site: Path, keep: int, rewrite: list[Path]) -> tuple[dict[str, str], int, int]:
+    """
+    Write hashed copies, the manifest and rewritten referrers; drop hashed copies no
+    longer named by the last `keep` builds. Returns (assets, files rewritten, files removed).
+    """
+    assets: dict[str, str] = {}
+    for name in ARTIFACTS:
+        src = site / name
+        if not src.is_file():
+            continue
+        data = src.read_bytes()
+        hashed = hashed_name(name, data)
+        dest = site / hashed
+        if not dest.exists():
+            dest.write_bytes(data)
+        assets[name] = hashed
+
+    rewritten = 0
+    for name in REFERRERS:
+        p = site / name
+        if p.is_file():
+            rewritten += _write_if_changed(p, rewrite_refs(p.read_text(encoding="utf-8"), assets, "./"))
+
+    toc = site / "toc.json"
+    pages = [e.get("url", "") for e in json.loads(toc.read_text(encoding="utf-8"))] if toc.is_file() else []
+    for url in pages:
+        p = site / url
+        if url and p.is_file():
+            rewritten += _write_if_changed(p, rewrite_section_meta(p.read_text(encoding="utf-8"), assets))
+
+    # files outside the site (llms.txt) name artifacts by their site path
+    for p in rewrite:
+        if p.is_file():
+            rewritten += _write_if_changed(p, rewrite_refs(p.read_text(encoding="utf-8"), assets, f"{site.as_posix()}/"))
+
+    manifest_path = site / MANIFEST
+    previous: list[list[str]] = []
+    if manifest_path.is_file():
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("builds", [])
+        except ValueError:
+            previous = []
+    current = sorted(assets.values())
+    builds = [current] + [b for b in previous if b != current]
+    builds = builds[: max(keep, 1)]
+
+    live = {n for b in builds for n in b}
+    removed = 0
+    for name in ARTIFACTS:
+        stem, ext = name.rsplit(".", 1)
+        for p in site.glob(f"{stem}.*.{ext}"):
+            rel = p.relative_to(site).as_posix()
+            if re.fullmatch(re.escape(stem) + r"\.[0-9a-f]{%d}" % HASH_LEN + re.escape("." + ext), rel) and rel not in live:
+                p.unlink()
+                removed += 1
+
+    manifest = {"version": 1, "assets": assets, "builds": builds}
+    _write_if_changed(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2))
+    return assets, rewritten, removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write content-hashed copies of the site's data artifacts and point pages at them.")
+    parser.add_argument("site", type=Path, help="Built site dir, e.g. dossier/site")
+    parser.add_argument("--keep", type=int, default=DEFAULT_KEEP, help=f"Keep hashed copies named by this many recent builds (default: {DEFAULT_KEEP})")
+    parser.add_argument("--rewrite", type=Path, action="append", default=[], help="Also repoint <site>/<artifact> references in this file (repeatable), e.g. llms.txt")
+    args = parser.parse_args()
+
+    if not args.site.is_dir():
+        raise SystemExit(f"No site dir at {args.site}")
+    assets, rewritten, removed = fingerprint_site(args.site, args.keep, args.rewrite)
+    print(
+        f"Wrote {args.site / MANIFEST} ({len(assets)} fingerprinted artifact(s), {rewritten} file(s) repointed, "
+        f"{removed} old fingerprint(s) removed)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# tools/lint_dossier.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+# build_claims (and datetime, and the process pool) are imported where a part is actually
+# linted: a warm run answers from the cache and only pays for a stat() per part.
+
+
+DEFAULT_PARTS = Path("dossier/parts")
+DEFAULT_CACHE = Path("dossier/.cache/lint.json")
+
+# Below this many uncached parts, linting inline beats process pool start-up.
+PARALLEL_MIN_PARTS = 8
+
+META_ORDER = ["date", "title", "tags", "note"]
+TAG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+C_ANYWHERE_RE = re.compile(r"\[(?i:c)\]")
+BULLET_URL_RE = re.compile(r"^- https?://\S+$")
+
+# Cached diagnostics are only valid for the rules that produced them: this file and the
+# claim tokenizer and regexes it takes from build_claims.py.
+RULE_FILES = ("lint_dossier.py", "build_claims.py")
+
+
+def rules_hash() -> str:
+    h = hashlib.sha256()
+    for name in RULE_FILES:
+        h.update((Path(__file__).parent / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+# severity is "error" or "warning". A namedtuple rather than a dataclass: dataclasses (and
+# the inspect module it pulls in) would be most of a warm run's start-up.
+class Diagnostic(namedtuple("Diagnostic", "path line severity code message")):
+    __slots__ = ()
+
+    def format(self) -> str:
+        return f"{self.path}:{self.line}: {self.severity} {self.code} {self.message}"
+
+
+def _body_start(lines: list[str]) -> int:
+    """
+    Index of the first body line, skipping YAML front matter.
+    """
+    if not lines or lines[0].strip() != "---":
+        return 0
+    for i in range(1, len(lines)):
+        if lines[i].strip() == "---":
+            return i + 1
+    return 0
+
+
+def _valid_iso_date(v: str) -> bool:
+    from datetime import date
+
+    from build_claims import ISO_DATE_RE
+
+    if not ISO_DATE_RE.match(v):
+        return False
+    try:
+        date.fromisoformat(v)
+    except ValueError:
+        return False
+    return True
+
+
+def lint_text(path: str, text: str) -> list[Diagnostic]:
+    from build_claims import C_SUFFIX_RE, EVIDENCE_LABEL_RE, META_LINE_RE, URL_RE, tokenize_claims
+
+    lines = text.splitlines()
+    start = _body_start(lines)
+    out: list[Diagnostic] = []
+
+    def diag(line_no: int, severity: str, code: str, message: str) -> None:
+        out.append(Diagnostic(path, line_no, severity, code, message))
+
+    for tok in tokenize_claims(lines, start):
+        if tok.kind != "inline":
+            continue
+
+        seen_meta: list[str] = []
+        meta_done = False
+        for off, ev in enumerate(tok.evidence_lines, start=1):
+            line_no = tok.line_no + off
+            m = META_LINE_RE.match(ev)
+            if m:
+                key = m.group(1).lower()
+                value = m.group(2).strip()
+
+                if meta_done:
+                    diag(line_no, "error", "META-AFTER-SOURCES", f"{key.upper()}: must come before the source bullets")
+                if key in seen_meta:
+                    diag(line_no, "error", "META-DUPLICATE", f"duplicate {key.upper()}: line")
+                elif seen_meta and META_ORDER.index(key) < META_ORDER.index(seen_meta[-1]):
+                    diag(line_no, "error", "META-ORDER", "metadata must be in DATE, TITLE, TAGS, NOTE order")
+                seen_meta.append(key)
+
+                if key == "date" and not _valid_iso_date(value):
+                    diag(line_no, "error", "DATE-FORMAT", f"DATE must be an ISO date (YYYY-MM-DD), got {value!r}")
+                elif key == "tags":
+                    if re.search(r",\s", value) or re.search(r"\s,", value):
+                        diag(line_no, "error", "TAGS-SPACING", "TAGS must be comma-separated without spaces")
+                    bad = [t for t in (t.strip() for t in value.split(",")) if t and not TAG_RE.match(t)]
+                    if bad:
+                        diag(line_no, "error", "TAGS-FORMAT", f"tags must be lowercase and hyphenated: {', '.join(bad)}")
+                continue
+
+            if off == 1 and not seen_meta and EVIDENCE_LABEL_RE.match(ev):
+                diag(line_no, "warning", "LEGACY-EVIDENCE", "legacy Evidence:/Sources: header; use the structured block")
+                meta_done = True
+                continue
+            if EVIDENCE_LABEL_RE.match(ev):
+                diag(line_no, "warning", "LEGACY-EVIDENCE", "legacy Evidence:/Sources: header; use the structured block")
+                continue
+
+            meta_done = True
+            if URL_RE.search(ev) and not BULLET_URL_RE.match(ev.strip()):
+                diag(line_no, "warning", "URL-NOT-BULLETED", "source URLs should be bare '- https://...' bullets")
+
+    for i in range(start, len(lines)):
+        line = lines[i]
+        if not C_ANYWHERE_RE.search(line) or C_SUFFIX_RE.match(line):
+            continue
+        diag(i + 1, "error", "C-NOT-AT-END", "[C] marker must be at the end of the claim line")
+
+    out.sort(key=lambda d: (d.line, d.code))
+    return out
+
+
+def _canonical_tags(value: str) -> str:
+    tags = [re.sub(r"\s+", "-", t.strip().lower()) for t in value.split(",")]
+    return ",".join(t for t in tags if t)
+
+
+def fix_text(text: str) -> str:
+    """
+    Rewrite inline [C] blocks into canonical form:
+      claim text [C]
+      DATE / TITLE / TAGS / NOTE (those present, in order)
+      - https://...   (bare URL lines get bulleted)
+      remaining evidence lines, in their original order
+    Legacy Evidence:/Sources: headers are dropped. Non-ISO dates are left for a human.
+    """
+    from build_claims import EVIDENCE_LABEL_RE, META_LINE_RE, URL_RE, tokenize_claims
+
+    lines = text.splitlines()
+    start = _body_start(lines)
+    replacements: list[tuple[int, int, list[str]]] = []
+
+    for tok in tokenize_claims(lines, start):
+        if tok.kind != "inline":
+            continue
+
+        meta: dict[str, str] = {}
+        rest: list[str] = []
+        for ev in tok.evidence_lines:
+            m = META_LINE_RE.match(ev)
+            if m and m.group(1).lower() not in meta:
+                key = m.group(1).lower()
+                value = m.group(2).strip()
+                meta[key] = _canonical_tags(value) if key == "tags" else value
+                continue
+            if EVIDENCE_LABEL_RE.match(ev):
+                continue
+            s = ev.strip()
+            if URL_RE.fullmatch(s):
+                rest.append(f"- {s}")
+            elif re.match(r"^[-*•]\s+https?://\S+$", s):
+                rest.append("- " + s[1:].strip())
+            else:
+                rest.append(ev)
+
+        block = [f"{tok.text} [C]"]
+        block += [f"{k.upper()}: {meta[k]}" for k in META_ORDER if k in meta]
+        block += rest
+
+        first = tok.line_no - 1
+        replacements.append((first, first + 1 + len(tok.evidence_lines), block))
+
+    for first, end, block in reversed(replacements):
+        lines[first:end] = block
+
+    fixed = "\n".join(lines)
+    return fixed + "\n" if text.endswith("\n") else fixed
+
+
+def _lint_file(path: str) -> list[dict]:
+    text = Path(path).read_text(encoding="utf-8")
+    return [d._asdict() for d in lint_text(path, text)]
+
+
+def load_cache(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("rules") != rules_hash():
+        return {}
+    return data.get("parts", {})
+
+
+def save_cache(path: Path, parts: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"rules": rules_hash(), "parts": parts}, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def lint_paths(paths: list[Path], cache: dict[str, dict], jobs: int | None = None) -> tuple[list[Diagnostic], int, bool]:
+    """
+    Lint parts, reusing cached diagnostics for parts whose content is unchanged. A part whose
+    (mtime_ns, size) matches its entry is not read at all; otherwise its content hash decides.
+    Updates cache in place. Returns (diagnostics, number of parts linted, cache changed).
+    """
+    hashes: dict[str, str] = {}
+    stats: dict[str, list[int]] = {}
+    todo: list[str] = []
+    dirty = False
+    for p in paths:
+        key = p.as_posix()
+        st = p.stat()
+        stats[key] = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(key)
+        if entry and entry.get("stat") == stats[key]:
+            hashes[key] = entry["sha"]
+            continue
+        sha = hashlib.sha256(p.read_bytes()).hexdigest()
+        hashes[key] = sha
+        if entry and entry.get("sha") == sha:
+            entry["stat"] = stats[key]  # touched, not edited
+            dirty = True
+        else:
+            todo.append(key)
+
+    if len(todo) >= PARALLEL_MIN_PARTS and jobs != 1:
+        # imported lazily: warm runs never need it and it dominates start-up time
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = list(ex.map(_lint_file, todo))
+    else:
+        results = [_lint_file(k) for k in todo]
+
+    for key, diags in zip(todo, results):
+        cache[key] = {"sha": hashes[key], "stat": stats[key], "diagnostics": diags}
+    for key in list(cache):
+        if key not in hashes:
+            del cache[key]
+            dirty = True
+
+    out = [Diagnostic(**d) for key in hashes for d in cache[key]["diagnostics"]]
+    return out, len(todo), dirty or bool(todo)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lint dossier parts against dossier/claims_format.md.")
+    parser.add_argument("paths", type=Path, nargs="*", help=f"Part files or dirs (default: {DEFAULT_PARTS})")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="Report diagnostics and exit non-zero on errors (default).")
+    mode.add_argument("--fix", action="store_true", help="Rewrite [C] blocks into canonical form, then lint.")
+    parser.add_argument("--strict", action="store_true", help="Treat warnings as errors.")
+    parser.add_argument("--errors-only", action="store_true", help="Do not print warnings.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for cold runs (default: CPU count)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Result cache (default: {DEFAULT_CACHE})")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the cache.")
+    args = parser.parse_args()
+
+    paths: list[Path] = []
+    for p in args.paths or [DEFAULT_PARTS]:
+        if p.is_dir():
+            paths.extend(sorted(x for x in p.glob("*.md") if x.is_file()))
+        else:
+            paths.append(p)
+
+    if args.fix:
+        for p in paths:
+            original = p.read_text(encoding="utf-8")
+            fixed = fix_text(original)
+            if fixed != original:
+                p.write_text(fixed, encoding="utf-8")
+                print(f"Fixed {p}")
+
+    cache = {} if args.no_cache else load_cache(args.cache)
+    diags, linted, dirty = lint_paths(paths, cache, args.jobs)
+    if not args.no_cache and dirty:
+        save_cache(args.cache, cache)
+
+    errors = [d for d in diags if d.severity == "error"]
+    warnings = [d for d in diags if d.severity == "warning"]
+    for d in diags:
+        if d.severity == "warning" and args.errors_only:
+            continue
+        print(d.format())
+
+    print(
+        f"{len(paths)} part(s), {linted} linted, {len(paths) - linted} cached: "
+        f"{len(errors)} error(s), {len(warnings)} warning(s).",
+        file=sys.stderr,
+    )
+    if errors or (args.strict and warnings):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
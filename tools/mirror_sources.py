@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# tools/mirror_sources.py
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import time
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from build_sources import canonicalize_url
+from check_links import USER_AGENT, collect_urls
+
+
+# Private by default: snapshots are third-party pages, and a store inside the site would be
+# committed and served with it. --publish writes to <site>/assets/mirrors instead.
+DEFAULT_STORE = Path("dossier/.cache/mirrors")
+PUBLISH_DIR = Path("assets/mirrors")
+
+# A fetcher takes a URL and returns (body bytes, content type).
+# Tests and offline runs can pass a stub instead of the network fetcher.
+Fetcher = Callable[[str], tuple[bytes, str]]
+
+
+def http_fetcher(timeout: float = 20.0) -> Fetcher:
+    def fetch(url: str) -> tuple[bytes, str]:
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.read(), resp.headers.get("Content-Type", "")
+
+    return fetch
+
+
+@dataclass
+class MirrorStore:
+    """
+    Content-addressed snapshot store:
+      <root>/objects/<sha[:2]>/<sha>.gz   gzip'd body, stored once per distinct content
+      <root>/index.json                   canonical URL -> [snapshot, ...] (oldest first)
+    """
+
+    root: Path
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    def object_path(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / f"{sha}.gz"
+
+    def load_index(self) -> dict[str, list[dict]]:
+        if not self.index_path.exists():
+            return {}
+        return json.loads(self.index_path.read_text(encoding="utf-8"))
+
+    def save_index(self, index: dict[str, list[dict]]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.index_path)
+
+    def put(self, body: bytes) -> tuple[str, bool]:
+        """
+        Store body by sha256. Returns (sha, written) where written is False for duplicates.
+        """
+        sha = hashlib.sha256(body).hexdigest()
+        path = self.object_path(sha)
+        if path.exists():
+            return sha, False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".gz.tmp")
+        # mtime=0 keeps the compressed bytes deterministic across runs
+        tmp.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+        tmp.replace(path)
+        return sha, True
+
+    def get(self, sha: str) -> bytes:
+        return gzip.decompress(self.object_path(sha).read_bytes())
+
+    def latest(self, url: str) -> bytes | None:
+        snaps = self.load_index().get(canonicalize_url(url))
+        if not snaps:
+            return None
+        return self.get(snaps[-1]["sha256"])
+
+
+def mirror_urls(
+    urls: list[str],
+    store: MirrorStore,
+    fetcher: Fetcher,
+    *,
+    refresh: bool = False,
+) -> dict[str, int]:
+    """
+    Archive each URL once. Already-archived URLs are skipped unless refresh is set;
+    a refresh records a new snapshot only when the content changed.
+    """
+    index = store.load_index()
+    stats = {"skipped": 0, "fetched": 0, "new_objects": 0, "unchanged": 0, "failed": 0}
+    seen: set[str] = set()
+
+    for url in urls:
+        canon = canonicalize_url(url)
+        if canon in seen:
+            continue
+        seen.add(canon)
+
+        snaps = index.get(canon, [])
+        if snaps and not refresh:
+            stats["skipped"] += 1
+            continue
+
+        try:
+            body, content_type = fetcher(url)
+        except Exception as e:
+            print(f"- FAILED {url}: {type(e).__name__}: {e}")
+            stats["failed"] += 1
+            continue
+        stats["fetched"] += 1
+
+        sha, written = store.put(body)
+        if written:
+            stats["new_objects"] += 1
+
+        if snaps and snaps[-1]["sha256"] == sha:
+            stats["unchanged"] += 1
+            continue
+
+        snaps.append(
+            {
+                "url": url,
+                "sha256": sha,
+                "captured": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "content_type": content_type,
+                "bytes": len(body),
+            }
+        )
+        index[canon] = snaps
+
+    store.save_index(index)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive cited evidence pages into a content-addressed mirror store.")
+    parser.add_argument("site", type=Path, nargs="?", default=Path("dossier/site"), help="Built site dir (default: dossier/site)")
+    parser.add_argument("--store", type=Path, default=None, help=f"Mirror store root (default: {DEFAULT_STORE})")
+    parser.add_argument("--publish", action="store_true", help=f"Store under <site>/{PUBLISH_DIR.as_posix()} so the snapshots ship with the site.")
+    parser.add_argument("--refresh", action="store_true", help="Re-fetch archived URLs and snapshot any that changed.")
+    parser.add_argument("--timeout", type=float, default=20.0, help="Per-fetch timeout in seconds (default: 20)")
+    args = parser.parse_args()
+    if args.publish and args.store:
+        parser.error("--publish and --store are mutually exclusive")
+    store = args.site / PUBLISH_DIR if args.publish else args.store or DEFAULT_STORE
+
+    urls = collect_urls(args.site)
+    stats = mirror_urls(urls, MirrorStore(store), http_fetcher(args.timeout), refresh=args.refresh)
+
+    print(
+        f"Mirrored {len(urls)} URL(s): {stats['fetched']} fetched, {stats['skipped']} skipped, "
+        f"{stats['new_objects']} new object(s), {stats['unchanged']} unchanged, {stats['failed']} failed."
+    )
+    print(f"Store: {store}")
+
+
+if __name__ == "__main__":
+    main()
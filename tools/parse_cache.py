@@ -0,0 +1,30 @@
+# tools/parse_cache.py
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, TypeVar
+
+
+T = TypeVar("T")
+
+# Process-wide memo for per-part parse results, keyed by (parser name, content hash).
+# It lives in its own module because build.py runs each tool script as __main__ inside
+# long-lived workers: a cache defined in the script itself would start empty on every
+# stage, while this module is imported once per worker and shared by all of them.
+MAX_ENTRIES = 2048
+
+_MEMO: dict[tuple[str, str], object] = {}
+
+
+def cached(kind: str, raw: str, parse: Callable[[str], T]) -> T:
+    """
+    parse(raw), computed once per (kind, content) per process. Results are shared between
+    callers, so they must be treated as read-only.
+    """
+    key = (kind, hashlib.sha256(raw.encode("utf-8")).hexdigest())
+    hit = _MEMO.get(key)
+    if hit is None:
+        if len(_MEMO) >= MAX_ENTRIES:
+            _MEMO.clear()
+        hit = _MEMO[key] = parse(raw)
+    return hit  # type: ignore[return-value]
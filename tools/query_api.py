@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# tools/query_api.py
+from __future__ import annotations
+
+import argparse
+import bisect
+import gzip
+import hashlib
+import json
+import re
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from build_timeline import build_events
+from dossier_model import Claim
+
+
+DEFAULT_SITE = Path("dossier/site")
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+GZIP_MIN_BYTES = 1024
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _words(text: str) -> set[str]:
+    return set(WORD_RE.findall(text.lower()))
+
+
+class QueryIndex:
+    """
+    Immutable in-memory indexes over one build of claims.json + toc.json.
+    Positions are indexes into self.claims, so every result list keeps document order.
+    """
+
+    def __init__(self, claims: list[dict], toc: list[dict], version: str) -> None:
+        self.claims = claims
+        self.toc = toc
+        self.version = version
+
+        self.by_id: dict[str, int] = {}
+        self.by_tag: dict[str, set[int]] = {}
+        self.by_section: dict[str, set[int]] = {}
+        self.by_word: dict[str, set[int]] = {}
+        self.dated: list[tuple[str, int]] = []  # (ISO date, position), sorted for range scans
+
+        for pos, c in enumerate(claims):
+            self.by_id[c["id"]] = pos
+            for t in c.get("tags") or []:
+                self.by_tag.setdefault(t.lower(), set()).add(pos)
+            self.by_section.setdefault(c.get("section_id", ""), set()).add(pos)
+            for w in _words(f"{c.get('title', '')}\n{c.get('text', '')}\n{c.get('note', '')}"):
+                self.by_word.setdefault(w, set()).add(pos)
+            if c.get("date"):
+                self.dated.append((c["date"], pos))
+        self.dated.sort()
+
+        self.sections = {s["id"]: s for s in toc}
+        self.events = [e.to_json() for e in build_events([Claim.from_json(c) for c in claims])]
+
+    @classmethod
+    def load(cls, site: Path) -> "QueryIndex":
+        claims_raw = (site / "claims.json").read_bytes()
+        toc_path = site / "toc.json"
+        toc_raw = toc_path.read_bytes() if toc_path.exists() else b"[]"
+        version = hashlib.sha256(claims_raw + b"\0" + toc_raw).hexdigest()[:16]
+        return cls(json.loads(claims_raw), json.loads(toc_raw), version)
+
+    def resolve_section(self, value: str) -> str | None:
+        """
+        Accept a section id ("08-trump-vs-architecture"), its id prefix ("08") or its number ("8").
+        """
+        if value in self.sections or value in self.by_section:
+            return value
+        for sid, s in self.sections.items():
+            if sid.startswith(f"{value}-"):
+                return sid
+            if value.isdigit() and str(s.get("number", "")).strip() == str(int(value)):
+                return sid
+        return None
+
+    def date_range(self, since: str = "", until: str = "") -> set[int]:
+        lo = bisect.bisect_left(self.dated, (since, -1)) if since else 0
+        # "\uffff" sorts after any date suffix, so until is inclusive and "2025-11" covers the month
+        hi = bisect.bisect_right(self.dated, (until + "\uffff", -1)) if until else len(self.dated)
+        return {pos for _d, pos in self.dated[lo:hi]}
+
+    def query(
+        self,
+        *,
+        tags: list[str] = (),
+        section: str = "",
+        since: str = "",
+        until: str = "",
+        text: str = "",
+    ) -> list[int]:
+        """
+        Positions of claims matching every given filter, in document order.
+        """
+        sets: list[set[int]] = []
+        for t in tags:
+            sets.append(self.by_tag.get(t.lower(), set()))
+        if section:
+            sid = self.resolve_section(section)
+            sets.append(self.by_section.get(sid, set()) if sid else set())
+        if since or until:
+            sets.append(self.date_range(since, until))
+        for w in _words(text):
+            sets.append(self.by_word.get(w, set()))
+
+        if not sets:
+            return list(range(len(self.claims)))
+        sets.sort(key=len)
+        hits = set(sets[0])
+        for s in sets[1:]:
+            hits &= s
+            if not hits:
+                break
+        return sorted(hits)
+
+
+def paginate(items: list, params: dict[str, list[str]]) -> dict:
+    limit = min(max(_int_param(params, "limit", DEFAULT_LIMIT), 1), MAX_LIMIT)
+    offset = max(_int_param(params, "offset", 0), 0)
+    page = items[offset : offset + limit]
+    nxt = offset + limit if offset + limit < len(items) else None
+    return {"total": len(items), "offset": offset, "limit": limit, "next_offset": nxt, "items": page}
+
+
+def _int_param(params: dict[str, list[str]], key: str, default: int) -> int:
+    try:
+        return int(params.get(key, [default])[0])
+    except ValueError:
+        raise BadRequest(f"{key} must be an integer")
+
+
+def _param(params: dict[str, list[str]], key: str) -> str:
+    return (params.get(key) or [""])[0].strip()
+
+
+def _tags(params: dict[str, list[str]]) -> list[str]:
+    return [t for v in params.get("tag", []) for t in v.split(",") if t.strip()]
+
+
+def route(index: QueryIndex, path: str, params: dict[str, list[str]]) -> object | None:
+    """
+    Resolve one GET to a JSON-serializable payload. None means 404.
+    """
+    parts = [p for p in path.split("/") if p]
+
+    if parts == ["version"]:
+        return {"version": index.version, "claims": len(index.claims), "sections": len(index.toc)}
+
+    if parts == ["claims"]:
+        hits = index.query(
+            tags=_tags(params),
+            section=_param(params, "section"),
+            since=_param(params, "since"),
+            until=_param(params, "until"),
+            text=_param(params, "q"),
+        )
+        return paginate([index.claims[p] for p in hits], params)
+
+    if len(parts) == 2 and parts[0] == "claims":
+        pos = index.by_id.get(parts[1])
+        return None if pos is None else index.claims[pos]
+
+    if parts == ["timeline"]:
+        since, until = _param(params, "since"), _param(params, "until")
+        tags = {t.lower() for t in _tags(params)}
+        events = [
+            e
+            for e in index.events
+            if (not since or e["date"] >= since)
+            and (not until or e["date"][: len(until)] <= until)
+            and tags <= {t.lower() for t in e.get("tags", [])}
+        ]
+        return paginate(events, params)
+
+    if parts == ["sections"]:
+        return paginate(index.toc, params)
+
+    if len(parts) == 2 and parts[0] == "sections":
+        sid = index.resolve_section(parts[1])
+        if sid is None:
+            return None
+        meta = index.sections.get(sid, {"id": sid})
+        return {**meta, "claim_ids": [index.claims[p]["id"] for p in sorted(index.by_section.get(sid, ()))]}
+
+    return None
+
+
+class QueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: tuple[str, int], site: Path) -> None:
+        super().__init__(addr, QueryHandler)
+        self.site = site
+        self.index = QueryIndex.load(site)
+        self._stamp = self._site_stamp()
+
+    def _site_stamp(self) -> tuple:
+        out = []
+        for name in ("claims.json", "toc.json"):
+            p = self.site / name
+            st = p.stat() if p.exists() else None
+            out.append((st.st_mtime_ns, st.st_size) if st else None)
+        return tuple(out)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Build a fresh index when the site files change and swap it in with one assignment;
+        in-flight requests keep the index they started with. A half-written build is
+        ignored and retried on the next poll.
+        """
+        stamp = self._site_stamp()
+        if stamp == self._stamp:
+            return False
+        try:
+            fresh = QueryIndex.load(self.site)
+        except (OSError, ValueError):
+            return False
+        self._stamp = stamp
+        if fresh.version == self.index.version:
+            return False
+        self.index = fresh
+        return True
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    server: QueryServer
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:
+        index = self.server.index  # one snapshot per request
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+
+        try:
+            payload = route(index, url.path, params)
+        except BadRequest as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)}, index.version)
+            return
+        if payload is None:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"not found: {url.path}"}, index.version)
+            return
+
+        body, gz = self._encode(payload)
+        # the gzip body is a different representation, so it gets its own validator
+        tag = hashlib.sha256(f"{index.version}\0{self.path}".encode("utf-8")).hexdigest()[:20]
+        etag = f'"{tag}-gz"' if gz else f'"{tag}"'
+        inm = self.headers.get("If-None-Match", "")
+        if etag in [t.strip() for t in inm.split(",")] or inm.strip() == "*":
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        self._send(HTTPStatus.OK, body, gz, index.version, etag)
+
+    def _encode(self, payload: object) -> tuple[bytes, bool]:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", "") and len(body) >= GZIP_MIN_BYTES:
+            return gzip.compress(body, compresslevel=6, mtime=0), True
+        return body, False
+
+    def _send_json(self, status: HTTPStatus, payload: object, version: str) -> None:
+        body, gz = self._encode(payload)
+        self._send(status, body, gz, version)
+
+    def _send(self, status: HTTPStatus, body: bytes, gz: bool, version: str, etag: str | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("X-Index-Version", version)
+        if gz:
+            self.send_header("Content-Encoding", "gzip")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def watch(server: QueryServer, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        if server.reload_if_changed():
+            print(f"Loaded index {server.index.version} ({len(server.index.claims)} claims)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Read-only query API over the built dossier site.")
+    parser.add_argument("site", type=Path, nargs="?", default=DEFAULT_SITE, help=f"Built site dir (default: {DEFAULT_SITE})")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8001, help="Port (default: 8001)")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between checks for a new build (default: 2)")
+    args = parser.parse_args()
+
+    server = QueryServer((args.host, args.port), args.site)
+    stop = threading.Event()
+    threading.Thread(target=watch, args=(server, args.interval, stop), daemon=True).start()
+
+    idx = server.index
+    print(f"Serving index {idx.version} ({len(idx.claims)} claims) at http://{args.host}:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# tools/serve.py
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from build_claims import (
+    apply_history,
+    attach_sources,
+    claims_pages_manifest,
+    encode_claims_ndjson,
+    extract_claims,
+    load_claim_history,
+    paginate_claims,
+    pick_doc_title,
+    render_claims_html,
+    render_claims_page,
+    section_meta,
+)
+from build_claims import parse_front_matter as parse_claims_front_matter
+from build_related import DEFAULT_K, related_graph
+from build_source import DOC_TITLE, part_entry, render_source
+from build_source_html import render_source_html, stripped_pieces
+from build_timeline import build_events, build_index, shard_events
+from build_timeline import render_html as render_timeline_html
+from claims_columnar import dumps_columnar, encode_columnar
+from dossier_config import DEFAULT_CONFIG, load_dossiers
+from dossier_model import Claim, Section, dumps_claims, dumps_claims_min
+from split_dossier import RELATED_FILE, attach_related, page_title_for, part_item, render_index, render_page
+
+RELOAD_SNIPPET = (
+    "<script>"
+    "(function(){var es=new EventSource('/__events');"
+    "es.addEventListener('reload',function(){location.reload();});})();"
+    "</script>"
+)
+
+JSON_TYPE = "application/json; charset=utf-8"
+HTML_TYPE = "text/html; charset=utf-8"
+NDJSON_TYPE = "application/x-ndjson; charset=utf-8"
+
+
+@dataclass
+class PartState:
+    path: Path
+    stat: tuple[int, int]  # (mtime_ns, size) used for cheap change polling
+    sha: str
+    raw: str
+    item: dict  # split_dossier.part_item(): order/id/meta/body
+    stripped: str  # item["clean"]: the body with claims stripped, for the section page
+    entry: dict | None  # build_source.part_entry(), None if excluded from source.md
+    claims_meta: Section  # build_claims.section_meta()
+
+
+def _load_part(p: Path, stat: tuple[int, int], raw: str, sha: str) -> PartState:
+    item = part_item(p.stem, raw)
+    meta, _body = parse_claims_front_matter(raw)
+    return PartState(
+        path=p,
+        stat=stat,
+        sha=sha,
+        raw=raw,
+        item=item,
+        stripped=item["clean"],
+        entry=part_entry(p, raw),
+        claims_meta=section_meta(p.stem, meta),
+    )
+
+
+class DossierModel:
+    """
+    Parsed parts kept in memory. refresh() re-parses only parts whose content changed;
+    derived artifacts are cached by the hash of the inputs they were rendered from.
+    """
+
+    def __init__(self, parts_dir: Path, title: str = DOC_TITLE, history: Path | None = None) -> None:
+        self.parts_dir = parts_dir
+        self.title = title
+        self.history = history or parts_dir.parent / ".cache" / "claim_history.json"
+        self.parts: dict[str, PartState] = {}
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._cache: dict[str, tuple[str, bytes, str]] = {}  # path -> (input hash, body, content type)
+        self._derived: dict[str, tuple[str, object]] = {}
+        self._terms: dict[str, dict] = {}  # build_related term counts, in memory only
+        self.refresh()
+
+    # -------- change detection --------
+    def refresh(self) -> list[str]:
+        """
+        Poll the parts dir. Returns names of parts added, changed or removed.
+        """
+        changed: list[str] = []
+        seen: set[str] = set()
+
+        for p in sorted(self.parts_dir.glob("*.md")):
+            if not p.is_file():
+                continue
+            st = p.stat()
+            stat = (st.st_mtime_ns, st.st_size)
+            seen.add(p.name)
+
+            cur = self.parts.get(p.name)
+            if cur and cur.stat == stat:
+                continue
+
+            raw = p.read_text(encoding="utf-8")
+            sha = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+            if cur and cur.sha == sha:
+                cur.stat = stat  # touched, not edited
+                continue
+
+            with self._lock:
+                self.parts[p.name] = _load_part(p, stat, raw, sha)
+            changed.append(p.name)
+
+        for name in [n for n in self.parts if n not in seen]:
+            with self._lock:
+                del self.parts[name]
+            changed.append(name)
+
+        if changed:
+            with self._lock:
+                self.generation += 1
+        return changed
+
+    # -------- derived model --------
+    def parts_hash(self) -> str:
+        h = hashlib.sha256()
+        for name in sorted(self.parts):
+            h.update(name.encode("utf-8") + b"\0" + self.parts[name].sha.encode("ascii"))
+        return h.hexdigest()
+
+    def _memo(self, key: str, input_hash: str, build: Callable[[], object]) -> object:
+        hit = self._derived.get(key)
+        if hit and hit[0] == input_hash:
+            return hit[1]
+        value = build()
+        self._derived[key] = (input_hash, value)
+        return value
+
+    def items(self) -> list[dict]:
+        """
+        part_item()s in page order, with related_auto set as split_dossier.py sets it.
+        """
+
+        def build() -> list[dict]:
+            items = sorted((ps.item for ps in self.parts.values()), key=lambda x: (x["order"], x["id"]))
+            attach_related(items, self.related()["sections"])
+            return items
+
+        return self._memo("items", self.parts_hash(), build)
+
+    def related(self) -> dict:
+        """
+        related.json exactly as build_related.py would write it.
+        """
+        return self._memo(
+            "related",
+            self.parts_hash(),
+            lambda: related_graph(
+                [(ps.raw, ps.item) for _name, ps in sorted(self.parts.items())],
+                self.ledger()[0],
+                self._terms,
+                DEFAULT_K,
+            )[0],
+        )
+
+    def source_text(self) -> str:
+        return self._memo(
+            "source",
+            self.parts_hash(),
+            lambda: render_source([ps.entry for ps in self.parts.values() if ps.entry]),
+        )
+
+    def ledger(self) -> tuple[list[dict], list[Claim], list[dict]]:
+        """
+        (claims.json records, claim models, sources.json entries) exactly as build_claims.py
+        would write them.
+        """
+
+        def build() -> tuple[list[dict], list[Claim], list[dict]]:
+            parts_index = {name: ps.claims_meta for name, ps in self.parts.items()}
+            ledger = extract_claims(self.source_text().splitlines(), parts_index)
+            apply_history(ledger, load_claim_history(self.history))
+            claims, sources = attach_sources(ledger)
+            return claims, ledger, sources
+
+        return self._memo("ledger", self.parts_hash(), build)
+
+    def timeline(self) -> tuple[dict[str, dict], dict]:
+        """
+        (monthly shards, index) exactly as build_timeline.py would write them.
+        """
+
+        def build() -> tuple[dict[str, dict], dict]:
+            _claims, ledger, sources = self.ledger()
+            shards = shard_events(build_events(ledger), {s["id"]: s for s in sources})
+            return shards, build_index(shards)
+
+        return self._memo("timeline", self.parts_hash(), build)
+
+    # -------- rendering --------
+    def routes(self) -> dict[str, tuple[str, Callable[[], tuple[bytes, str]]]]:
+        """
+        Map URL path -> (input hash, renderer). Section pages depend only on their
+        own part plus neighbours for prev/next links.
+        """
+
+        def js(obj: object) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+        all_hash = self.parts_hash()
+        items = self.items()
+        toc = [it["meta"] for it in items]
+        by_id = {ps.item["id"]: ps for ps in self.parts.values()}
+
+        def ndjson() -> tuple[bytes, dict]:
+            return self._memo("ndjson", all_hash, lambda: encode_claims_ndjson(self.ledger()[0]))
+
+        def source_title() -> str:
+            # claims.html and source.html take their title from source.md, as the CLI builds do
+            return pick_doc_title(self.source_text().splitlines())
+
+        out: dict[str, tuple[str, Callable[[], tuple[bytes, str]]]] = {
+            "/index.html": (all_hash, lambda: (render_index(self.title, toc).encode("utf-8"), HTML_TYPE)),
+            "/toc.json": (all_hash, lambda: (js(toc), JSON_TYPE)),
+            "/source.html": (
+                all_hash,
+                # per-part runs are memoized, so an edit re-strips only the part that changed
+                lambda: (
+                    render_source_html(source_title(), "".join(stripped_pieces(self.source_text())[0])).encode("utf-8"),
+                    HTML_TYPE,
+                ),
+            ),
+            "/claims.json": (all_hash, lambda: (dumps_claims(self.ledger()[1]).encode("utf-8"), JSON_TYPE)),
+            "/claims.min.json": (
+                all_hash,
+                lambda: (
+                    dumps_claims_min(self.ledger()[1]).encode("utf-8"),
+                    JSON_TYPE,
+                ),
+            ),
+            "/sources.json": (all_hash, lambda: (js(self.ledger()[2]), JSON_TYPE)),
+            "/claims.min.cols.json": (
+                all_hash,
+                lambda: (
+                    dumps_columnar(encode_columnar([c.to_min_json() for c in self.ledger()[1]])).encode("utf-8"),
+                    JSON_TYPE,
+                ),
+            ),
+            "/claims.ndjson": (all_hash, lambda: (ndjson()[0], NDJSON_TYPE)),
+            "/claims.ndjson.idx.json": (
+                all_hash,
+                lambda: (json.dumps(ndjson()[1], ensure_ascii=False, separators=(",", ":")).encode("utf-8"), JSON_TYPE),
+            ),
+            f"/{RELATED_FILE}": (all_hash, lambda: (js(self.related()), JSON_TYPE)),
+            "/claims.html": (
+                all_hash,
+                lambda: (render_claims_html(source_title(), self.ledger()[0]).encode("utf-8"), HTML_TYPE),
+            ),
+            "/timeline/index.json": (all_hash, lambda: (js(self.timeline()[1]), JSON_TYPE)),
+            "/timeline.html": (
+                all_hash,
+                lambda: (render_timeline_html(self.timeline()[1]).encode("utf-8"), HTML_TYPE),
+            ),
+        }
+
+        pages = self._memo("claims_page_list", all_hash, lambda: paginate_claims(self.ledger()[0]))
+        manifest = self._memo("claims_pages", all_hash, lambda: claims_pages_manifest(source_title(), pages))
+        out["/claims/pages.json"] = (
+            all_hash,
+            lambda: (json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), JSON_TYPE),
+        )
+        for pg in pages:
+            out["/" + pg["file"]] = (
+                manifest["sections"][pg["section_id"]]["hash"],
+                lambda pg=pg: (render_claims_page(source_title(), pg).encode("utf-8"), HTML_TYPE),
+            )
+
+        for month, shard in self.timeline()[0].items():
+            out[f"/timeline/{month}.json"] = (
+                all_hash,
+                lambda shard=shard: (
+                    json.dumps(shard, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+                    JSON_TYPE,
+                ),
+            )
+
+        for i, it in enumerate(items):
+            prev_url = items[i - 1]["meta"]["url"] if i > 0 else None
+            next_url = items[i + 1]["meta"]["url"] if i + 1 < len(items) else None
+            ps = by_id[it["id"]]
+            related = json.dumps(it["meta"].get("related_auto"), sort_keys=True)
+            key = f"{ps.sha}:{prev_url}:{next_url}:{related}"
+
+            def render(it: dict = it, ps: PartState = ps, prev_url=prev_url, next_url=next_url) -> tuple[bytes, str]:
+                html = render_page(self.title, page_title_for(it["meta"]), ps.stripped, it["meta"], prev_url, next_url)
+                return html.encode("utf-8"), HTML_TYPE
+
+            out["/" + it["meta"]["url"]] = (key, render)
+
+        return out
+
+    def render(self, path: str) -> tuple[bytes, str] | None:
+        if path in {"", "/"}:
+            path = "/index.html"
+        with self._lock:
+            route = self.routes().get(path)
+            if route is None:
+                return None
+            input_hash, renderer = route
+            hit = self._cache.get(path)
+            if hit and hit[0] == input_hash:
+                return hit[1], hit[2]
+            body, ctype = renderer()
+            self._cache[path] = (input_hash, body, ctype)
+            return body, ctype
+
+
+class PreviewServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: tuple[str, int], model: DossierModel) -> None:
+        super().__init__(addr, PreviewHandler)
+        self.model = model
+        self.changed = threading.Condition()
+
+    def notify_reload(self) -> None:
+        with self.changed:
+            self.changed.notify_all()
+
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    server: PreviewServer
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/__events":
+            self._events()
+            return
+
+        started = time.perf_counter()
+        res = self.server.model.render(path)
+        if res is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        body, ctype = res
+        if ctype == HTML_TYPE:
+            body = body.replace(b"</body>", RELOAD_SNIPPET.encode("ascii") + b"</body>", 1)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Server-Timing", f"render;dur={(time.perf_counter() - started) * 1000:.2f}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _events(self) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+        model = self.server.model
+        seen = model.generation
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while True:
+                with self.server.changed:
+                    self.server.changed.wait(timeout=15)
+                if model.generation != seen:
+                    seen = model.generation
+                    self.wfile.write(b"event: reload\ndata: " + str(seen).encode("ascii") + b"\n\n")
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+def watch(server: PreviewServer, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        try:
+            changed = server.model.refresh()
+        except Exception as e:  # a half-saved file should not kill the watcher
+            print(f"refresh failed: {type(e).__name__}: {e}")
+            continue
+        if changed:
+            print(f"Re-parsed {', '.join(changed)}")
+            server.notify_reload()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Preview the dossier from memory with live reload.")
+    parser.add_argument("--dossier", default=None, help="Dossier name from the config (default: the first one)")
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG, help=f"Dossier config (default: {DEFAULT_CONFIG})")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000)")
+    parser.add_argument("--interval", type=float, default=0.5, help="Poll interval in seconds (default: 0.5)")
+    args = parser.parse_args()
+
+    dossiers = load_dossiers(Path.cwd(), args.config)
+    picked = [d for d in dossiers if args.dossier in (None, d.name)]
+    if not picked:
+        parser.error(f"no dossier {args.dossier!r}; configured: {', '.join(d.name for d in dossiers)}")
+    d = picked[0]
+
+    model = DossierModel(Path(d.parts), d.title, Path(d.history))
+    server = PreviewServer((args.host, args.port), model)
+    stop = threading.Event()
+    threading.Thread(target=watch, args=(server, args.interval, stop), daemon=True).start()
+
+    print(f"Serving {d.name}: {len(model.parts)} part(s) at http://{args.host}:{server.server_port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
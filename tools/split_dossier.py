@@ -8,30 +8,36 @@ from dataclasses import dataclass
 from html import escape
 from pathlib import Path
 
+from build_source import DOC_TITLE
+from parse_cache import cached
+
 
 # -----------------------------
 # Single-file heading splitting
 # -----------------------------
-NUM_HEADING_RE = re.compile(r"^\s*(\d+)\.\s+(.+?)\s*$")
-MD_HEADING_RE = re.compile(r"^\s*(#{1,6})\s+(.+?)\s*$")
+NUM_HEADING_RE = re.compile(r"^\s*(\d+)\.\s+(\S(?:.*\S)?)\s*$")
+MD_HEADING_RE = re.compile(r"^\s*(#{1,6})\s+(\S(?:.*\S)?)\s*$")
 DIVIDER_RE = re.compile(r"^\s*(?:⸻+|[-_]{3,}|={3,})\s*$")
 
 # Claim blocks / claim lines (for extraction)
 CLAIM_BLOCK_START_RE = re.compile(r"^\s*(?:[-*]\s*)?\[(?i:claim)\]\s*$")
 CLAIM_BLOCK_END_RE = re.compile(r"^\s*\[/(?i:claim)\]\s*$")
 CLAIM_LINE_RE = re.compile(
-    r"^\s*(?:[-*]\s*)?(?:\[(?i:claim)\]\s*|(?i:claim)\s*:\s*).+?\s*$"
+    r"^\s*(?:[-*]\s*)?(?:\[(?i:claim)\]|(?i:claim)\s*:)."
 )
 
 # [C] markers + evidence blocks (for clean human pages)
-C_MARKER_RE = re.compile(r"\s*\[(?i:c)\]\s*")
+C_MARKER_RE = re.compile(r"(?:(?<!\s)\s*)?\[(?i:c)\]\s*")
 EVIDENCE_HEADER_RE = re.compile(
-    r"^\s*(?i:(evidence|links|sources|verification paths?|verify|citations))\s*:?\s*(?:\(.*\))?\s*$"
+    r"^\s*(?i:(evidence|links|sources|verification paths?|verify|citations))\s*(?::\s*)?(?:\(.*\)\s*)?$"
 )
 URL_ONLY_RE = re.compile(r"^\s*https?://\S+\s*$")
 BULLET_RE = re.compile(r"^\s*(?:[-*•]\s+|\d+\.\s+).+")
 INDENT_RE = re.compile(r"^\s{2,}\S+")
 
+# Written by tools/build_related.py; read back here so pages and toc.json carry it.
+RELATED_FILE = "related.json"
+
 
 @dataclass
 class Heading:
@@ -265,14 +271,14 @@ def parse_front_matter(text: str) -> tuple[dict, str]:
         if not line.strip():
             continue
 
-        m_item = re.match(r"^\s*-\s*(.+?)\s*$", line)
+        m_item = re.match(r"^\s*-\s*(.+)$", line)
         if m_item and cur_key:
             meta.setdefault(cur_key, [])
             if isinstance(meta[cur_key], list):
                 meta[cur_key].append(m_item.group(1))
             continue
 
-        m_kv = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*?)\s*$", line)
+        m_kv = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*)$", line)
         if m_kv:
             key = m_kv.group(1)
             val = m_kv.group(2)
@@ -287,10 +293,25 @@ def parse_front_matter(text: str) -> tuple[dict, str]:
 
 
 def wipe_output_dir(out: Path) -> None:
+    """
+    Remove the pages a previous split wrote (listed in its toc.json), plus index/toc.
+    Artifacts owned by other stages (claims, timeline, source.html, ...) are left alone,
+    so those stages can run concurrently with the split.
+    """
     if not out.exists():
         return
-    for p in out.glob("*"):
-        if p.is_file() and p.suffix in {".html", ".json"}:
+
+    toc = out / "toc.json"
+    stale = {"index.html", "toc.json"}
+    if toc.exists():
+        try:
+            stale.update(str(e.get("url", "")) for e in json.loads(toc.read_text(encoding="utf-8")))
+        except (ValueError, AttributeError):
+            pass
+
+    for name in stale:
+        p = out / name
+        if name and p.parent == out and p.is_file() and p.suffix in {".html", ".json"}:
             p.unlink()
 
 
@@ -383,6 +404,81 @@ def render_page(
     )
 
 
+def _parse_part(raw: str) -> tuple[dict, str, str]:
+    meta, body = parse_front_matter(raw)
+    return meta, body, strip_claims(body)
+
+
+def parse_part(raw: str) -> tuple[dict, str, str]:
+    """
+    (front matter, body, body with claims stripped) for one part file's text.
+    Memoized by content, so the split and chunks stages, and every dossier that shares
+    a part, strip it once per build worker. Callers must not mutate the meta dict.
+    """
+    return cached("split_dossier.parse_part", raw, _parse_part)
+
+
+def part_item(stem: str, raw: str) -> dict:
+    """
+    Parse one part file into {order, id, meta, body, clean}; meta is the normalized section
+    meta and clean is the body with claims stripped.
+    """
+    meta, body, clean = parse_part(raw)
+
+    sec_id = meta.get("id") or slugify(stem)
+    order = meta.get("order") or "999999"
+    title = meta.get("title") or stem
+    number = meta.get("number") or ""
+    level = int(meta.get("level") or 1)
+
+    url = f"{sec_id}.html"
+
+    meta_norm = {
+        "id": sec_id,
+        "order": order,
+        "number": number,
+        "level": level,
+        "title": title,
+        "keywords": meta.get("keywords", []),
+        "summary": meta.get("summary", []),
+        "related": meta.get("related", []),
+        "url": url,
+    }
+
+    return {"order": str(order), "id": str(sec_id), "meta": meta_norm, "body": body, "clean": clean}
+
+
+def page_title_for(meta: dict) -> str:
+    return f'{meta["number"]}. {meta["title"]}'.strip(". ").strip() if meta["number"] else meta["title"]
+
+
+def load_related(outdir: Path) -> dict[str, list[dict]]:
+    """
+    Section id -> computed neighbours from the related stage; empty if it has not run.
+    """
+    path = outdir / RELATED_FILE
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("sections", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def attach_related(items: list[dict], related: dict[str, list[dict]]) -> None:
+    """
+    Set meta["related_auto"] from the related stage's neighbours (no-op without them).
+    Computed neighbours sit next to the hand-written "related" list, never replace it.
+    """
+    if not related:
+        return
+    for it in items:
+        it["meta"]["related_auto"] = [
+            {"id": r["id"], "title": r["title"], "url": r["url"], "score": r["score"]}
+            for r in related.get(it["id"], [])
+        ]
+
+
 def build_from_parts(parts_dir: Path, outdir: Path, doc_title: str) -> None:
     outdir.mkdir(parents=True, exist_ok=True)
     wipe_output_dir(outdir)
@@ -391,44 +487,19 @@ def build_from_parts(parts_dir: Path, outdir: Path, doc_title: str) -> None:
     if not part_files:
         raise SystemExit(f"No parts found in {parts_dir}")
 
-    items: list[dict] = []
-    for p in part_files:
-        raw = p.read_text(encoding="utf-8")
-        meta, body = parse_front_matter(raw)
-
-        sec_id = meta.get("id") or slugify(p.stem)
-        order = meta.get("order") or "999999"
-        title = meta.get("title") or p.stem
-        number = meta.get("number") or ""
-        level = int(meta.get("level") or 1)
-
-        url = f"{sec_id}.html"
-
-        meta_norm = {
-            "id": sec_id,
-            "order": order,
-            "number": number,
-            "level": level,
-            "title": title,
-            "keywords": meta.get("keywords", []),
-            "summary": meta.get("summary", []),
-            "related": meta.get("related", []),
-            "url": url,
-        }
-
-        items.append({"order": str(order), "id": str(sec_id), "meta": meta_norm, "body": body})
-
+    items = [part_item(p.stem, p.read_text(encoding="utf-8")) for p in part_files]
     items.sort(key=lambda x: (x["order"], x["id"]))
 
+    attach_related(items, load_related(outdir))
+
     for i, it in enumerate(items):
         prev_url = items[i - 1]["meta"]["url"] if i > 0 else None
         next_url = items[i + 1]["meta"]["url"] if i + 1 < len(items) else None
 
         m = it["meta"]
-        page_title = f'{m["number"]}. {m["title"]}'.strip(". ").strip() if m["number"] else m["title"]
+        page_title = page_title_for(m)
 
-        clean_body = strip_claims(it["body"])
-        html = render_page(doc_title, page_title, clean_body, m, prev_url, next_url)
+        html = render_page(doc_title, page_title, it["clean"], m, prev_url, next_url)
         (outdir / m["url"]).write_text(html, encoding="utf-8")
 
     toc_entries = [it["meta"] for it in items]
@@ -500,12 +571,10 @@ def build_from_single_file(src_path: Path, outdir: Path) -> None:
     (outdir / "toc.json").write_text(json.dumps(entries, indent=2), encoding="utf-8")
 
 
-def main(src: str, outdir: str) -> None:
+def main(src: str, outdir: str, doc_title: str = DOC_TITLE) -> None:
     src_path = Path(src)
     out_path = Path(outdir)
 
-    doc_title = "Trump’s Second Term, Elite Factions, Legacy Media, and the Compliance Stack"
-
     if src_path.is_dir():
         build_from_parts(src_path, out_path, doc_title)
     else:
@@ -513,10 +582,10 @@ def main(src: str, outdir: str) -> None:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
+    if len(sys.argv) not in (3, 4):
         print("Usage:")
-        print("  python tools/split_dossier.py <parts_dir> <output_dir>")
+        print("  python tools/split_dossier.py <parts_dir> <output_dir> [<title>]")
         print("  python tools/split_dossier.py <source.md> <output_dir>")
         sys.exit(1)
 
-    main(sys.argv[1], sys.argv[2])
+    main(*sys.argv[1:])